@@ -8,6 +8,8 @@ __date__    = "23 November 2020"
 
 from aida.score import Score
 
+import numpy as np
+
 class AcrossDocumentsCoreferenceMetricScore(Score):
     """
     AIDA class for AIDA class for across documents coreference metric score.
@@ -19,17 +21,12 @@ class AcrossDocumentsCoreferenceMetricScore(Score):
             self.set(key, kwargs[key])
 
     def get_aggregate(self, field_name, aggregate_type):
-        def mean_score(scores):
-            sum_scores = 0
-            for score in scores:
-                sum_scores += score
-            return sum_scores/len(scores)
         def macro(scores, field_name):
-            score_values = []
-            for score in scores.values():
-                if int(score.get('num_rel_documents_counted')):
-                    score_values.append(score.get(field_name))
-            return mean_score(score_values)
+            # only those queries that have at least one relevant document counted contribute to the mean
+            elements = list(scores.values())
+            score_values = np.fromiter((s.get(field_name) for s in elements), dtype=np.float64, count=len(elements))
+            is_counted = np.fromiter((int(s.get('num_rel_documents_counted')) != 0 for s in elements), dtype=bool, count=len(elements))
+            return float(score_values[is_counted].sum())/int(is_counted.sum())
         retVal = self.get(field_name)
         if retVal:
             return retVal
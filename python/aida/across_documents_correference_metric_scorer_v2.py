@@ -14,7 +14,8 @@ from aida.container import Container
 from aida.score_printer import ScorePrinter
 from aida.scorer import Scorer
 from aida.task2_pool import Task2Pool
-from aida.utility import multisort, get_cost_matrix, trim_cv
+from aida.utility import get_cost_matrix, trim_cv
+from collections import defaultdict
 from munkres import Munkres
 
 from xmlrpc.client import MAXINT
@@ -125,7 +126,7 @@ class AcrossDocumentsCoreferenceMetricScorerV2(Scorer):
             return 0
 
         def record_categorized_response(categorized_responses, policy, category_name, response):
-            categorized_responses.get(policy).setdefault(category_name, list()).append(response)
+            categorized_responses[policy][category_name].append(response)
             if response.get('categorization') is None:
                 response.set('categorization', {'PRE_POLICY': set(), 'POST_POLICY': None})
             if policy == 'PRE_POLICY':
@@ -221,7 +222,7 @@ class AcrossDocumentsCoreferenceMetricScorerV2(Scorer):
             'clusters': set(),
             'equivalence_classes': self.get('equivalence_classes', query_id)
             }
-        categorized_responses = {'PRE_POLICY': {}, 'POST_POLICY': {}}
+        categorized_responses = {'PRE_POLICY': defaultdict(list), 'POST_POLICY': defaultdict(list)}
         categorize_responses(responses, assessments, selected_clusters, categorized_responses, ids)
 
         APs = {}
@@ -426,8 +427,6 @@ class AcrossDocumentsCoreferenceMetricScorerV2(Scorer):
                 scores.append(score)
 
         scores_printer = ScorePrinter(self.logger, self.printing_specs, aggregate_types=['ALL-Macro'])
-        for score in multisort(scores, (('entity_id', False),
-                                        ('query_id', False))):
-            scores_printer.add(score)
+        scores_printer.extend(sorted(scores, key=lambda s: (s.get('entity_id'), s.get('query_id'))))
         self.aggregate_scores(scores_printer, AcrossDocumentsCoreferenceMetricScore)
         self.scores = scores_printer
\ No newline at end of file
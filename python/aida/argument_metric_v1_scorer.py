@@ -14,6 +14,7 @@ from aida.score_printer import ScorePrinter
 from aida.scorer import Scorer
 from aida.argument_metric_score import ArgumentMetricScore
 from aida.utility import multisort
+from collections import defaultdict
 
 class ArgumentMetricScorerV1(Scorer):
     """
@@ -33,29 +34,31 @@ class ArgumentMetricScorerV1(Scorer):
     def __init__(self, logger, **kwargs):
         super().__init__(logger, **kwargs)
 
-    def align_trfs(self, document_id, gold_trfs, system_trfs):
+    def align_trfs(self, document_gold_to_system, gold_trfs, system_trfs):
+        # bucket system TRFs by role name so that each gold TRF is only compared against
+        # system TRFs that can pass the role name check in are_trfs_aligned
+        system_trfs_by_role_name = defaultdict(list)
+        for system_trf in system_trfs.values():
+            system_trfs_by_role_name[system_trf.get('role_name')].append(system_trf)
         for gold_trf in gold_trfs.values():
             if gold_trf.get('aligned'): continue
-            for system_trf in system_trfs.values():
+            for system_trf in system_trfs_by_role_name.get(gold_trf.get('role_name'), []):
                 if system_trf.get('aligned'): continue
-                if self.are_trfs_aligned(document_id, gold_trf, system_trf):
+                if self.are_trfs_aligned(document_gold_to_system, gold_trf, system_trf):
                     gold_trf.set('aligned', True)
                     gold_trf.set('aligned_to', system_trf)
                     system_trf.set('aligned', True)
                     system_trf.set('aligned_to', gold_trf)
 
-    def are_trfs_aligned(self, document_id, gold_trf, system_trf):
+    def are_trfs_aligned(self, document_gold_to_system, gold_trf, system_trf):
         if gold_trf.get('type') != system_trf.get('type'): return False
         if gold_trf.get('role_name') != system_trf.get('role_name'): return False
 
-        gold_to_system_alignment = self.get('cluster_alignment').get('gold_to_system').get(document_id)
-        system_cluster_id_gold_filler_aligned_to = gold_to_system_alignment.get(gold_trf.get('filler_cluster_id')).get('aligned_to')
-        if system_cluster_id_gold_filler_aligned_to != system_trf.get('filler_cluster_id'): return False
+        gold_filler_aligned_to = document_gold_to_system.get(gold_trf.get('filler_cluster_id')).get('aligned_to')
+        if gold_filler_aligned_to != system_trf.get('filler_cluster_id'): return False
 
-        if self.is_predicate_justification_correct(system_trf.get('predicate_justifications'),
-                                                   gold_trf.get('predicate_justifications')):
-            return True
-        return False
+        return self.is_predicate_justification_correct(system_trf.get('predicate_justifications'),
+                                                       gold_trf.get('predicate_justifications'))
 
     def is_predicate_justification_correct(self, system_predicate_justifications, gold_predicate_justifications):
         return True
@@ -67,27 +70,25 @@ class ArgumentMetricScorerV1(Scorer):
 
     def get_document_types_role_fillers(self, system_or_gold, document_id):
         logger = self.get('logger')
-        types_role_fillers = Container(logger)
+        # keyed by (types, role_name, filler_cluster_id) tuples, which Container.get cannot look up
+        types_role_fillers = {}
         responses = self.get('{}_responses'.format(system_or_gold))
         if document_id in responses.get('document_frames'):
             for frame in responses.get('document_frames').get(document_id).values():
                 metatype = frame.get('metatype')
-                role_fillers = frame.get('role_fillers')
-                for role_name in role_fillers:
-                    for filler_cluster_id in role_fillers.get(role_name):
-                        for predicate_justification in role_fillers.get(role_name).get(filler_cluster_id):
-                            types = self.get('types', frame)
-                            types_role_filler_string = '{types}_{role_name}:{filler_cluster_id}'.format(types=types,
-                                                                                                       role_name=role_name,
-                                                                                                       filler_cluster_id=filler_cluster_id)
-                            types_role_filler = types_role_fillers.get(types_role_filler_string, default=Object(logger))
-                            types_role_filler.set('metatype', metatype)
-                            types_role_filler.set('types', types)
-                            types_role_filler.set('role_name', role_name)
-                            types_role_filler.set('filler_cluster_id', filler_cluster_id)
-                            if types_role_filler.get('predicate_justifications') is None:
-                                types_role_filler.set('predicate_justifications', Container(logger))
-                            types_role_filler.get('predicate_justifications').add(predicate_justification)
+                types = self.get('types', frame)
+                for role_name, filler_cluster_id, predicate_justification in frame.get('role_filler_tuples'):
+                    types_role_filler_key = (types, role_name, filler_cluster_id)
+                    types_role_filler = types_role_fillers.get(types_role_filler_key)
+                    if types_role_filler is None:
+                        types_role_filler = types_role_fillers[types_role_filler_key] = Object(logger)
+                    types_role_filler.set('metatype', metatype)
+                    types_role_filler.set('types', types)
+                    types_role_filler.set('role_name', role_name)
+                    types_role_filler.set('filler_cluster_id', filler_cluster_id)
+                    if types_role_filler.get('predicate_justifications') is None:
+                        types_role_filler.set('predicate_justifications', Container(logger))
+                    types_role_filler.get('predicate_justifications').add(predicate_justification)
         return types_role_fillers
 
     def get_score(self, gold_trfs, system_trfs, metatypes):
@@ -123,19 +124,23 @@ class ArgumentMetricScorerV1(Scorer):
             'Relation': ['Relation']
             }
         scores = []
+        # resolve the containers used for every document once
+        gold_to_system = self.get('cluster_alignment').get('gold_to_system')
+        documents = self.get('gold_responses').get('document_mappings').get('documents')
+        run_id = self.get('run_id')
         for document_id in self.get('core_documents'):
-            document = self.get('gold_responses').get('document_mappings').get('documents').get(document_id)
+            document = documents.get(document_id)
             # skip those core documents that do not have an entry in the parent-children table
             if document is None: continue
             language = document.get('language')
             gold_trfs = self.get('document_types_role_fillers', 'gold', document_id)
             system_trfs = self.get('document_types_role_fillers', 'system', document_id)
-            self.align_trfs(document_id, gold_trfs, system_trfs)
+            self.align_trfs(gold_to_system.get(document_id), gold_trfs, system_trfs)
             for metatype_key in metatypes:
                 num_gold_trf, num_system_trf, precision, recall, f1 = self.get('score', gold_trfs, system_trfs, metatypes[metatype_key])
                 if num_gold_trf + num_system_trf == 0: continue
                 score = ArgumentMetricScore(logger=self.logger,
-                                            run_id=self.get('run_id'),
+                                            run_id=run_id,
                                             document_id=document_id,
                                             language=language,
                                             metatype=metatype_key,
@@ -145,8 +150,7 @@ class ArgumentMetricScorerV1(Scorer):
                 scores.append(score)
 
         scores_printer = ScorePrinter(self.logger, self.printing_specs)
-        for score in multisort(scores, (('document_id', False),
-                                        ('metatype_sortkey', False))):
-            scores_printer.add(score)
+        scores_printer.extend(multisort(scores, (('document_id', False),
+                                                 ('metatype_sortkey', False))))
         self.aggregate_scores(scores_printer, ArgumentMetricScore)
         self.scores = scores_printer
\ No newline at end of file
@@ -18,6 +18,9 @@ from aida.utility import multisort, get_cost_matrix
 from munkres import Munkres
 from tqdm import tqdm
 
+# memo of role names trimmed to their first two '_'-separated parts, shared across scorer instances
+trimmed_rolenames = {}
+
 class ArgumentMetricScorerV3(Scorer):
     """
     AIDA class for Argument Extraction evaluation metric scorer.
@@ -129,16 +132,11 @@ class ArgumentMetricScorerV3(Scorer):
 
     def get_RolesPrecision(self, document_id, gold_trf, system_trf):
         def trim(rolename):
-            parts = rolename.split('_')
-            num_parts = 2
-            selected_parts = list()
-            for part in parts:
-                if num_parts:
-                    selected_parts.append(part)
-                else:
-                    break
-                num_parts -= 1
-            return '_'.join(selected_parts)
+            trimmed_rolename = trimmed_rolenames.get(rolename)
+            if trimmed_rolename is None:
+                trimmed_rolename = '_'.join(rolename.split('_')[:2])
+                trimmed_rolenames[rolename] = trimmed_rolename
+            return trimmed_rolename
         trfs = {'gold': gold_trf, 'system': system_trf}
         trimmed_roles = {}
         for system_or_gold in trfs:
@@ -8,6 +8,7 @@ __version__ = "0.0.0.1"
 __date__    = "2 January 2020"
 
 from aida.object import Object
+from itertools import count
 
 class Container(Object):
     """
@@ -29,6 +30,12 @@ class Container(Object):
         super().__init__(logger)
         self.store = {}
 
+    def __contains__(self, key):
+        """
+        Returns True if key is found in the store, False otherwise.
+        """
+        return key in self.store
+
     def __iter__(self):
         """
         Returns the iterator over the store.
@@ -89,6 +96,13 @@ class Container(Object):
         else:
             self.store[key] = value
 
+    def extend(self, values):
+        """
+        Adds all the values to the store, in order, using the length of the store
+        as the key of the first value and consecutive integers thereafter.
+        """
+        self.store.update(zip(count(len(self.store)), values))
+
     def add_member(self, member):
         """
         Add a member to the container using the member.get('ID') as the key corresponding
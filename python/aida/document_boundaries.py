@@ -8,6 +8,8 @@ __version__ = "0.0.0.1"
 __date__    = "15 January 2020"
 
 from aida.container import Container
+from aida.document_boundary import DocumentBoundary
+from aida.utility import get_cache_key, load_from_cache, save_to_cache
 
 import re
 
@@ -24,14 +26,25 @@ class DocumentBoundaries(Container):
     corresponding load() method.
     """
 
-    def __init__(self, logger, filename):
+    def __init__(self, logger, filename, use_cache=False):
         """
         Initializes this instance, and sets the logger and filename for newly created instance.
+
+        If use_cache is True, the boundaries are read from the cache written by an earlier
+        run, if the file has not changed since, and the cache is written otherwise.
         """
         super().__init__(logger)
         self.filename = filename
-        # the implementation of load needs to come from the derived classes.
-        self.load()
+        file_key = get_cache_key(filename) if use_cache else None
+        boundaries = load_from_cache(filename, file_key) if use_cache else None
+        if boundaries is None:
+            # the implementation of load needs to come from the derived classes.
+            self.load()
+            if use_cache:
+                save_to_cache(filename, file_key, {key: (boundary.start_x, boundary.start_y, boundary.end_x, boundary.end_y) for key, boundary in self.store.items()})
+        else:
+            for key, coordinates in boundaries.items():
+                self.add(key=key, value=DocumentBoundary(logger, *coordinates))
         
     def get_BOUNDARY(self, span_string):
         """
@@ -26,10 +26,24 @@ class DocumentBoundary(Span):
         Initialize the DocumentBoundary object.
         """
         super().__init__(logger, start_x, start_y, end_x, end_y)
+        self.bounds_key = None
+        self.bounds = None
+
+    def get_bounds(self):
+        """
+        Return the tuple (min_x, min_y, max_x, max_y) of the boundary as floats.
+
+        The conversion is repeated only if the coordinates changed since the last call,
+        as the same boundary is looked up for every span inside the document element.
+        """
+        bounds_key = (self.start_x, self.start_y, self.end_x, self.end_y)
+        if bounds_key != self.bounds_key:
+            self.bounds = tuple(map(float, bounds_key))
+            self.bounds_key = bounds_key
+        return self.bounds
 
     def get_corrected_span(self, span):
-        min_x, min_y, max_x, max_y = map(lambda arg:float(self.get(arg)),
-                             ['start_x', 'start_y', 'end_x', 'end_y'])
+        min_x, min_y, max_x, max_y = self.get('bounds')
         sx, sy, ex, ey = map(lambda arg:float(span.get(arg)),
                              ['start_x', 'start_y', 'end_x', 'end_y'])
         # if the span is (0,0)-(0,0) return document boundary
@@ -74,8 +88,7 @@ class DocumentBoundary(Span):
                 raise Exception('{} is not of a form (start_x,start_y)-(end_x,end_y)'.format(span))
         
         if isinstance(span, Span):
-            min_x, min_y, max_x, max_y = map(lambda arg:float(self.get(arg)),
-                                 ['start_x', 'start_y', 'end_x', 'end_y'])
+            min_x, min_y, max_x, max_y = self.get('bounds')
             sx, sy, ex, ey = map(lambda arg:float(span.get(arg)),
                                  ['start_x', 'start_y', 'end_x', 'end_y'])
             is_valid = False
@@ -13,6 +13,8 @@ from aida.file_handler import FileHandler
 from aida.document import Document
 from aida.container import Container
 from aida.document_element import DocumentElement
+from aida.file_header import FileHeader
+from aida.utility import get_cache_key, load_from_cache, save_to_cache
 
 nested_dict = lambda: defaultdict(nested_dict)
 
@@ -21,7 +23,7 @@ class DocumentMappings(Object):
     The class for storing mappings between Document and DocumentElement.
     """
 
-    def __init__(self, logger, filename, encodings, core_documents=None):
+    def __init__(self, logger, filename, encodings, core_documents=None, use_cache=False):
         """
         Initialize the mapping between Document and DocumentElement.
 
@@ -32,6 +34,8 @@ class DocumentMappings(Object):
                 the parent-children file containing mapping between documents and document-elements.
             encodings (aida.Encodings)
             core_documents (aida.CoreDocuments)
+            use_cache (bool):
+                whether the parsed parent-children file is read from, or saved to, a cache in the user's cache directory.
         """
         self.logger = logger
         self.filename = filename
@@ -40,23 +44,35 @@ class DocumentMappings(Object):
         self.documents = Container(logger)
         self.document_elements = Container(logger)
         self.encodings = encodings
+        self.use_cache = use_cache
         self.load_data()
     
     def load_data(self):
         """
         Loads the data from the parent-children file into the DocumentMappings object.
         """
-        mappings = nested_dict()
-        fh = FileHandler(self.logger, self.filename)
-        self.fileheader = fh.get('header')
-        for entry in fh:
-            doceid = entry.get('doceid')
-            docid = entry.get('docid')
-            detype = entry.get('detype')
-            delang = entry.get('lang_manual')
-            mappings[doceid]['docids'][docid] = 1
-            mappings[doceid]['detype'] = detype
-            mappings[doceid]['delang'] = delang.upper()
+        file_key = get_cache_key(self.filename) if self.use_cache else None
+        cached = load_from_cache(self.filename, file_key) if self.use_cache else None
+        if cached is None:
+            mappings = nested_dict()
+            fh = FileHandler(self.logger, self.filename)
+            self.fileheader = fh.get('header')
+            for entry in fh:
+                doceid = entry.get('doceid')
+                docid = entry.get('docid')
+                detype = entry.get('detype')
+                delang = entry.get('lang_manual')
+                mappings[doceid]['docids'][docid] = 1
+                mappings[doceid]['detype'] = detype
+                mappings[doceid]['delang'] = delang.upper()
+            if self.use_cache and self.fileheader is not None:
+                # the nested defaultdicts are saved as plain dictionaries
+                save_to_cache(self.filename, file_key, (self.fileheader.get('line'),
+                                                        {doceid: {'docids': dict(mapping['docids']), 'detype': mapping['detype'], 'delang': mapping['delang']}
+                                                         for doceid, mapping in mappings.items()}))
+        else:
+            header_line, mappings = cached
+            self.fileheader = FileHeader(self.logger, header_line)
         for doceid in mappings:
             # TODO: next if doceid is n/a?
             delang = mappings[doceid]['delang']
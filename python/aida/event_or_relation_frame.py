@@ -18,6 +18,7 @@ class EventOrRelationFrame(Object):
         self.ID = ID
         self.metatype = None
         self.role_fillers = {}
+        self.role_filler_tuples = None
         self.where = where
 
     def get_number_of_fillers(self):
@@ -26,6 +27,18 @@ class EventOrRelationFrame(Object):
             number_of_fillers += len(self.get('role_fillers').get(rolename))
         return number_of_fillers
 
+    def get_role_filler_tuples(self):
+        """
+        Returns the role fillers flattened into a list of (role_name, filler_cluster_id, filler)
+        tuples. The list is built once and reused until the frame is updated.
+        """
+        if self.role_filler_tuples is None:
+            self.role_filler_tuples = [(role_name, filler_cluster_id, filler)
+                                       for role_name, fillers in self.get('role_fillers').items()
+                                       for filler_cluster_id, filler_list in fillers.items()
+                                       for filler in filler_list]
+        return self.role_filler_tuples
+
     def is_alignable_relation(self):
         """
         Event or relation frame is alignable if and only if it is both
@@ -58,4 +71,5 @@ class EventOrRelationFrame(Object):
         if filler_cluster_id not in self.get('role_fillers')[predicate]:
             self.get('role_fillers')[predicate][filler_cluster_id] = []
         self.get('role_fillers')[predicate][filler_cluster_id].append(filler)
+        self.role_filler_tuples = None
         self.set('types', self.get('cluster').get('types'))
\ No newline at end of file
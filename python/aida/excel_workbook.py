@@ -41,16 +41,27 @@ class Worksheet(Object):
         self.load_entries()
 
     def load_entries(self):
-        for i, row in self.get('data_frame').iterrows():
-            where = {'filename': ':'.join([self.get('filename'),
-                                           self.get('sheet_name')]),
+        # read whole rows as tuples instead of building a Series per row
+        data_frame = self.get('data_frame')
+        # iterrows gave every value of a row the dtype common to all columns (e.g. ints became
+        # floats when all columns were numeric), so the frame is cast to it to keep those values
+        common_dtype = data_frame.values.dtype
+        if common_dtype != object:
+            data_frame = data_frame.astype(common_dtype)
+        columns = [column.strip() for column in data_frame.columns]
+        filename = ':'.join([self.get('filename'), self.get('sheet_name')])
+        logger = self.get('logger')
+        header = self.get('header')
+        entries = self.get('entries')
+        for i, row in zip(data_frame.index, data_frame.itertuples(index=False, name=None)):
+            where = {'filename': filename,
                      'lineno': i+1
                      }
-            entry = WorksheetEntry(self.get('logger'), where)
-            entry.set('header', self.get('header'))
-            for j, column in row.items():
-                entry.set(j.strip(), column)
-            self.get('entries').append(entry)
+            entry = WorksheetEntry(logger, where)
+            entry.set('header', header)
+            for j, column in zip(columns, row):
+                entry.set(j, column)
+            entries.append(entry)
 
     def __iter__(self):
         return iter(self.get('entries'))
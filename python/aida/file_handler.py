@@ -45,18 +45,23 @@ class FileHandler(Object):
         """
         Load the file.
         """
-        with open(self.get('filename'), encoding=self.get('encoding')) as file:
+        logger = self.get('logger')
+        filename = self.get('filename')
+        append = self.get('entries').append
+        header = self.get('header')
+        columns = header.get('columns') if header is not None else None
+        with open(filename, encoding=self.get('encoding')) as file:
             for lineno, line in enumerate(file, start=1):
-                if self.get('header') is None:
-                    self.header = FileHeader(self.get('logger'), line.rstrip())
+                if header is None:
+                    header = self.header = FileHeader(logger, line.rstrip())
+                    columns = header.get('columns')
                 else:
-                    where = {'filename': self.get('filename'), 'lineno': lineno}
-                    entry = Entry(self.get('logger'), self.get('header').get('columns'),
-                                   line.rstrip('\r\n').split('\t', len(self.get('header').get('columns'))-1), where)
+                    where = {'filename': filename, 'lineno': lineno}
+                    entry = Entry(logger, columns, line.rstrip('\r\n').split('\t', len(columns)-1), where)
                     entry.set('where', where)
-                    entry.set('header', self.get('header'))
+                    entry.set('header', header)
                     entry.set('line', line)
-                    self.get('entries').append(entry)
+                    append(entry)
     
     def __iter__(self):
         """
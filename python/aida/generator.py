@@ -13,6 +13,7 @@ from aida.object import Object
 from aida.utility import get_kb_claim_id_from_filename, get_kb_document_id_from_filename, spanstring_to_object, trim
 
 import os
+import sys
 
 class Generator(Object):
     """
@@ -86,14 +87,15 @@ class Generator(Object):
         claim_condition = os.path.basename(os.path.dirname(os.path.dirname(os.path.dirname(filename))))
         if entry.get('schema').get('name') in ['AIDA_PHASE3_TASK3_CONDITION5_RANKING_RESPONSE', 'AIDA_PHASE3_TASK3_CONDITION67_RANKING_RESPONSE']:
             claim_condition = os.path.basename(os.path.dirname(os.path.dirname(filename)))
-        entry.set('claim_condition', claim_condition)
+        # interned so that comparisons against condition names shared across entries are cheap
+        entry.set('claim_condition', sys.intern(claim_condition))
 
     def generate_claim_query_topic_or_claim_frame_id(self, responses, entry):
         filename = entry.get('filename')
         claim_query_topic_or_claim_frame_id = os.path.basename(os.path.dirname(os.path.dirname(filename)))
         if entry.get('schema').get('name') in ['AIDA_PHASE3_TASK3_CONDITION5_RANKING_RESPONSE', 'AIDA_PHASE3_TASK3_CONDITION67_RANKING_RESPONSE']:
             claim_query_topic_or_claim_frame_id = os.path.basename(os.path.dirname(filename))
-        entry.set('claim_query_topic_or_claim_frame_id', claim_query_topic_or_claim_frame_id)
+        entry.set('claim_query_topic_or_claim_frame_id', sys.intern(claim_query_topic_or_claim_frame_id))
 
     def generate_document_id(self, responses, entry):
         document_id = None
@@ -19,12 +19,12 @@ class ImageBoundaries(DocumentBoundaries):
     boundaries, and providing methods to provide access to these document boundaries.
     """
 
-    def __init__(self, logger, filename):
+    def __init__(self, logger, filename, use_cache=False):
         """
         Initialize the ImageBoundaries object by calling the constructor of
         the parent DocumentBoundaries, passing it the logger and the filename.
         """
-        super().__init__(logger, filename)
+        super().__init__(logger, filename, use_cache=use_cache)
     
     def load(self):
         """
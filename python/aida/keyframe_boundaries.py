@@ -19,12 +19,12 @@ class KeyFrameBoundaries(DocumentBoundaries):
     boundaries.
     """
 
-    def __init__(self, logger, filename):
+    def __init__(self, logger, filename, use_cache=False):
         """
         Initialize the KeyFrameBoundaries object by calling the constructor of
         the parent DocumentBoundaries, passing it the logger and the filename.
         """
-        super().__init__(logger, filename)
+        super().__init__(logger, filename, use_cache=use_cache)
     
     def load(self):
         """
@@ -9,6 +9,7 @@ __date__    = "24 December 2019"
 import logging
 import os
 import sys
+import threading
 import traceback
 
 class Logger:
@@ -51,6 +52,7 @@ class Logger:
                     NOTSET = 0                
         """
         self.recorded = {}
+        self.lock = threading.Lock()
         self.log_filename = log_filename
         self.event_specs_filename = event_specs_filename
         self.path_name = os.getcwd()
@@ -63,6 +65,48 @@ class Logger:
         self.record_program_invokation()
         self.load_event_specs()
         
+    def __getstate__(self):
+        """
+        Returns the state to be pickled, e.g. when a scorer holding the logger is returned
+        from a worker process, leaving out the lock which cannot be pickled.
+        """
+        state = self.__dict__.copy()
+        del state['lock']
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the pickled state, with a new lock.
+        """
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def collect_events(self):
+        """
+        Collect the events recorded from now on in the returned list instead of writing them to
+        the log, e.g. in a worker process which returns them to the main process to be recorded
+        there, in order, with record_events.
+
+        The arguments of the events, other than the where dictionary, are converted to strings
+        so that the events can be pickled. A critical event, or one of unknown type, is written
+        along with the events collected before it, so that the process stops as it would have.
+        """
+        events = []
+        def record_event(event_code, *args, classname=None):
+            args = tuple(arg if arg is None or isinstance(arg, (dict, int, str)) else arg.__str__() for arg in args)
+            events.append((event_code, args, classname))
+            event_type = self.event_specs.get(event_code, {}).get('type', 'CRITICAL').upper()
+            if event_type not in ['DEBUG', 'ERROR', 'INFO', 'WARNING']:
+                with self.lock:
+                    for event in events:
+                        self.write_event(*event)
+        def record_events(batch):
+            for event_code, args, classname in batch:
+                record_event(event_code, *args, classname=classname)
+        self.record_event = record_event
+        self.record_events = record_events
+        return events
+
     def configure_logger(self):
         """
         Set the output file of the logger, the debug level, format of log output, and
@@ -98,16 +142,29 @@ class Logger:
         """
         return (self.num_warnings, self.num_errors)
 
+    def is_enabled_for(self, event_code):
+        """
+        Returns True if the event would be written to the log at the current debug level.
+
+        Unknown events and events of unknown type are reported as enabled so that
+        record_event gets to flag them.
+        """
+        if event_code not in self.event_specs:
+            return True
+        level = logging.getLevelName(self.event_specs[event_code]['type'].upper())
+        if not isinstance(level, int) or level >= logging.CRITICAL:
+            return True
+        return self.logger_object.isEnabledFor(level)
+
     def load_event_specs(self):
         """
         Load specifications of events that the logger supports.
         """
         with open(self.event_specs_filename, 'r') as event_specs_file:
-            lines = event_specs_file.readlines()
-        header = lines[0].strip().split(None, 2)
-        for line in lines[1:]:
-            line_dict = dict(zip(header, line.strip().split(None, 2)))
-            self.event_specs[line_dict['code']] = line_dict
+            header = next(event_specs_file).strip().split(None, 2)
+            for line in event_specs_file:
+                line_dict = dict(zip(header, line.strip().split(None, 2)))
+                self.event_specs[line_dict['code']] = line_dict
 
     def record_event(self, event_code, *args, classname=None):
         """
@@ -132,6 +189,28 @@ class Logger:
         MESSAGE is the message written to the log file. It has zero or more arguments to be filled 
         by ARG1, ARG2, ...
         """
+        # events may be recorded from several threads while files are loaded concurrently
+        with self.lock:
+            self.write_event(event_code, args, classname)
+
+    def record_events(self, events):
+        """
+        Record several events, in order, taking the lock once for all of them.
+
+        Arguments:
+            events (iterable):
+                the events, each given as a tuple of the event code, the tuple of arguments
+                (with WHERE as its last element, if any), and the classname, as would be
+                passed to record_event.
+        """
+        with self.lock:
+            for event_code, args, classname in events:
+                self.write_event(event_code, args, classname)
+
+    def write_event(self, event_code, args, classname):
+        """
+        Write the event to the log unless it was recorded before; the caller holds the lock.
+        """
         argslst = []
         where = None
         if len(args):
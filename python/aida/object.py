@@ -51,11 +51,10 @@ class Object(object):
         Returns the method whose name matches the value stored in method_name,
         None otherwise.
         """
-        try:
-            method = getattr(self, method_name)
-            if not hasattr(method, "__call__"):
-                raise AttributeError()
-        except AttributeError:
+        # a default is passed to getattr rather than catching AttributeError, as most lookups,
+        # e.g. those for the columns of an entry, find no method
+        method = getattr(self, method_name, None)
+        if not callable(method):
             method = None
         return method
     
@@ -85,6 +84,18 @@ class Object(object):
         """
         self.get('logger').record_event(event_code, *args, classname=self.__class__.__name__)
 
+    def record_events(self, events):
+        """
+        Record several events in the log with a single call to the logger.
+
+        Arguments:
+            events (list):
+                the events, each given as a tuple of the event code followed by the
+                arguments that would be passed to record_event.
+        """
+        classname = self.__class__.__name__
+        self.get('logger').record_events([(event[0], event[1:], classname) for event in events])
+
     def set(self, key, value):
         """
         Sets the value of an attribute, of the current, whose name matches the value stored in key.
@@ -978,7 +978,7 @@ class ResponseSet(Container):
     Set of responses for AIDA.
     """
 
-    def __init__(self, logger, document_mappings, document_boundaries, path, runid, task='task1', queries=None):
+    def __init__(self, logger, document_mappings, document_boundaries, path, runid, task='task1', queries=None, rules=None):
         super().__init__(logger)
         self.claims = Container(logger)
         self.document_mappings = document_mappings
@@ -989,6 +989,8 @@ class ResponseSet(Container):
         self.document_clusters = Container(logger)
         self.document_frames = Container(logger)
         self.queries = queries
+        # if provided, only the validators named in rules are applied
+        self.rules = rules
         self.runid = runid
         self.path = path
         self.task = task
@@ -1085,6 +1087,7 @@ class ResponseSet(Container):
             file_container = Container(logger)
             file_container.set('header', fh.get('header'))
             self.add(key=filename, value=file_container)
+        rules = self.get('rules')
         for entry in fh:
             lineno = entry.get('lineno')
             entry.set('runid', self.get('runid'))
@@ -1110,7 +1113,7 @@ class ResponseSet(Container):
                     self.get('normalizer').normalize(self, normalizer_name, entry, attribute)
                 # validate value
                 validator_name = attribute.get('validate')
-                if validator_name:
+                if validator_name and (rules is None or validator_name in rules):
                     valid_attribute = self.get('validator').validate(self, validator_name, schema, entry, attribute)
                     if not valid_attribute: valid = False
             entry.set('valid', valid)
@@ -1284,49 +1287,40 @@ class ResponseSet(Container):
             self.record_event('UNDEFINED_METHOD', method_name)
         method(output_dir)
 
-    def write_valid_responses_task1(self, output_dir):
-        os.mkdir(output_dir)
-        for input_filename in self:
-            output_filename = input_filename.replace(self.get('path'), output_dir)
-            dirname = os.path.dirname(output_filename)
-            if not os.path.exists(dirname):
-                os.mkdir(dirname)
-            file_container = self.get(input_filename)
-            output_fh = open(output_filename, 'w')
-            output_fh.write('{}\n'.format(file_container.get('header').get('line')))
+    def iter_valid_responses(self, output_dir):
+        """
+        Generator over (output_filename, lines) for each response file, where lines is a
+        generator over the header (except for ranking files) and the valid entries of the
+        file in their original order, so that entries are checked as they are written.
+        """
+        path = self.get('path')
+        check_claims = self.get('task') == 'task3'
+        def get_lines(input_filename, file_container):
+            if not input_filename.endswith('.ranking.tsv'):
+                yield '{}\n'.format(file_container.get('header').get('line'))
             for linenum in sorted(file_container, key=int):
-                entry = self.get(input_filename).get(str(linenum))
+                entry = file_container.get(linenum)
                 if not entry.get('valid'): continue
-                output_fh.write(entry.__str__())
-            output_fh.close()
+                if check_claims and not entry.get('claim').get('valid'): continue
+                yield entry.__str__()
+        for input_filename in self:
+            yield input_filename.replace(path, output_dir), get_lines(input_filename, self.get(input_filename))
+
+    def write_valid_responses_task1(self, output_dir):
+        self.write_valid_responses_files(output_dir, None)
 
     def write_valid_responses_task2(self, output_dir):
-        os.mkdir(output_dir)
-        for input_filename in self:
-            output_filename = input_filename.replace(self.get('path'), output_dir)
-            file_container = self.get(input_filename)
-            output_fh = open(output_filename, 'w', encoding='utf-8')
-            output_fh.write('{}\n'.format(file_container.get('header').get('line')))
-            for linenum in sorted(file_container, key=int):
-                entry = self.get(input_filename).get(str(linenum))
-                if not entry.get('valid'): continue
-                output_fh.write(entry.__str__())
-            output_fh.close()
+        self.write_valid_responses_files(output_dir, 'utf-8')
 
     def write_valid_responses_task3(self, output_dir):
+        self.write_valid_responses_files(output_dir, 'utf-8')
+
+    def write_valid_responses_files(self, output_dir, encoding):
         os.mkdir(output_dir)
-        for input_filename in self:
-            output_filename = input_filename.replace(self.get('path'), output_dir)
-            dirname = os.path.dirname(output_filename)
-            if not os.path.exists(dirname):
-                os.makedirs(dirname, exist_ok=True)
-            file_container = self.get(input_filename)
-            output_fh = open(output_filename, 'w', encoding='utf-8')
-            if not input_filename.endswith('.ranking.tsv'):
-                output_fh.write('{}\n'.format(file_container.get('header').get('line')))
-            for linenum in sorted(file_container, key=int):
-                entry = self.get(input_filename).get(str(linenum))
-                if not entry.get('valid'): continue
-                if not entry.get('claim').get('valid'): continue
-                output_fh.write(entry.__str__())
-            output_fh.close()
+        valid_responses = list(self.iter_valid_responses(output_dir))
+        # create the directories in one pass, and write each file through a large buffer
+        for dirname in {os.path.dirname(output_filename) for output_filename, _ in valid_responses}:
+            os.makedirs(dirname, exist_ok=True)
+        for output_filename, lines in valid_responses:
+            with open(output_filename, 'w', encoding=encoding, buffering=1<<20) as output_fh:
+                output_fh.writelines(lines)
@@ -8,6 +8,9 @@ __date__    = "3 February 2020"
 
 from aida.object import Object
 
+import numpy as np
+import sys
+
 class Score(Object):
     """
     AIDA base class for query-specific derived score class.
@@ -15,12 +18,18 @@ class Score(Object):
     def __init__(self, logger):
         super().__init__(logger)
 
+    def intern(self, *keys):
+        """
+        Intern the string values of the given keys so that equal ids share a single object.
+        """
+        for key in keys:
+            value = self.get(key)
+            if isinstance(value, str):
+                self.set(key, sys.intern(value))
+
     def get_aggregate(self, field_name, aggregate_type):
         def mean_score(scores):
-            sum_scores = 0
-            for score in scores:
-                sum_scores += score
-            return sum_scores/len(scores)
+            return float(np.fromiter(scores, dtype=np.float64, count=len(scores)).sum())/len(scores)
         def micro(scores, field_name):
             return mean_score([s.get(field_name) for s in scores.values()])
         def macro(scores, field_name):
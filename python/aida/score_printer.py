@@ -32,6 +32,7 @@ class ScorePrinter(Container):
             self.record_event('DEFAULT_CRITICAL', 'separator is None')
         widths = self.get('widths')
         scores = list(self.values())
+        summary_scores = [score for score in scores if score.get('summary')]
         for score in scores:
             if score.get('summary'): continue
             elements_to_print = {}
@@ -44,17 +45,16 @@ class ScorePrinter(Container):
                 widths[field_name] = len(text) if len(text)>widths[field_name] else widths[field_name]
             self.get('lines').append(elements_to_print)
         for aggregate_type in self.get('aggregate_types'):
-            for score in scores:
-                if score.get('summary'):
-                    elements_to_print = {}
-                    for field in self.printing_specs:
-                        field_name = field.get('name')
-                        value = score.get('aggregate', field_name, aggregate_type)
-                        format_spec = field.get('mean_format') if score.get('summary') and field.get('mean_format') else field.get('format')
-                        text = '{0:{1}}'.format(value, 's' if value=='' else format_spec)
-                        elements_to_print[field_name] = text
-                        widths[field_name] = len(text) if len(text)>widths[field_name] else widths[field_name]
-                    self.get('lines').append(elements_to_print)
+            for score in summary_scores:
+                elements_to_print = {}
+                for field in self.printing_specs:
+                    field_name = field.get('name')
+                    value = score.get('aggregate', field_name, aggregate_type)
+                    format_spec = field.get('mean_format') if field.get('mean_format') else field.get('format')
+                    text = '{0:{1}}'.format(value, 's' if value=='' else format_spec)
+                    elements_to_print[field_name] = text
+                    widths[field_name] = len(text) if len(text)>widths[field_name] else widths[field_name]
+                self.get('lines').append(elements_to_print)
 
     def get_header_text(self):
         return self.get_line_text()
@@ -73,6 +73,12 @@ class ScorePrinter(Container):
             separator = ' ' if self.separators[self.get('separator')] is None else self.separators[self.get('separator')]
         return text
 
+    def print_scores(self, filename, separator):
+        self.set('separator', separator)
+        fh = open(filename, 'w')
+        fh.write(self.to_string())
+        fh.close()
+
     def to_string(self):
         self.prepare_lines()
         string = self.get_header_text()
@@ -11,6 +11,9 @@ from aida.object import Object
 from aida.container import Container
 from tqdm import tqdm
 
+# names of the attributes holding the gold and system responses
+responses_keys = {'gold': 'gold_responses', 'system': 'system_responses'}
+
 class Scorer(Object):
     """
     AIDA Scorer class.
@@ -24,49 +27,47 @@ class Scorer(Object):
 
     def get_cluster(self, system_or_gold, document_id, cluster_id):
         cluster = None
-        if document_id in self.get('{}_responses'.format(system_or_gold)).get('document_clusters'):
-            if cluster_id in self.get('{}_responses'.format(system_or_gold)).get('document_clusters').get(document_id):
-                cluster = self.get('{}_responses'.format(system_or_gold)).get('document_clusters').get(document_id).get(cluster_id)
+        document_clusters = self.get(responses_keys[system_or_gold]).get('document_clusters')
+        if document_id in document_clusters:
+            if cluster_id in document_clusters.get(document_id):
+                cluster = document_clusters.get(document_id).get(cluster_id)
         return cluster
 
     def get_frame(self, system_or_gold, document_id, cluster_id):
         frame = None
-        if document_id in self.get('{}_responses'.format(system_or_gold)).get('document_frames'):
-            if cluster_id in self.get('{}_responses'.format(system_or_gold)).get('document_frames').get(document_id):
-                frame = self.get('{}_responses'.format(system_or_gold)).get('document_frames').get(document_id).get(cluster_id)
+        document_frames = self.get(responses_keys[system_or_gold]).get('document_frames')
+        if document_id in document_frames:
+            if cluster_id in document_frames.get(document_id):
+                frame = document_frames.get(document_id).get(cluster_id)
         return frame
 
     def get_core_documents(self):
         return self.get('gold_responses').get('document_mappings').get('core_documents')
 
-    def get_languages(self, score, scores):
+    def get_languages(self, score, has_all_language):
         languages = [score.get('language')]
-        flag = True
-        for element in scores.values():
-            if element.get('language') == 'ALL':
-                flag = False
-        if flag:
+        if not has_all_language:
             languages.append('ALL')
         return languages
 
-    def get_metatypes(self, score, scores):
+    def get_metatypes(self, score, has_all_metatype):
         metatypes = [score.get('metatype')]
-        flag = True
-        for element in scores.values():
-            if element.get('metatype') == 'ALL':
-                flag = False
-        if flag:
+        if not has_all_metatype:
             metatypes.append('ALL')
         return metatypes
 
     def aggregate_scores(self, scores, score_class):
         aggregates = {}
-        for score in tqdm(scores.values(), desc='aggregating {} scores'.format(self.__class__.__name__)):
-            languages = self.get('languages', score, scores)
-            metatypes = self.get('metatypes', score, scores)
+        # determine once, rather than per score, whether the scores already include the 'ALL' groups
+        has_all_language = any(score.get('language') == 'ALL' for score in scores.values())
+        has_all_metatype = any(score.get('metatype') == 'ALL' for score in scores.values())
+        for score in tqdm(scores.values(), desc='aggregating {} scores'.format(self.__class__.__name__),
+                          mininterval=1.0, miniters=max(1, len(scores)//100)):
+            languages = self.get('languages', score, has_all_language)
+            metatypes = self.get('metatypes', score, has_all_metatype)
             for language in languages:
                 for metatype in metatypes:
-                    group_by = language + ',' + metatype
+                    group_by = (language, metatype)
                     if group_by not in aggregates:
                         aggregates[group_by] = score_class(self.get('logger'),
                                                            aggregate=True,
@@ -84,11 +85,7 @@ class Scorer(Object):
         language, metatype = k.get('language'), k.get('metatype')
         metatype = '_ALL' if metatype == 'ALL' else metatype
         language = '_ALL' if language == 'ALL' else language
-        return '{language}:{metatype}'.format(metatype=metatype, language=language)
+        return (language, metatype)
 
     def print_scores(self, filename, separator):
-        scores = self.get('scores')
-        scores.set('separator', separator)
-        fh = open(filename, 'w')
-        fh.write(scores.to_string())
-        fh.close()
\ No newline at end of file
+        self.get('scores').print_scores(filename, separator)
\ No newline at end of file
@@ -29,8 +29,53 @@ from aida.ndcg_v2_scorer import NDCGScorerV2
 from aida.object import Object
 from aida.temporal_metric_scorer import TemporalMetricScorer
 from aida.type_metric_v4_scorer import TypeMetricScorerV4
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from tqdm import tqdm
+import io
+import multiprocessing
 import os
+import pickle
+
+# arguments shared with the scorers run in worker processes
+worker_arguments = {}
+
+class ScoresPickler(pickle.Pickler):
+    """
+    Pickler for the scores computed in a worker process, which leaves out the logger.
+    """
+
+    def __init__(self, file, logger):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.logger = logger
+
+    def persistent_id(self, obj):
+        return 'logger' if obj is self.logger else None
+
+class ScoresUnpickler(pickle.Unpickler):
+    """
+    Unpickler for the scores pickled by ScoresPickler, which refer to the logger of the main process instead.
+    """
+
+    def __init__(self, file, logger):
+        super().__init__(file)
+        self.logger = logger
+
+    def persistent_load(self, pid):
+        if pid != 'logger':
+            raise pickle.UnpicklingError('unexpected persistent id: {}'.format(pid))
+        return self.logger
+
+def run_scorer(scorer_class):
+    """
+    Run the scorer in a worker process, and return its scores, pickled without the logger,
+    along with the events it recorded, which are recorded by the main process, in order.
+    """
+    logger = worker_arguments['logger']
+    events = logger.collect_events()
+    scores = scorer_class(**worker_arguments).get('scores')
+    pickled_scores = io.BytesIO()
+    ScoresPickler(pickled_scores, logger).dump(scores)
+    return pickled_scores.getvalue(), events
 
 class ScoresManager(Object):
     """
@@ -77,43 +122,48 @@ class ScoresManager(Object):
         self.score_responses()
 
     def score_responses(self):
+        logger = self.get('logger')
+        metrics = self.get('metrics')
+        scores = self.get('scores')
+        arguments = {'logger': logger,
+                     'run_id': self.get('run_id')}
         if self.get('task') == 'task1':
-            for metric in self.get('metrics'):
-                scorer = self.get('metrics')[metric](logger=self.get('logger'),
-                                                     run_id=self.get('run_id'),
-                                                     annotated_regions=self.get('annotated_regions'),
-                                                     gold_responses=self.get('gold_responses'),
-                                                     system_responses=self.get('system_responses'),
-                                                     cluster_alignment=self.get('cluster_alignment'),
-                                                     mention_alignment=self.get('mention_alignment'),
-                                                     cluster_self_similarities=self.get('cluster_self_similarities'),
-                                                     type_similarities=self.get('type_similarities'))
-                self.get('scores').add(key=metric, value=scorer)
+            argument_names = ['annotated_regions', 'gold_responses', 'system_responses', 'cluster_alignment',
+                              'mention_alignment', 'cluster_self_similarities', 'type_similarities']
         elif self.get('task') == 'task2':
-            for metric in self.get('metrics'):
-                scorer = self.get('metrics')[metric](logger=self.get('logger'),
-                                                     run_id=self.get('run_id'),
-                                                     cutoff=self.get('cutoff'),
-                                                     normalize=self.get('normalize'),
-                                                     weighted=self.get('weighted'),
-                                                     responses=self.get('responses'),
-                                                     assessments=self.get('assessments'),
-                                                     queries_to_score=self.get('queries_to_score'))
-                self.get('scores').add(key=metric, value=scorer)
+            argument_names = ['cutoff', 'normalize', 'weighted', 'responses', 'assessments', 'queries_to_score']
         elif self.get('task') == 'task3':
-            for metric in self.get('metrics'):
-                scorer = self.get('metrics')[metric](logger=self.get('logger'),
-                                                     run_id=self.get('run_id'),
-                                                     responses_dir=self.get('responses_dir'),
-                                                     assessments=self.get('assessments'),
-                                                     queries_to_score=self.get('queries_to_score'))
-                self.get('scores').add(key=metric, value=scorer)
+            argument_names = ['responses_dir', 'assessments', 'queries_to_score']
+        for argument_name in argument_names:
+            arguments[argument_name] = self.get(argument_name)
+        num_workers = self.get('num_workers')
+        if num_workers is not None and num_workers > 1:
+            # the arguments are inherited by the forked workers rather than pickled for each metric
+            worker_arguments.clear()
+            worker_arguments.update(arguments)
+            with ProcessPoolExecutor(max_workers=min(num_workers, len(metrics)),
+                                     mp_context=multiprocessing.get_context('fork')) as executor:
+                futures = {metric: executor.submit(run_scorer, metrics[metric]) for metric in metrics}
+                for metric in metrics:
+                    pickled_scores, events = futures[metric].result()
+                    logger.record_events(events)
+                    scores.add(key=metric, value=ScoresUnpickler(io.BytesIO(pickled_scores), logger).load())
+            worker_arguments.clear()
+        else:
+            for metric in metrics:
+                scorer = metrics[metric](**arguments)
+                scores.add(key=metric, value=scorer.get('scores'))
 
     def print_scores(self, output_directory):
-        os.mkdir(output_directory)
-        for metric in tqdm(self.get('scores'), desc='printing scores'):
+        def print_metric_scores(metric):
+            # the pretty and tab outputs of a metric share its separator setting so they are written in turn
             scores = self.get('scores').get(metric)
             output_file = '{}/{}-scores.txt'.format(output_directory, metric)
             scores.print_scores(output_file, 'pretty')
             output_file = '{}/{}-scores.tab'.format(output_directory, metric)
-            scores.print_scores(output_file, 'tab')
\ No newline at end of file
+            scores.print_scores(output_file, 'tab')
+        os.mkdir(output_directory)
+        metrics = list(self.get('scores'))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in tqdm(executor.map(print_metric_scores, metrics), total=len(metrics), desc='printing scores'):
+                pass
@@ -52,6 +52,15 @@ class Span(Object):
         """
         return "{}-{}".format(self.get('START'), self.get('END'))
 
+    def reset(self, start_x, start_y, end_x, end_y):
+        """
+        Set the coordinates of the span, so that a span object can be reused.
+        """
+        self.start_x = start_x
+        self.start_y = start_y
+        self.end_x = end_x
+        self.end_y = end_y
+
     def get_copy(self):
         return type(self)(self.get('logger'), self.get('start_x'), self.get('start_y'), self.get('end_x'), self.get('end_y'))
 
@@ -22,11 +22,26 @@ class TA3QuerySet(Object):
         super().__init__(logger)
         self.directory = directory
         self.conditions = {}
+        self.topic_indices = {}
         self.load()
 
     def get_claim_template(self, condition, query_id):
         return self.get('conditions').get(condition).get('topics').get(query_id)[0].get('claim_template')
 
+    def get_topic_index(self, condition):
+        """
+        Returns the sets of topics, (topic, subtopic) pairs, and (topic, subtopic, claim_template)
+        triples found in the topics of the given condition, built once per condition.
+        """
+        if condition not in self.topic_indices:
+            entries = [entry for topic_list in self.get('conditions').get(condition).get('topics').values() for entry in topic_list]
+            self.topic_indices[condition] = {
+                'topics': frozenset(entry.get('topic') for entry in entries),
+                'topic_subtopics': frozenset((entry.get('topic'), entry.get('subtopic')) for entry in entries),
+                'topic_subtopic_templates': frozenset((entry.get('topic'), entry.get('subtopic'), entry.get('claim_template')) for entry in entries)
+                }
+        return self.topic_indices[condition]
+
     def get_topic(self, condition, query_id):
         return self.get('conditions').get(condition).get('topics').get(query_id)[0].get('topic')
 
@@ -19,7 +19,7 @@ class TextBoundaries(DocumentBoundaries):
     boundaries.
     """
 
-    def __init__(self, logger, filename):
+    def __init__(self, logger, filename, use_cache=False):
         """
         Initialize TextDocumentBoundaries.
 
@@ -28,24 +28,28 @@ class TextBoundaries(DocumentBoundaries):
                 the aida.Logger object
             filename (str):
                 the file containing information about boundaries of text documents.
+            use_cache (bool):
+                whether the boundaries are read from, or saved to, a cache in the user's cache directory.
         """
-        super().__init__(logger, filename)
+        super().__init__(logger, filename, use_cache=use_cache)
     
     def load(self):
         """
         Read the sentence boundary file to load document boundary
         information.
         """
+        # the extent of each document element is found using integers, and a boundary is created once per document element
+        extents = {}
         for entry in FileHandler(self.logger, self.filename):
-            doceid, start_char, end_char = map(
-                    lambda arg: entry.get(arg), 
-                    'doceid,start_char,end_char'.split(','))
-            document_boundary = self.get(doceid, 
-                                         default=DocumentBoundary(self.logger,
-                                                                  start_char, 0, end_char, 0))
-            tb_start_char = document_boundary.get('start_x')
-            tb_end_char = document_boundary.get('end_x')
-            if int(start_char) < int(tb_start_char):
-                document_boundary.set('start_x', start_char)
-            if int(end_char) > int(tb_end_char):
-                document_boundary.set('end_x', end_char)
\ No newline at end of file
+            doceid, start_char, end_char = entry.get('doceid'), entry.get('start_char'), entry.get('end_char')
+            start, end = int(start_char), int(end_char)
+            extent = extents.get(doceid)
+            if extent is None:
+                extents[doceid] = [start, start_char, end, end_char]
+                continue
+            if start < extent[0]:
+                extent[0], extent[1] = start, start_char
+            if end > extent[2]:
+                extent[2], extent[3] = end, end_char
+        for doceid, (_, start_char, _, end_char) in extents.items():
+            self.add(key=doceid, value=DocumentBoundary(self.logger, start_char, 0, end_char, 0))
@@ -11,6 +11,8 @@ from aida.scorer import Scorer
 from aida.type_metric_v1_score import TypeMetricScoreV1
 from aida.utility import get_precision_recall_and_f1, get_augmented_types_utility, multisort
 
+scored_metatypes = frozenset(['Entity', 'Event'])
+
 class TypeMetricScorerV1(Scorer):
     """
     Class for variant # 1 of the type metric scores.
@@ -52,7 +54,7 @@ class TypeMetricScorerV1(Scorer):
                 if gold_cluster_id == 'None': continue
                 gold_cluster = self.get('gold_responses').get('document_clusters').get(document_id).get(gold_cluster_id)
                 metatype = gold_cluster.get('metatype')
-                if metatype not in ['Entity', 'Event']: continue
+                if metatype not in scored_metatypes: continue
                 if system_cluster_id != 'None':
                     if aligned_similarity == 0:
                         self.record_event('DEFAULT_CRITICAL_ERROR', 'aligned_similarity=0')
@@ -87,7 +89,7 @@ class TypeMetricScorerV1(Scorer):
                 if system_cluster_id != 'None':
                     system_cluster = self.get('system_responses').get('document_clusters').get(document_id).get(system_cluster_id)
                     metatype = system_cluster.get('metatype')
-                    if metatype not in ['Entity', 'Event']: continue
+                    if metatype not in scored_metatypes: continue
                     if gold_cluster_id == 'None':
                         precision, recall, f1 = [0,0,0]
                         score = TypeMetricScoreV1(logger=self.logger,
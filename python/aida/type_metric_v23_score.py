@@ -16,6 +16,7 @@ class TypeMetricScoreV23(Score):
         super().__init__(logger)
         for key in kwargs:
             self.set(key, kwargs[key])
+        self.intern('document_id', 'metatype', 'gold_cluster_id', 'system_cluster_id')
         self.metatype_sortkey = '_ALL' if self.get('metatype') == 'ALL' else self.get('metatype')
         self.set_defaults()
 
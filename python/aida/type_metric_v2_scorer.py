@@ -9,7 +9,23 @@ __date__    = "18 August 2020"
 from aida.score_printer import ScorePrinter
 from aida.scorer import Scorer
 from aida.type_metric_v23_score import TypeMetricScoreV23
-from aida.utility import get_augmented_type, multisort
+from aida.utility import get_augmented_type, get_augmented_types_utility
+from collections import defaultdict
+from operator import attrgetter
+
+import numpy as np
+
+scored_metatypes = frozenset(['Entity', 'Event'])
+
+def get_cumulative_precisions(is_right, relevance_weights):
+    """
+    Return a pair of arrays (num_correct, sum_precision) where the i-th entries hold the
+    running count of correct items, and the running sum of precisions, up to rank i+1.
+    """
+    num_correct = np.cumsum(np.where(is_right, relevance_weights, 0))
+    precisions = num_correct / np.arange(1, len(is_right) + 1)
+    precisions[~is_right] = 0.0
+    return num_correct, np.cumsum(precisions, out=precisions)
 
 class TypeMetricScorerV2(Scorer):
     """
@@ -32,86 +48,84 @@ class TypeMetricScorerV2(Scorer):
         super().__init__(logger, **kwargs)
 
     def get_average_precision(self, document_id, gold_cluster_id, augmented_gold_types, system_cluster_id, augmented_system_types):
-        entity_types = {'gold': augmented_gold_types, 'system': augmented_system_types}
-        type_weights = list()
-        for entity_type in entity_types.get('system'):
-            type_weight = {
-                'type': entity_type,
-                'weight': self.get('type_weight', entity_types.get('system').get(entity_type))
-                }
-            type_weights.append(type_weight)
+        type_weights = {entity_type: self.get('type_weight', entries) for entity_type, entries in augmented_system_types.items()}
+        # the ranked types and their weights are kept in parallel lists
+        ranked_types = sorted(type_weights, key=lambda entity_type: (-type_weights[entity_type], entity_type))
+        ranked_weights = [type_weights[entity_type] for entity_type in ranked_types]
 
-        num_ground_truth = len(entity_types.get('gold'))
-        rank = 0
-        num_correct = 0
-        sum_precision = 0.0
-        for type_weight in multisort(type_weights, (('weight', True),
-                                                    ('type', False))):
-            rank += 1
-            label = 'WRONG'
-            if type_weight.get('type') in entity_types.get('gold'):
-                label = 'RIGHT'
-                num_correct += self.get('relevance_weight', type_weight.get('weight'))
-                sum_precision += (num_correct/rank)
-            self.record_event('TYPE_METRIC_AP_RANKED_LIST', self.__class__.__name__, document_id, gold_cluster_id, system_cluster_id, num_ground_truth, rank, type_weight.get('type'), label, type_weight.get('weight'), num_correct, sum_precision)
+        gold_types = frozenset(augmented_gold_types)
+        num_ground_truth = len(gold_types)
+        num_ranked = len(ranked_types)
+        # rank i (1-based) contributes num_correct[i]/i to the sum of precisions if the type at rank i is correct
+        is_right = np.fromiter((entity_type in gold_types for entity_type in ranked_types), dtype=bool, count=num_ranked)
+        relevance_weights = np.array([self.get('relevance_weight', weight) for weight in ranked_weights])
+        num_correct, sum_precision = get_cumulative_precisions(is_right, relevance_weights)
+        if self.get('logger').is_enabled_for('TYPE_METRIC_AP_RANKED_LIST'):
+            for index in range(num_ranked):
+                label = 'RIGHT' if is_right[index] else 'WRONG'
+                self.record_event('TYPE_METRIC_AP_RANKED_LIST', self.__class__.__name__, document_id, gold_cluster_id, system_cluster_id, num_ground_truth, index + 1, ranked_types[index], label, ranked_weights[index], num_correct[index], sum_precision[index])
 
-        average_precision = (sum_precision/num_ground_truth) if num_ground_truth else 0
+        total_precision = float(sum_precision[-1]) if num_ranked else 0.0
+        average_precision = (total_precision/num_ground_truth) if num_ground_truth else 0
         return average_precision
 
-    def get_augmented_types(self, document_id, types):
-        augmented_types = {}
-        region_types = self.get('annotated_regions').get('types_annotated_for_document', document_id)
-        for cluster_type in types:
+    def get_augmented_types(self, region_types, types):
+        augmented_types = defaultdict(list)
+        for cluster_type, entries in types.items():
             augmented_type = get_augmented_type(region_types, cluster_type)
             if augmented_type:
-                if augmented_type not in augmented_types:
-                    augmented_types[augmented_type] = []
-                for entry in types.get(cluster_type):
-                    augmented_types.get(augmented_type).append(entry)
-        return augmented_types
+                augmented_types[augmented_type].extend(entries)
+        return dict(augmented_types)
 
     def get_relevance_weight(self, type_weight):
         return 1
 
     def get_type_weight(self, entries):
-        mentions = {}
-        for entry in entries:
-            mentions[entry.get('mention_span_text')] = 1
-        return len(mentions)
+        return len({entry.get('mention_span_text') for entry in entries})
 
     def score_responses(self):
         scores = []
+        logger = self.logger
+        run_id = self.get('run_id')
+        documents = self.get('gold_responses').get('document_mappings').get('documents')
+        gold_document_clusters = self.get('gold_responses').get('document_clusters')
+        system_document_clusters = self.get('system_responses').get('document_clusters')
+        gold_to_system = self.get('cluster_alignment').get('gold_to_system')
+        system_to_gold = self.get('cluster_alignment').get('system_to_gold')
         for document_id in self.get('core_documents'):
             # add scores corresponding to all gold clusters
-            document = self.get('gold_responses').get('document_mappings').get('documents').get(document_id)
+            document = documents.get(document_id)
             language = document.get('language')
-            self.record_event('ANNOTATED_TYPES_INFO', document_id, ','.join(self.get('annotated_regions').get('types_annotated_for_document', document_id)))
-            document_gold_to_system = self.get('cluster_alignment').get('gold_to_system').get(document_id)
+            region_types = self.get('annotated_regions').get('types_annotated_for_document', document_id)
+            self.record_event('ANNOTATED_TYPES_INFO', document_id, ','.join(region_types))
+            document_gold_clusters = gold_document_clusters.get(document_id)
+            document_system_clusters = system_document_clusters.get(document_id)
+            document_gold_to_system = gold_to_system.get(document_id)
             for gold_cluster_id in document_gold_to_system if document_gold_to_system else []:
-                system_cluster_id = document_gold_to_system.get(gold_cluster_id).get('aligned_to')
-                aligned_similarity = document_gold_to_system.get(gold_cluster_id).get('aligned_similarity')
-                average_precision = 0
                 if gold_cluster_id == 'None': continue
-                gold_cluster = self.get('gold_responses').get('document_clusters').get(document_id).get(gold_cluster_id)
+                gold_cluster = document_gold_clusters.get(gold_cluster_id)
                 metatype = gold_cluster.get('metatype')
-                if metatype not in ['Entity', 'Event']: continue
+                if metatype not in scored_metatypes: continue
+                alignment = document_gold_to_system.get(gold_cluster_id)
+                system_cluster_id = alignment.get('aligned_to')
+                aligned_similarity = alignment.get('aligned_similarity')
+                average_precision = 0
                 if system_cluster_id != 'None':
                     if aligned_similarity == 0:
                         self.record_event('DEFAULT_CRITICAL_ERROR', 'aligned_similarity=0')
-                    system_cluster = self.get('cluster', 'system', document_id, system_cluster_id)
+                    system_cluster = document_system_clusters.get(system_cluster_id)
                     if system_cluster.get('metatype') != metatype:
                         self.record_event('UNEXPECTED_ALIGNED_CLUSTER_METATYPE', system_cluster.get('metatype'), system_cluster_id, metatype, gold_cluster_id)
                     gold_types = gold_cluster.get('all_expanded_types')
-                    system_types = {}
-                    if document_id in self.get('system_responses').get('document_clusters'):
-                        system_types = self.get('system_responses').get('document_clusters').get(document_id).get(system_cluster_id).get('all_expanded_types')
-                    augmented_gold_types = self.get('augmented_types', document_id, gold_types)
-                    augmented_system_types = self.get('augmented_types', document_id, system_types)
+                    system_types = system_cluster.get('all_expanded_types')
+                    # only the augmented gold types are needed, not their entries
+                    augmented_gold_types = get_augmented_types_utility(region_types, gold_types)
+                    augmented_system_types = self.get('augmented_types', region_types, system_types)
                     self.record_event('TYPE_METRIC_SCORE_INFO', self.__class__.__name__, 'TYPES_SUBMITTED', document_id, gold_cluster_id, ','.join(sorted(gold_types)), system_cluster_id, ','.join(sorted(system_types)))
                     self.record_event('TYPE_METRIC_SCORE_INFO', self.__class__.__name__, 'TYPES_SCORED', document_id, gold_cluster_id, ','.join(sorted(augmented_gold_types)), system_cluster_id, ','.join(sorted(augmented_system_types)))
                     average_precision = self.get('average_precision', document_id, gold_cluster_id, augmented_gold_types, system_cluster_id, augmented_system_types)
-                score = TypeMetricScoreV23(logger=self.logger,
-                                           run_id=self.get('run_id'),
+                score = TypeMetricScoreV23(logger=logger,
+                                           run_id=run_id,
                                            document_id=document_id,
                                            language=language,
                                            metatype=metatype,
@@ -120,18 +134,21 @@ class TypeMetricScorerV2(Scorer):
                                            average_precision=average_precision)
                 scores.append(score)
             # add scores unaligned system clusters
-            document_system_to_gold = self.get('cluster_alignment').get('system_to_gold').get(document_id)
+            document_system_to_gold = system_to_gold.get(document_id)
             for system_cluster_id in document_system_to_gold if document_system_to_gold else []:
-                gold_cluster_id = document_system_to_gold.get(system_cluster_id).get('aligned_to')
-                aligned_similarity = document_system_to_gold.get(system_cluster_id).get('aligned_similarity')
                 if system_cluster_id != 'None':
-                    system_cluster = self.get('system_responses').get('document_clusters').get(document_id).get(system_cluster_id)
+                    alignment = document_system_to_gold.get(system_cluster_id)
+                    gold_cluster_id = alignment.get('aligned_to')
+                    aligned_similarity = alignment.get('aligned_similarity')
+                    # aligned system clusters are scored along with their gold clusters
+                    if gold_cluster_id != 'None' and aligned_similarity != 0: continue
+                    system_cluster = document_system_clusters.get(system_cluster_id)
                     metatype = system_cluster.get('metatype')
-                    if metatype not in ['Entity', 'Event']: continue
+                    if metatype not in scored_metatypes: continue
                     if gold_cluster_id == 'None':
                         average_precision = 0
-                        score = TypeMetricScoreV23(logger=self.logger,
-                                                   run_id=self.get('run_id'),
+                        score = TypeMetricScoreV23(logger=logger,
+                                                   run_id=run_id,
                                                    document_id=document_id,
                                                    language=language,
                                                    metatype=metatype,
@@ -141,11 +158,8 @@ class TypeMetricScorerV2(Scorer):
                         scores.append(score)
                     elif aligned_similarity == 0:
                         self.record_event('DEFAULT_CRITICAL_ERROR', 'aligned_similarity=0')
+        scores.sort(key=attrgetter('document_id', 'metatype', 'gold_cluster_id', 'system_cluster_id'))
         scores_printer = ScorePrinter(self.logger, self.printing_specs)
-        for score in multisort(scores, (('document_id', False),
-                                        ('metatype', False),
-                                        ('gold_cluster_id', False),
-                                        ('system_cluster_id', False))):
-            scores_printer.add(score)
+        scores_printer.extend(scores)
         self.aggregate_scores(scores_printer, TypeMetricScoreV23)
         self.scores = scores_printer
\ No newline at end of file
@@ -9,9 +9,12 @@ __date__    = "12 September 2022"
 from aida.score_printer import ScorePrinter
 from aida.scorer import Scorer
 from aida.type_metric_v4_score import TypeMetricScoreV4
-from aida.utility import multisort
+from operator import attrgetter
 from tqdm import tqdm
 
+known_metatypes = frozenset(['Event', 'Relation', 'Entity', None])
+scored_metatypes = frozenset(['Entity', 'Event'])
+
 class TypeMetricScorerV4(Scorer):
     """
     Class for variant # 4 of the type metric scores to be used in phase 3.
@@ -30,51 +33,62 @@ class TypeMetricScorerV4(Scorer):
     def __init__(self, logger, **kwargs):
         super().__init__(logger, **kwargs)
 
-    def get_type_similarity(self, document_id, cluster_ids):
+    def get_type_similarity(self, document_type_similarities, cluster_ids):
         system_cluster_id = cluster_ids.get('system')
         gold_cluster_id = cluster_ids.get('gold')
         type_similarity = 0
-        document_type_similarities = self.get('type_similarities').get('document_type_similarities', document_id)
         if system_cluster_id in document_type_similarities and gold_cluster_id in document_type_similarities.get(system_cluster_id):
             type_similarity = float(document_type_similarities.get(system_cluster_id).get(gold_cluster_id))
         return type_similarity
 
-    def get_metatype(self, document_id, cluster_ids):
-        responses = {
-            'gold': self.get('gold_responses'),
-            'system': self.get('system_responses')
-            }
+    def get_metatype(self, document_clusters, gold_cluster_id, system_cluster_id):
         metatype = None
-        for system_or_gold in cluster_ids:
-            cluster_id = cluster_ids.get(system_or_gold)
+        # the metatype of the gold cluster, if found, takes precedence over that of the system cluster
+        for system_or_gold, cluster_id in (('gold', gold_cluster_id), ('system', system_cluster_id)):
             if cluster_id == 'None': continue
-            cluster = responses.get(system_or_gold).get('document_clusters').get(document_id).get(cluster_id)
+            cluster = document_clusters.get(system_or_gold).get(cluster_id)
             if cluster is None: continue
             metatype = cluster.get('metatype')
-        if metatype not in ['Event', 'Relation', 'Entity', None]:
+            break
+        if metatype not in known_metatypes:
             self.record_event('DEFAULT_CRITICAL_ERROR', 'Unknown metatype: {} for {}:{}'.format(metatype, system_or_gold.upper(), cluster_id), self.get('code_location'))
         return metatype
 
     def score_responses(self):
         scores = []
-        for document_id in tqdm(self.get('core_documents'), desc='scoring {}'.format(self.__class__.__name__)):
+        logger = self.logger
+        run_id = self.get('run_id')
+        documents = self.get('gold_responses').get('document_mappings').get('documents')
+        gold_document_clusters = self.get('gold_responses').get('document_clusters')
+        system_document_clusters = self.get('system_responses').get('document_clusters')
+        gold_to_system = self.get('cluster_alignment').get('gold_to_system')
+        system_to_gold = self.get('cluster_alignment').get('system_to_gold')
+        type_similarities = self.get('type_similarities')
+        # the progress bar is refreshed at most once a second, and is not shown when the output is not a terminal
+        for document_id in tqdm(self.get('core_documents'), desc='scoring {}'.format(self.__class__.__name__),
+                                mininterval=1.0, disable=None):
             # add scores corresponding to all gold clusters
-            document = self.get('gold_responses').get('document_mappings').get('documents').get(document_id)
+            document = documents.get(document_id)
             # skip those core documents that do not have an entry in the parent-children table
             if document is None: continue
             language = document.get('language')
+            document_clusters = {
+                'gold': gold_document_clusters.get(document_id),
+                'system': system_document_clusters.get(document_id)
+                }
+            document_type_similarities = type_similarities.get('document_type_similarities', document_id)
 
-            document_gold_to_system = self.get('cluster_alignment').get('gold_to_system').get(document_id)
+            document_gold_to_system = gold_to_system.get(document_id)
             for gold_cluster_id in document_gold_to_system if document_gold_to_system else []:
                 if gold_cluster_id == 'None': continue
                 system_cluster_id = document_gold_to_system.get(gold_cluster_id).get('aligned_to')
                 type_similarity = 0.0000
                 if system_cluster_id != 'None':
-                    type_similarity = self.get('type_similarity', document_id, {'system': system_cluster_id, 'gold':gold_cluster_id})
-                metatype = self.get('metatype', document_id, {'system': system_cluster_id, 'gold':gold_cluster_id})
-                if metatype not in ['Entity', 'Event']: continue
-                score = TypeMetricScoreV4(logger=self.logger,
-                                           run_id=self.get('run_id'),
+                    type_similarity = self.get('type_similarity', document_type_similarities, {'system': system_cluster_id, 'gold':gold_cluster_id})
+                metatype = self.get('metatype', document_clusters, gold_cluster_id, system_cluster_id)
+                if metatype not in scored_metatypes: continue
+                score = TypeMetricScoreV4(logger=logger,
+                                           run_id=run_id,
                                            document_id=document_id,
                                            language=language,
                                            metatype=metatype,
@@ -83,16 +97,19 @@ class TypeMetricScorerV4(Scorer):
                                            type_similarity=type_similarity)
                 scores.append(score)
             # add scores unaligned system clusters
-            document_system_to_gold = self.get('cluster_alignment').get('system_to_gold').get(document_id)
+            document_system_to_gold = system_to_gold.get(document_id)
             for system_cluster_id in document_system_to_gold if document_system_to_gold else []:
-                gold_cluster_id = document_system_to_gold.get(system_cluster_id).get('aligned_to')
-                aligned_similarity = document_system_to_gold.get(system_cluster_id).get('aligned_similarity')
+                alignment = document_system_to_gold.get(system_cluster_id)
+                gold_cluster_id = alignment.get('aligned_to')
+                aligned_similarity = alignment.get('aligned_similarity')
                 if system_cluster_id != 'None':
-                    metatype = self.get('metatype', document_id, {'system': system_cluster_id, 'gold':gold_cluster_id})
-                    if metatype not in ['Entity', 'Event']: continue
+                    # aligned system clusters are scored along with their gold clusters
+                    if gold_cluster_id != 'None' and aligned_similarity != 0: continue
+                    metatype = self.get('metatype', document_clusters, gold_cluster_id, system_cluster_id)
+                    if metatype not in scored_metatypes: continue
                     if gold_cluster_id == 'None':
-                        score = TypeMetricScoreV4(logger=self.logger,
-                                                   run_id=self.get('run_id'),
+                        score = TypeMetricScoreV4(logger=logger,
+                                                   run_id=run_id,
                                                    document_id=document_id,
                                                    language=language,
                                                    metatype=metatype,
@@ -102,11 +119,8 @@ class TypeMetricScorerV4(Scorer):
                         scores.append(score)
                     elif aligned_similarity == 0:
                         self.record_event('DEFAULT_CRITICAL_ERROR', 'aligned_similarity=0')
+        scores.sort(key=attrgetter('document_id', 'metatype', 'gold_cluster_id', 'system_cluster_id'))
         scores_printer = ScorePrinter(self.logger, self.printing_specs)
-        for score in multisort(scores, (('document_id', False),
-                                        ('metatype', False),
-                                        ('gold_cluster_id', False),
-                                        ('system_cluster_id', False))):
-            scores_printer.add(score)
+        scores_printer.extend(scores)
         self.aggregate_scores(scores_printer, TypeMetricScoreV4)
-        self.scores = scores_printer
\ No newline at end of file
+        self.scores = scores_printer
@@ -8,7 +8,10 @@ __date__    = "28 January 2020"
 
 from aida.span import Span
 from aida.object import Object
+from functools import lru_cache
 import hashlib
+import os
+import pickle
 import re
 import sys
 
@@ -137,6 +140,53 @@ def get_kb_document_id_from_filename(filename):
     """
     return filename.split(r'/')[-2][:-4]
 
+def get_cache_filename(filename):
+    """
+    Gets the name of the file used by load_from_cache and save_to_cache for the file provided as argument.
+
+    The caches are kept in the user's cache directory rather than next to the file, which may be read-only.
+    """
+    cache_directory = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'aida')
+    return os.path.join(cache_directory, '{}.pkl'.format(get_md5_from_string(os.path.abspath(filename))))
+
+def get_cache_key(filename):
+    """
+    Gets the key, made of the size and modification time of the file provided as argument, under which
+    the data parsed from the file is cached. It is to be taken before the file is parsed.
+    """
+    file_stat = os.stat(filename)
+    return (file_stat.st_size, file_stat.st_mtime_ns)
+
+def load_from_cache(filename, file_key):
+    """
+    Gets the data saved by save_to_cache for the file provided as argument, or None if
+    there is no cache, or if the file changed after the cache was written.
+    """
+    try:
+        with open(get_cache_filename(filename), 'rb') as cache_file:
+            cached_filename, cached_file_key, data = pickle.load(cache_file)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        return
+    if (cached_filename, cached_file_key) != (os.path.abspath(filename), file_key):
+        return
+    return data
+
+def save_to_cache(filename, file_key, data):
+    """
+    Saves the data parsed from the file provided as argument, keyed by the key taken by
+    get_cache_key before the file was parsed. Failures to write the cache are ignored.
+    """
+    cache_filename = get_cache_filename(filename)
+    temporary_filename = '{}.{}'.format(cache_filename, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(cache_filename), mode=0o700, exist_ok=True)
+        with open(temporary_filename, 'wb') as cache_file:
+            pickle.dump((os.path.abspath(filename), file_key, data), cache_file, protocol=5)
+        os.replace(temporary_filename, cache_filename)
+    except OSError:
+        if os.path.exists(temporary_filename):
+            os.remove(temporary_filename)
+
 def get_md5_from_string(text):
     """
     Gets the MD5 sum of a string passed as argument provided as argument.
@@ -191,12 +241,9 @@ def get_augmented_type(region_types, cluster_type):
     return get_augmented_type(region_types, coarse_grain_type)
 
 def get_augmented_types_utility(region_types, types):
-    augmented_types = {}
-    for cluster_type in types:
-        augmented_type = get_augmented_type(region_types, cluster_type)
-        if augmented_type:
-            augmented_types[augmented_type] = 1
-    return set(list(augmented_types.keys()))
+    augmented_types = {get_augmented_type(region_types, cluster_type) for cluster_type in types}
+    augmented_types.discard(None)
+    return augmented_types
 
 def get_intersection_over_union(m1, m2):
     logger = m1.get('logger')
@@ -290,6 +337,7 @@ def multisort(xs, specs):
         xs.sort(key=lambda x: x.get(key), reverse=reverse)
     return xs
 
+@lru_cache(maxsize=1024)
 def types_are_compatible(entity_type_in_query, entity_type_in_response):
     """
     Determine if two types 'entity_type_in_query' and 'entity_type_in_response',
@@ -9,12 +9,70 @@ __date__    = "11 January 2022"
 
 from aida.object import Object
 from aida.span import Span
-from aida.utility import types_are_compatible, is_number, trim, trim_cv
+from aida.utility import types_are_compatible, trim, trim_cv
+from functools import lru_cache
 
 import datetime
 import os
 import re
 
+provenance_pattern = re.compile(r'^(\w+?):(\w+?):\((\S+),(\S+)\)-\((\S+),(\S+)\)$')
+keyframe_pattern = re.compile(r'^(\w*?)_(\d+)$')
+
+# allowed values of the attributes validated by set membership
+allowed_component_types = frozenset(['claimMedium', 'claimer', 'claimerAffiliation', 'claimLocation', 'xVariable'])
+allowed_epistemic_statuses = frozenset(['EpistemicTrueCertain', 'EpistemicTrueUncertain', 'EpistemicFalseCertain', 'EpistemicFalseUncertain', 'EpistemicUnknown'])
+allowed_claim_relations = frozenset(['supporting', 'refuting', 'related'])
+allowed_sentiment_statuses = frozenset(['SentimentPositive', 'SentimentNegative', 'SentimentMixed', 'SentimentNeutralUnknown'])
+allowed_negation_statuses = frozenset(['Negated', 'NotNegated'])
+allowed_metatypes = ('Entity', 'Relation', 'Event')
+
+# conditions for which claim topics, subtopics and templates are checked against the user-queries
+topic_conditions = frozenset(['Condition5', 'Condition6'])
+
+# validators that only check the value of the attribute against the allowed values,
+# mapped to the name used when reporting an unknown value and the allowed values
+set_membership_validators = {
+    'validate_claim_component_type': ('component_type', allowed_component_types),
+    'validate_claim_epistemic_status': ('epistemic_status', allowed_epistemic_statuses),
+    'validate_claim_sentiment_status': ('sentiment_status', allowed_sentiment_statuses),
+    'validate_negation_status': ('negation_status', allowed_negation_statuses)
+    }
+
+@lru_cache(maxsize=8192)
+def is_valid_date(year, month, day):
+    try:
+        datetime.date(int(year), int(month), int(day))
+    except (TypeError, ValueError, OverflowError):
+        return False
+    return True
+
+def is_word(s):
+    return s.replace('_', 'a').isalnum()
+
+def split_provenance(provenance):
+    """
+    Split a provenance of the form DOCID:DOCELEMENTID:(SX,SY)-(EX,EY) using string operations.
+
+    Returns the tuple (document_id, document_element_id, start_x, start_y, end_x, end_y) if the
+    provenance has exactly this simple form, and None otherwise, in which case the caller
+    should fall back to provenance_pattern.
+    """
+    parts = provenance.split(':')
+    if len(parts) != 3: return
+    document_id, document_element_id, coordinates = parts
+    if not (is_word(document_id) and is_word(document_element_id)): return
+    if len(coordinates) < 2 or coordinates[0] != '(' or coordinates[-1] != ')': return
+    if len(coordinates.split()) != 1: return
+    points = coordinates[1:-1].split(')-(')
+    if len(points) != 2: return
+    start, end = points[0].split(','), points[1].split(',')
+    if len(start) != 2 or len(end) != 2: return
+    values = start + end
+    for value in values:
+        if not value or '(' in value or ')' in value: return
+    return (document_id, document_element_id, *values)
+
 class Validator(Object):
     """
     Validator for values in AIDA response.
@@ -22,25 +80,51 @@ class Validator(Object):
 
     def __init__(self, logger):
         super().__init__(logger)
+        self.extensions = {}
+        self.parsed_provenances = {}
+        # span reused by validate_provenance; it never outlives the call since events are formatted when recorded
+        self.provenance_span = Span(logger, 0, 0, 0, 0)
+        # the validators are resolved once rather than looked up by name for every attribute of every entry
+        self.validators = {name: getattr(self, name) for name in dir(self) if name.startswith('validate_') and callable(getattr(self, name))}
+
+    def get_extensions(self, responses):
+        """
+        Returns the tuple of file extensions of the document encodings, built once per encodings object.
+        """
+        encodings = responses.get('document_mappings').get('encodings')
+        extensions = self.extensions.get(id(encodings))
+        if extensions is None:
+            extensions = tuple(['.' + extension for extension in encodings])
+            self.extensions[id(encodings)] = extensions
+        return extensions
 
     def parse_provenance(self, provenance):
-        pattern = re.compile('^(\w+?):(\w+?):\((\S+),(\S+)\)-\((\S+),(\S+)\)$')
-        match = pattern.match(provenance)
-        if not match: return
-        document_id = match.group(1)
-        document_element_id = match.group(2)
-        start_x, start_y, end_x, end_y = map(lambda ID: match.group(ID), [3, 4, 5, 6])
-
-        # if provided, obtain keyframe_id and update document_element_id
-        pattern = re.compile('^(\w*?)_(\d+)$')
-        match = pattern.match(document_element_id)
-        keyframe_num = match.group(2) if match else None
-        document_element_id = match.group(1) if match else document_element_id
-
-        return document_id, document_element_id, keyframe_num, start_x, start_y, end_x, end_y
+        # the same provenance is typically repeated across many response rows
+        if provenance in self.parsed_provenances:
+            return self.parsed_provenances[provenance]
+        parsed = split_provenance(provenance)
+        # provenance_pattern alone would also accept a colon inside the coordinates
+        if parsed is None and provenance.count(':') == 2:
+            match = provenance_pattern.match(provenance)
+            parsed = match.groups() if match else None
+        if parsed is not None:
+            document_id, document_element_id, start_x, start_y, end_x, end_y = parsed
+
+            # if provided, obtain keyframe_id and update document_element_id
+            keyframe_num = None
+            prefix, separator, suffix = document_element_id.rpartition('_')
+            if separator and suffix.isdecimal():
+                document_element_id, keyframe_num = prefix, suffix
+
+            parsed = document_id, document_element_id, keyframe_num, start_x, start_y, end_x, end_y
+        self.parsed_provenances[provenance] = parsed
+        return parsed
 
     def validate(self, responses, method_name, schema, entry, attribute):
-        method = self.get_method(method_name)
+        if method_name in set_membership_validators:
+            name, allowed_values = set_membership_validators[method_name]
+            return self.validate_set_membership(name, allowed_values, entry.get(attribute.get('name')), entry.get('where'))
+        method = self.validators.get(method_name)
         if method is None:
             self.record_event('UNDEFINED_METHOD', method_name)
         return method(responses, schema, entry, attribute)
@@ -61,10 +145,6 @@ class Validator(Object):
             return False
         return True
 
-    def validate_claim_component_type(self, responses, schema, entry, attribute):
-        allowed_values = ['claimMedium', 'claimer', 'claimerAffiliation', 'claimLocation', 'xVariable']
-        return self.validate_set_membership('component_type', allowed_values, entry.get(attribute.get('name')), entry.get('where'))
-
     def validate_claim_condition(self, responses, schema, entry, attribute):
         claim_condition = entry.get(attribute.get('name'))
         queries = responses.get('queries')
@@ -74,49 +154,45 @@ class Validator(Object):
                 return False
         return True
 
-    def validate_claim_epistemic_status(self, responses, schema, entry, attribute):
-        allowed_values = ['EpistemicTrueCertain', 'EpistemicTrueUncertain', 'EpistemicFalseCertain', 'EpistemicFalseUncertain', 'EpistemicUnknown']
-        return self.validate_set_membership('epistemic_status', allowed_values, entry.get(attribute.get('name')), entry.get('where'))
-
     def validate_claim_query_topic_or_claim_frame_id(self, responses, schema, entry, attribute):
         claim_query_topic_or_claim_frame_id = entry.get(attribute.get('name'))
         queries = responses.get('queries')
         if queries:
-            claim_condition = entry.get('claim_condition')
-            query_condition = queries.get('conditions').get(claim_condition)
-            key = 'query_claim_frames' if query_condition.get('query_claim_frames') else 'topics'
-            if claim_query_topic_or_claim_frame_id not in query_condition.get(key):
-                self.record_event('UNKNOWN_CLAIM_QUERY_TOPIC_OR_CLAIM_FRAME_ID', key, claim_query_topic_or_claim_frame_id, entry.get('where'))
-                return False
+            return self.validate_claim_query_scope(queries, entry.get('claim_condition'), claim_query_topic_or_claim_frame_id, entry.get('where'))
+        return True
+
+    def validate_claim_query_scope(self, queries, claim_condition, claim_query_topic_or_claim_frame_id, where):
+        """
+        Checks that the claim query topic or claim frame id is one of the query claim frames
+        of the condition, or one of its topics if the condition has no query claim frames.
+        """
+        query_condition = queries.get('conditions').get(claim_condition)
+        key = 'query_claim_frames' if query_condition.get('query_claim_frames') else 'topics'
+        if claim_query_topic_or_claim_frame_id not in query_condition.get(key):
+            self.record_event('UNKNOWN_CLAIM_QUERY_TOPIC_OR_CLAIM_FRAME_ID', key, claim_query_topic_or_claim_frame_id, where)
+            return False
         return True
 
     def validate_claim_relation(self, responses, schema, entry, attribute):
-        allowed_values = ['supporting', 'refuting', 'related']
-        valid = self.validate_set_membership('claim_relation', allowed_values, entry.get(attribute.get('name')), entry.get('where'))
+        valid = self.validate_set_membership('claim_relation', allowed_claim_relations, entry.get(attribute.get('name')), entry.get('where'))
         if not valid:
             entry.get('claim').set('valid', False)
         return valid
 
-    def validate_claim_sentiment_status(self, responses, schema, entry, attribute):
-        allowed_values = ['SentimentPositive', 'SentimentNegative', 'SentimentMixed', 'SentimentNeutralUnknown']
-        return self.validate_set_membership('sentiment_status', allowed_values, entry.get(attribute.get('name')), entry.get('where'))
-
     def validate_claim_subtopic(self, responses, schema, entry, attribute):
         claim_subtopic = trim(entry.get(attribute.get('name')))
         claim_uid = entry.get('claim_uid')
         claim_condition = entry.get('claim_condition')
         claim_topic = trim(entry.get('claim_topic'))
         where = entry.get('where')
-        if claim_condition in ['Condition5', 'Condition6']:
+        if claim_condition in topic_conditions:
             if claim_subtopic == '':
-                self.record_event('MISSING_REQUIRED_CLAIM_FIELD', 'subtopic', claim_condition, claim_uid, entry.get('where'))
+                self.record_event('MISSING_REQUIRED_CLAIM_FIELD', 'subtopic', claim_condition, claim_uid, where)
                 return False
             # validate if claim_subtopic matches one in the user-queries
             if responses.get('queries') is not None:
-                for topic_list in responses.get('queries').get('conditions').get(claim_condition).get('topics').values():
-                    for entry in topic_list:
-                        if claim_subtopic == entry.get('subtopic') and claim_topic == entry.get('topic'):
-                            return True
+                if (claim_topic, claim_subtopic) in responses.get('queries').get('topic_index', claim_condition).get('topic_subtopics'):
+                    return True
                 self.record_event('UNEXPECTED_CLAIM_VALUE', 'subtopic', claim_subtopic, claim_uid, where)
                 return False
         return True
@@ -128,16 +204,14 @@ class Validator(Object):
         claim_topic = trim(entry.get('claim_topic'))
         claim_subtopic = trim(entry.get('claim_subtopic'))
         where = entry.get('where')
-        if claim_condition in ['Condition5', 'Condition6']:
+        if claim_condition in topic_conditions:
             if claim_template == '':
-                self.record_event('MISSING_REQUIRED_CLAIM_FIELD', 'claim_template', claim_condition, claim_uid, entry.get('where'))
+                self.record_event('MISSING_REQUIRED_CLAIM_FIELD', 'claim_template', claim_condition, claim_uid, where)
                 return False
             # validate if claim_template matches one in the user-queries
             if responses.get('queries') is not None:
-                for topic_list in responses.get('queries').get('conditions').get(claim_condition).get('topics').values():
-                    for entry in topic_list:
-                        if claim_subtopic == entry.get('subtopic') and claim_topic == entry.get('topic') and claim_template == entry.get('claim_template'):
-                            return True
+                if (claim_topic, claim_subtopic, claim_template) in responses.get('queries').get('topic_index', claim_condition).get('topic_subtopic_templates'):
+                    return True
                 self.record_event('UNEXPECTED_CLAIM_VALUE', 'claimTemplate', claim_template, claim_uid, where)
                 return False
         return True
@@ -148,10 +222,8 @@ class Validator(Object):
         claim_condition = entry.get('claim_condition')
         where = entry.get('where')
         if responses.get('queries') is not None:
-            for topic_list in responses.get('queries').get('conditions').get(claim_condition).get('topics').values():
-                for entry in topic_list:
-                    if claim_topic == entry.get('topic'):
-                        return True
+            if claim_topic in responses.get('queries').get('topic_index', claim_condition).get('topics'):
+                return True
             self.record_event('UNEXPECTED_CLAIM_VALUE', 'topic', claim_topic, claim_uid, where)
             return False
         return True
@@ -161,44 +233,52 @@ class Validator(Object):
         return True
 
     def validate_coordinates(self, provenance, start_x, start_y, end_x, end_y, where):
-        for coordinate in [start_x, start_y, end_x, end_y]:
-            if not is_number(coordinate):
+        coordinates = [start_x, start_y, end_x, end_y]
+        values = []
+        # convert each coordinate once
+        for coordinate in coordinates:
+            try:
+                value = float(coordinate)
+            except ValueError:
                 self.record_event('NOT_A_NUMBER', coordinate, where)
                 return False
-            if float(coordinate) < 0:
+            if value < 0:
                 self.record_event('NEGATIVE_NUMBER', coordinate, where)
                 return False
-        for start, end in [(start_x, end_x), (start_y, end_y)]:
-            if float(start) > float(end):
-                self.record_event('START_BIGGER_THAN_END', start, end, provenance, where)
+            values.append(value)
+        for start, end in [(0, 2), (1, 3)]:
+            if values[start] > values[end]:
+                self.record_event('START_BIGGER_THAN_END', coordinates[start], coordinates[end], provenance, where)
                 return False
         return True
 
     def validate_document_id(self, responses, schema, entry, attribute):
         logger = self.get('logger')
         document_id = entry.get('document_id')
+        where = entry.get('where')
         if document_id is None:
-            logger.record_event('MISSING_ITEM', 'document_id', entry.get('where'))
+            logger.record_event('MISSING_ITEM', 'document_id', where)
             return False
-        if entry.get('object_informative_justification') and document_id != entry.get('object_informative_justification').get('document_id'):
-            logger.record_event('MULTIPLE_ITEMS', 'document_ids', document_id, entry.get('object_informative_justification'), entry.get('where'))
+        object_informative_justification = entry.get('object_informative_justification')
+        if object_informative_justification and document_id != object_informative_justification.get('document_id'):
+            logger.record_event('MULTIPLE_ITEMS', 'document_ids', document_id, object_informative_justification, where)
             return False
-        if entry.get('predicate_justification') and document_id != entry.get('predicate_justification').get('document_id'):
-            logger.record_event('MULTIPLE_ITEMS', 'document_ids', document_id, entry.get('predicate_justification'), entry.get('where'))
+        predicate_justification = entry.get('predicate_justification')
+        if predicate_justification and document_id != predicate_justification.get('document_id'):
+            logger.record_event('MULTIPLE_ITEMS', 'document_ids', document_id, predicate_justification, where)
             return False
         if not responses.get('document_mappings').get('documents').exists(document_id):
-            self.record_event('UNKNOWN_ITEM', 'document', document_id, entry.get('where'))
+            self.record_event('UNKNOWN_ITEM', 'document', document_id, where)
             return False
         if schema.get('task') == 'task1':
             kb_document_id = entry.get('kb_document_id')
             if document_id != kb_document_id:
-                self.record_event('UNEXPECTED_DOCUMENT', kb_document_id, document_id, entry.get('where'))
+                self.record_event('UNEXPECTED_DOCUMENT', kb_document_id, document_id, where)
                 return False
         if schema.get('name') == 'AIDA_PHASE3_TASK3_GR_RESPONSE':
             claim_document_id = entry.get('claim').get('outer_claim').get('document_id')
-            entry_document_id = entry.get('document_id')
-            if entry_document_id != claim_document_id:
-                self.record_event('UNEXPECTED_DOCUMENT', claim_document_id, entry_document_id, entry.get('where'))
+            if document_id != claim_document_id:
+                self.record_event('UNEXPECTED_DOCUMENT', claim_document_id, document_id, where)
                 return False
         return True
 
@@ -220,18 +300,14 @@ class Validator(Object):
             if claim_condition not in queries.get('conditions'):
                 self.record_event('UNKNOWN_CLAIM_CONDITION', claim_condition, entry.get('where'))
                 return False
-            query_condition = queries.get('conditions').get(claim_condition)
-            key = 'query_claim_frames' if query_condition.get('query_claim_frames') else 'topics'
-            if claim_query_topic_or_claim_frame_id not in query_condition.get(key):
-                self.record_event('UNKNOWN_CLAIM_QUERY_TOPIC_OR_CLAIM_FRAME_ID', key, claim_query_topic_or_claim_frame_id, entry.get('where'))
-                return False
+            return self.validate_claim_query_scope(queries, claim_condition, claim_query_topic_or_claim_frame_id, entry.get('where'))
         return True
 
     def validate_entity_type_in_response(self, responses, schema, entry, attribute):
         entity_type_in_query = entry.get('query').get('entity_type')
         entity_type_in_response = entry.get('entity_type_in_response')
-        expected_entity_type = '{0} or {0}.*'.format(entity_type_in_query)
         if not types_are_compatible(entity_type_in_query, entity_type_in_response):
+            expected_entity_type = '{0} or {0}.*'.format(entity_type_in_query)
             self.record_event('UNEXPECTED_ENTITY_TYPE', expected_entity_type, entity_type_in_response, entry.get('where'))
         return True
 
@@ -245,19 +321,19 @@ class Validator(Object):
     def validate_importance_value(self, responses, schema, entry, attribute):
         importance_value = entry.get(attribute.get('name'))
         try:
-            value = trim_cv(importance_value)
+            trim_cv(importance_value)
         except ValueError:
             self.record_event('INVALID_IMPORTANCE_VALUE', importance_value, entry.get('where'))
             return False
         return True
 
     def validate_metatype(self, responses, schema, entry, attribute):
-        allowed_metatypes = ['Entity', 'Relation', 'Event']
-        metatype = entry.get(attribute.get('name'))
+        attribute_name = attribute.get('name')
+        metatype = entry.get(attribute_name)
         if metatype not in allowed_metatypes:
             self.record_event('INVALID_METATYPE', metatype, ','.join(allowed_metatypes), entry.get('where'))
             return False
-        if attribute.get('name') in ['subject_cluster_member_metatype', 'subject_metatype'] and metatype == 'Entity':
+        if metatype == 'Entity' and attribute_name in ['subject_cluster_member_metatype', 'subject_metatype']:
             self.record_event('UNEXPECTED_VALUE', 'metatype', metatype, entry.get('where'))
             return False
         cluster = entry.get('cluster')
@@ -266,10 +342,6 @@ class Validator(Object):
             return False
         return True
 
-    def validate_negation_status(self, responses, schema, entry, attribute):
-        allowed_values = ['Negated', 'NotNegated']
-        return self.validate_set_membership('negation_status', allowed_values, entry.get(attribute.get('name')), entry.get('where'))
-
     def validate_object_type(self, responses, schema, entry, attribute):
         # Do not validate object type in Phase 3
         return True
@@ -279,15 +351,13 @@ class Validator(Object):
         return True
 
     def validate_provenance_format(self, provenance, where):
-        if len(provenance.split(':')) != 3:
+        """
+        Returns the parsed provenance, or None after reporting INVALID_PROVENANCE_FORMAT.
+        """
+        parsed = self.parse_provenance(provenance)
+        if parsed is None:
             self.record_event('INVALID_PROVENANCE_FORMAT', provenance, where)
-            return False
-        pattern = re.compile('^(\w+?):(\w+?):\((\S+),(\S+)\)-\((\S+),(\S+)\)$')
-        match = pattern.match(provenance)
-        if not match:
-            self.record_event('INVALID_PROVENANCE_FORMAT', provenance, where)
-            return False
-        return True
+        return parsed
 
     def validate_query_topic(self, responses, schema, entry, attribute):
         query_topic = entry.get(attribute.get('name'))
@@ -312,27 +382,17 @@ class Validator(Object):
 
     def validate_entries_in_cluster(self, responses, schema, entry, attribute):
         cluster = entry.get(attribute.get('name'))
-        valid = False
-        for entry in cluster.get('entries').values():
-            if entry.get('valid'):
-                valid = True
-        return valid
+        return any(cluster_entry.get('valid') for cluster_entry in cluster.get('entries').values())
 
     def validate_before_and_after_dates(self, responses, schema, entry, attribute, start_or_end_before, before, start_or_end_after, after):
-        valid = True
-        problem_field = None
-        if before.get('year') < after.get('year'):
-            problem_field = 'year'
-            valid = False
-        elif before.get('year') == after.get('year'):
-            if before.get('month') and after.get('month'):
-                if before.get('month') < after.get('month'):
-                    problem_field = 'month'
-                    valid = False
-                elif before.get('month') == after.get('month'):
-                    if before.get('day') and after.get('day') and before.get('day') < after.get('day'):
-                        problem_field = 'day'
-                        valid = False
+        # compare (year, month, day) in one step, using month and day only while both dates provide them
+        before_date, after_date = [before.get('year')], [after.get('year')]
+        for field_name in ['month', 'day']:
+            before_value, after_value = before.get(field_name), after.get(field_name)
+            if not (before_value and after_value): break
+            before_date.append(before_value)
+            after_date.append(after_value)
+        valid = not before_date < after_date
         if not valid:
             if schema.get('name') in ['AIDA_PHASE3_TASK3_CT_RESPONSE', 'AIDA_PHASE3_TASK3_TM_RESPONSE']:
                 self.record_event('INVALID_DATE_RANGE', 'Claim', entry.get('claim_uid'), start_or_end_after, start_or_end_before, entry.get('where'))
@@ -342,9 +402,10 @@ class Validator(Object):
 
     def validate_date_start_and_end(self, responses, schema, entry, attribute):
         valid = True
-        if entry.get('date'):
-            start = entry.get('date').get('start')
-            end = entry.get('date').get('end')
+        date = entry.get('date')
+        if date:
+            start = date.get('start')
+            end = date.get('end')
             if start and end:
                 start_after = start.get('after')
                 end_before = end.get('before')
@@ -360,9 +421,7 @@ class Validator(Object):
             month = date_object.get('month')
             day = date_object.get('day')
             if year and month and day:
-                try:
-                    datetime.date(int(year), int(month), int(day))
-                except:
+                if not is_valid_date(year, month, day):
                     self.record_event('INVALID_DATE', entry.get('cluster_id'), attribute.get('name'), 'date', entry.get('where'))
                     return False
             elif year < 0:
@@ -374,32 +433,38 @@ class Validator(Object):
         return valid
 
     def validate_date_range(self, responses, schema, entry, attribute):
-        after = entry.get('{}_after'.format(attribute.get('name')))
-        before = entry.get('{}_before'.format(attribute.get('name')))
+        attribute_name = attribute.get('name')
+        after_name = '{}_after'.format(attribute_name)
+        before_name = '{}_before'.format(attribute_name)
+        after = entry.get(after_name)
+        before = entry.get(before_name)
         valid = True
         if after and before:
-            valid = self.validate_before_and_after_dates(responses, schema, entry, attribute, '{}_before'.format(attribute.get('name')), before, '{}_after'.format(attribute.get('name')), after)
+            valid = self.validate_before_and_after_dates(responses, schema, entry, attribute, before_name, before, after_name, after)
         return valid
 
     def validate_value_provenance_triple(self, responses, schema, entry, attribute):
+        attribute_name = attribute.get('name')
         return self.validate_provenance(responses,
                                          schema,
                                          entry,
-                                         attribute.get('name'),
-                                         entry.get(attribute.get('name')),
+                                         attribute_name,
+                                         entry.get(attribute_name),
                                          apply_correction=True)
 
     def validate_value_provenance_triples(self, responses, schema, entry, attribute):
-        provenances = entry.get(attribute.get('name')).split(';')
+        attribute_name = attribute.get('name')
+        value = entry.get(attribute_name)
+        provenances = value.split(';')
         apply_correction = True if len(provenances) == 1 else False
         if len(provenances) > 2:
-            self.record_event('IMPROPER_COMPOUND_JUSTIFICATION', entry.get(attribute.get('name')), entry.get('where'))
+            self.record_event('IMPROPER_COMPOUND_JUSTIFICATION', value, entry.get('where'))
             return False
         for provenance in provenances:
             if not self.validate_provenance(responses,
                                             schema,
                                             entry,
-                                            attribute.get('name'),
+                                            attribute_name,
                                             provenance,
                                             apply_correction=apply_correction):
                 return False
@@ -407,22 +472,20 @@ class Validator(Object):
 
     def validate_provenance(self, responses, schema, entry, attribute_name, provenance, apply_correction):
         where = entry.get('where')
+        task = schema.get('task')
 
-        if schema.get('task') == 'task3' and attribute_name == 'subject_informative_justification_span_text' and provenance == 'NULL':
-            return True
-
-        if schema.get('task') == 'task3' and attribute_name == 'predicate_justification_spans_text' and provenance == 'NULL':
+        if provenance == 'NULL' and task == 'task3' and attribute_name in ['subject_informative_justification_span_text', 'predicate_justification_spans_text']:
             return True
 
-        if not self.validate_provenance_format(provenance, where):
+        parsed = self.validate_provenance_format(provenance, where)
+        if parsed is None:
             return False
 
-        document_id, document_element_id, keyframe_num, start_x, start_y, end_x, end_y = self.parse_provenance(provenance)
+        document_id, document_element_id, keyframe_num, start_x, start_y, end_x, end_y = parsed
 
         # check if the document element has file extension appended to it
         # if so, report warning, and apply correction
-        extensions = tuple(['.' + extension for extension in responses.get('document_mappings').get('encodings')])
-        if document_element_id.endswith(extensions):
+        if document_element_id.endswith(self.get('extensions', responses)):
             if apply_correction:
                 self.record_event('ID_WITH_EXTENSION', 'document element id', document_element_id, where)
                 document_element_id = os.path.splitext(document_element_id)[0]
@@ -432,12 +495,14 @@ class Validator(Object):
                 self.record_event('ID_WITH_EXTENSION_ERROR', 'document element id', document_element_id, where)
                 return False
 
-        if document_id != entry.get('document_id'):
-            self.record_event('MULTIPLE_DOCUMENTS', document_id, entry.get('document_id'), where)
+        entry_document_id = entry.get('document_id')
+        if document_id != entry_document_id:
+            self.record_event('MULTIPLE_DOCUMENTS', document_id, entry_document_id, where)
             return False
 
-        documents = responses.get('document_mappings').get('documents')
-        document_elements = responses.get('document_mappings').get('document_elements')
+        document_mappings = responses.get('document_mappings')
+        documents = document_mappings.get('documents')
+        document_elements = document_mappings.get('document_elements')
 
         if document_id not in documents:
             self.record_event('UNKNOWN_ITEM', 'document', document_id, where)
@@ -454,11 +519,12 @@ class Validator(Object):
             self.record_event('UNKNOWN_MODALITY', document_element_id, where)
             return False
 
+        document_boundaries = responses.get('document_boundaries')
         keyframe_id = None
         if modality == 'video':
             if keyframe_num:
                 keyframe_id = '{}_{}'.format(document_element_id, keyframe_num)
-                if keyframe_id not in responses.get('keyframe_boundaries'):
+                if keyframe_id not in document_boundaries.get('keyframe'):
                     self.record_event('MISSING_ITEM_WITH_KEY', 'KeyFrameID', keyframe_id, where)
                     return False
 
@@ -473,16 +539,21 @@ class Validator(Object):
         #  (a) a video mention of an entity was asserted using VideoJustification, or
         #  (b) a video mention of an relation/event was asserted using KeyFrameVideoJustification
         # Updating the following for Phase 3 is unnecessary since there are no videos in the collection
-        if entry.get('schema').get('name') in ['AIDA_PHASE2_TASK1_CM_RESPONSE', 'AIDA_PHASE2_TASK2_ZH_RESPONSE'] and modality == 'video':
-            if keyframe_id and entry.get('metatype') != 'Entity':
-                self.record_event('UNEXPECTED_JUSTIFICATION', provenance, entry.get('metatype'), entry.get('cluster_id'), 'KeyFrameVideoJustification', entry.get('where'))
+        if modality == 'video' and entry.get('schema').get('name') in ['AIDA_PHASE2_TASK1_CM_RESPONSE', 'AIDA_PHASE2_TASK2_ZH_RESPONSE']:
+            metatype = entry.get('metatype')
+            if keyframe_id and metatype != 'Entity':
+                self.record_event('UNEXPECTED_JUSTIFICATION', provenance, metatype, entry.get('cluster_id'), 'KeyFrameVideoJustification', where)
                 return False
-            elif not keyframe_id and entry.get('metatype') not in ['Relation', 'Event']:
-                self.record_event('UNEXPECTED_JUSTIFICATION', provenance, entry.get('metatype'), entry.get('cluster_id'), 'VideoJustification', entry.get('where'))
+            elif not keyframe_id and metatype not in ['Relation', 'Event']:
+                self.record_event('UNEXPECTED_JUSTIFICATION', provenance, metatype, entry.get('cluster_id'), 'VideoJustification', where)
                 return False
 
-        document_element_boundary = responses.get('{}_boundaries'.format('keyframe' if modality=='video' and keyframe_id else modality)).get(keyframe_id if modality == 'video' and keyframe_id else document_element_id)
-        span = Span(self.logger, start_x, start_y, end_x, end_y)
+        if modality == 'video' and keyframe_id:
+            document_element_boundary = document_boundaries.get('keyframe').get(keyframe_id)
+        else:
+            document_element_boundary = document_boundaries.get(modality).get(document_element_id)
+        span = self.provenance_span
+        span.reset(start_x, start_y, end_x, end_y)
         if not document_element_boundary.validate(span):
             corrected_span = document_element_boundary.get('corrected_span', span)
             if corrected_span is None or not apply_correction:
@@ -494,17 +565,24 @@ class Validator(Object):
         return True
     
     def validate_confidence(self, responses, schema, entry, attribute):
-        confidence_value = entry.get(attribute.get('name'))
-        if schema.get('task') == 'task3' and schema.get('name') == 'AIDA_PHASE2_TASK3_GR_RESPONSE' and attribute.get('name') == 'predicate_justification_confidence' and confidence_value == 'NULL':
+        attribute_name = attribute.get('name')
+        confidence_value = entry.get(attribute_name)
+        if confidence_value == 'NULL' and attribute_name == 'predicate_justification_confidence' and schema.get('task') == 'task3' and schema.get('name') == 'AIDA_PHASE2_TASK3_GR_RESPONSE':
             return True
         try:
             value = trim_cv(confidence_value)
         except ValueError:
-            self.record_event('INVALID_CONFIDENCE', entry.get(attribute.get('name')), entry.get('where'))
+            self.record_event('INVALID_CONFIDENCE', confidence_value, entry.get('where'))
             value = 1.0
-            entry.set(attribute.get('name'), '"{value}"'.format(value=value))
+            entry.set(attribute_name, '"{value}"'.format(value=value))
         if not 0 < value <= 1:
             self.record_event('INVALID_CONFIDENCE', value, entry.get('where'))
             value = 1.0
-            entry.set(attribute.get('name'), '"{value}"'.format(value=value))
-        return True
\ No newline at end of file
+            entry.set(attribute_name, '"{value}"'.format(value=value))
+        return True
+
+def get_validator_names():
+    """
+    Returns the names of the validators that schemas can refer to.
+    """
+    return set(set_membership_validators) | {name for name in dir(Validator) if name.startswith('validate_')}
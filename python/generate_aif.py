@@ -30,6 +30,36 @@ ALLOK_EXIT_CODE = 0
 ERROR_EXIT_CODE = 255
 GENERATE_BLANK_NODE = True
 
+# the annotation files, or worksheets, loaded for each task, mapped to the names under which they are stored
+TA1_INCLUDE_FILES = {
+    'arg_mentions.tab':            'argument_KEs',
+    'evt_mentions.tab':            'event_KEs',
+    'rel_mentions.tab':            'relation_KEs',
+    'evt_slots.tab':               'event_slots',
+    'rel_slots.tab':               'relation_slots',
+    'kb_linking.tab':              'kb_links',
+    }
+TA3_INCLUDE_FILES = {
+    'claim_frames.tab':            'claims',
+    'arg_kes.tab':                 'argument_KEs',
+    'evt_kes.tab':                 'event_KEs',
+    'rel_kes.tab':                 'relation_KEs',
+    'evt_slots.tab':               'event_slots',
+    'rel_slots.tab':               'relation_slots',
+    'kb_linking.tab':              'kb_links',
+    'cross_claim_relations.tab':   'cross_claim_relations'
+    }
+TA3_INCLUDE_WORKSHEETS = {
+    'TA3_arg_KEs':                 'argument_KEs',
+    'TA3_evt_KEs':                 'event_KEs',
+    'TA3_rel_KEs':                 'relation_KEs',
+    'TA3_evt_slots':               'event_slots',
+    'TA3_rel_slots':               'relation_slots',
+    'TA3_kb_linking':              'kb_links',
+    'ClaimFrameTemplate Examples': 'claims',
+    'TA3_cross_claim_relations.tab E': 'cross_claim_relations'
+    }
+
 def escape(s):
     return s.replace('"', '\\"') if '"' in s else s
 
@@ -2163,15 +2193,7 @@ class Task1(Object):
         global GENERATE_BLANK_NODE
         if self.get('noBlank'):
             GENERATE_BLANK_NODE = False
-        include_files = {
-            'arg_mentions.tab':            'argument_KEs',
-            'evt_mentions.tab':            'event_KEs',
-            'rel_mentions.tab':            'relation_KEs',
-            'evt_slots.tab':               'event_slots',
-            'rel_slots.tab':               'relation_slots',
-            'kb_linking.tab':              'kb_links',
-            }
-        annotations = TA1Annotations(logger, self.get('annotations'), include_items=include_files)
+        annotations = TA1Annotations(logger, self.get('annotations'), include_items=TA1_INCLUDE_FILES)
         encodings = Encodings(logger, self.get('encodings_filename'))
         document_mappings = DocumentMappings(logger, self.get('parent_children'), encodings)
         slot_mappings = LDCSlotTypeToNameMapping(logger, self.get('overlay'))
@@ -2223,15 +2245,7 @@ class Task2(Object):
         global GENERATE_BLANK_NODE
         if self.get('noBlank'):
             GENERATE_BLANK_NODE = False
-        include_files = {
-            'arg_mentions.tab':            'argument_KEs',
-            'evt_mentions.tab':            'event_KEs',
-            'rel_mentions.tab':            'relation_KEs',
-            'evt_slots.tab':               'event_slots',
-            'rel_slots.tab':               'relation_slots',
-            'kb_linking.tab':              'kb_links',
-            }
-        annotations = TA1Annotations(logger, self.get('annotations'), include_items=include_files)
+        annotations = TA1Annotations(logger, self.get('annotations'), include_items=TA1_INCLUDE_FILES)
         encodings = Encodings(logger, self.get('encodings_filename'))
         document_mappings = DocumentMappings(logger, self.get('parent_children'), encodings)
         aif = TA2AIF(logger, annotations, document_mappings)
@@ -2305,29 +2319,9 @@ class Task3(Object):
 
     def load_annotations(self, path):
         if os.path.isfile(path) and path.endswith('xlsx'):
-            include_worksheets = {
-                'TA3_arg_KEs':                 'argument_KEs',
-                'TA3_evt_KEs':                 'event_KEs',
-                'TA3_rel_KEs':                 'relation_KEs',
-                'TA3_evt_slots':               'event_slots',
-                'TA3_rel_slots':               'relation_slots',
-                'TA3_kb_linking':              'kb_links',
-                'ClaimFrameTemplate Examples': 'claims',
-                'TA3_cross_claim_relations.tab E': 'cross_claim_relations'
-                }
-            return TA3Annotations(self.get('logger'), self.get('annotations'), include_items=include_worksheets)
+            return TA3Annotations(self.get('logger'), self.get('annotations'), include_items=TA3_INCLUDE_WORKSHEETS)
         elif os.path.isdir(path):
-            include_files = {
-                'claim_frames.tab':            'claims',
-                'arg_kes.tab':                 'argument_KEs',
-                'evt_kes.tab':                 'event_KEs',
-                'rel_kes.tab':                 'relation_KEs',
-                'evt_slots.tab':               'event_slots',
-                'rel_slots.tab':               'relation_slots',
-                'kb_linking.tab':              'kb_links',
-                'cross_claim_relations.tab':   'cross_claim_relations'
-                }
-            return TA1Annotations(self.get('logger'), self.get('annotations'), include_items=include_files)
+            return TA1Annotations(self.get('logger'), self.get('annotations'), include_items=TA3_INCLUDE_FILES)
         else:
             self.record_event('UNEXPECTED_PATH', path)
 
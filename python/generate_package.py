@@ -1,7 +1,24 @@
 import argparse
 import datetime
-import subprocess
+import gzip
+import hashlib
 import os
+import tarfile
+
+class MD5Writer:
+    """
+    File-like wrapper that computes the MD5 hash of the bytes written through it.
+    """
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.md5 = hashlib.md5()
+
+    def write(self, data):
+        self.md5.update(data)
+        return self.fileobj.write(data)
+
+    def hexdigest(self):
+        return self.md5.hexdigest()
 
 def main(args):
     path = args.input
@@ -9,24 +26,28 @@ def main(args):
         path = path[:-1]
     if os.path.isdir(path):
         basename = os.path.basename(path)
-        dirname = os.path.dirname(path)
-        os.system('cd {dirname} && tar -zcf {basename}.tgz {basename}'.format(dirname=dirname,
-                                                                                  basename=basename))
-        result = subprocess.run(['md5', '-q', '{}.tgz'.format(path)], stdout=subprocess.PIPE)
-        md5hash = result.stdout.decode('utf-8').strip()
+        # the archive is hashed as it is written rather than read back afterwards
+        with open('{}.tgz'.format(path), 'wb') as fh:
+            writer = MD5Writer(fh)
+            with gzip.GzipFile(filename='', mode='wb', fileobj=writer, compresslevel=args.compresslevel) as gz:
+                with tarfile.open(fileobj=gz, mode='w|') as tar:
+                    tar.add(path, arcname=basename)
+        md5hash = writer.hexdigest()
         ctime = os.path.getctime('{path}.tgz'.format(path=path))
         ctimestamp = datetime.datetime.fromtimestamp(ctime).__str__()
         ctimestamp = ctimestamp.replace('-', '').replace(' ', '').replace(':', '')
         ctimestamp = ctimestamp[0:12]
-        os.system('mv {path}.tgz {path}_{ctimestamp}_{md5hash}.tgz'.format(path=path,
-                                                                                   ctimestamp=ctimestamp,
-                                                                                   md5hash=md5hash))
+        os.replace('{path}.tgz'.format(path=path),
+                   '{path}_{ctimestamp}_{md5hash}.tgz'.format(path=path,
+                                                              ctimestamp=ctimestamp,
+                                                              md5hash=md5hash))
         print('--package written to {path}_{ctimestamp}_{md5hash}.tgz'.format(path=path,
                                                                                       ctimestamp=ctimestamp,
                                                                                       md5hash=md5hash))
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="Package a directory.")
+    parser.add_argument('-c', '--compresslevel', type=int, choices=range(1, 10), default=1, help='Gzip compression level, from 1 (fastest) to 9 (smallest) (default: %(default)s)')
     parser.add_argument('input', type=str, help='Directory to be packaged')
     args = parser.parse_args()
     main(args)
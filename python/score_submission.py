@@ -50,7 +50,7 @@ class Task1(Object):
     """
     Class representing Task1 scorer.
     """
-    def __init__(self, log, runid, log_specifications, encodings, core_documents, parent_children, sentence_boundaries, image_boundaries, keyframe_boundaries, video_boundaries, gold, system, alignment, similarities, scores):
+    def __init__(self, log, workers, runid, log_specifications, encodings, core_documents, parent_children, sentence_boundaries, image_boundaries, keyframe_boundaries, video_boundaries, gold, system, alignment, similarities, scores):
         check_for_paths_existance([
                  log_specifications,
                  encodings,
@@ -68,6 +68,7 @@ class Task1(Object):
         check_for_paths_non_existance([scores])
         self.log_filename = log
         self.runid = runid
+        self.workers = workers
         self.log_specifications = log_specifications
         self.encodings = encodings
         self.core_documents = core_documents
@@ -109,6 +110,7 @@ class Task1(Object):
         cluster_self_similarities = ClusterSelfSimilarities(logger, self.get('similarities'))
         arguments = {
             'run_id': self.get('runid'),
+            'num_workers': self.get('workers'),
             'gold_responses': gold_responses,
             'system_responses': system_responses,
             'cluster_alignment': cluster_alignment,
@@ -125,6 +127,7 @@ class Task1(Object):
     def add_arguments(myclass, parser):
         parser.add_argument('-l', '--log', default='log.txt', help='Specify a file to which log output should be redirected (default: %(default)s)')
         parser.add_argument('-v', '--version', action='version', version='%(prog)s ' + __version__, help='Print version number and exit')
+        parser.add_argument('-w', '--workers', type=int, default=1, help='Specify the number of processes used to run the metric scorers (default: %(default)s)')
         parser.add_argument('log_specifications', type=str, help='File containing error specifications')
         parser.add_argument('encodings', type=str, help='File containing list of encoding to modality mappings')
         parser.add_argument('core_documents', type=str, help='File containing list of core documents')
@@ -146,7 +149,7 @@ class Task2(Object):
     """
     Class representing Task2 scorer.
     """
-    def __init__(self, log, runid, cutoff, normalize, weighted, log_specifications, encodings, core_documents, parent_children, sentence_boundaries, image_boundaries, keyframe_boundaries, video_boundaries, queries_to_score, assessments, responses, scores):
+    def __init__(self, log, workers, runid, cutoff, normalize, weighted, log_specifications, encodings, core_documents, parent_children, sentence_boundaries, image_boundaries, keyframe_boundaries, video_boundaries, queries_to_score, assessments, responses, scores):
         check_for_paths_existance([
                  log_specifications,
                  encodings,
@@ -164,6 +167,7 @@ class Task2(Object):
         check_for_paths_non_existance([scores])
         self.log_filename = log
         self.runid = runid
+        self.workers = workers
         self.cutoff = cutoff
         self.normalize = normalize
         self.weighted = weighted
@@ -207,6 +211,7 @@ class Task2(Object):
         responses = ResponseSet(logger, document_mappings, document_boundaries, self.get('responses'), self.get('runid'), task='task2')
         arguments = {
             'run_id': self.get('runid'),
+            'num_workers': self.get('workers'),
             'cutoff': self.get('cutoff'),
             'normalize': self.get('normalize'),
             'weighted': self.get('weighted'),
@@ -222,6 +227,7 @@ class Task2(Object):
     def add_arguments(myclass, parser):
         parser.add_argument('-l', '--log', default='log.txt', help='Specify a file to which log output should be redirected (default: %(default)s)')
         parser.add_argument('-v', '--version', action='version', version='%(prog)s ' + __version__, help='Print version number and exit')
+        parser.add_argument('-w', '--workers', type=int, default=1, help='Specify the number of processes used to run the metric scorers (default: %(default)s)')
         parser.add_argument('-C', '--cutoff', action='store_true', help='Apply cutoff?')
         parser.add_argument('-N', '--normalize', action='store_true', help='Normalize confidences?')
         parser.add_argument('-W', '--weighted', action='store_true', help='Use weighted Value for AP computation?')
@@ -245,7 +251,7 @@ class Task3(Object):
     """
     Class representing Task3 scorer.
     """
-    def __init__(self, log, runid, log_specifications, encodings, core_documents, parent_children, sentence_boundaries, image_boundaries, keyframe_boundaries, video_boundaries, queries, queries_to_score, query_claim_frames, claim_mappings, assessments, responses, assessments_wc, scores):
+    def __init__(self, log, workers, runid, log_specifications, encodings, core_documents, parent_children, sentence_boundaries, image_boundaries, keyframe_boundaries, video_boundaries, queries, queries_to_score, query_claim_frames, claim_mappings, assessments, responses, assessments_wc, scores):
         check_for_paths_existance([
                  log_specifications,
                  encodings,
@@ -265,6 +271,7 @@ class Task3(Object):
         check_for_paths_non_existance([assessments_wc, scores])
         self.log_filename = log
         self.runid = runid
+        self.workers = workers
         self.log_specifications = log_specifications
         self.encodings = encodings
         self.core_documents = core_documents
@@ -324,6 +331,7 @@ class Task3(Object):
         assessments = Assessments(logger, 'task3', queries_to_score, claims_dir, claim_mappings=self.get('claim_mappings'), claim_relations=claim_relations)
         arguments = {
             'run_id': self.get('runid'),
+            'num_workers': self.get('workers'),
             'assessments': assessments,
             'responses_dir': self.get('responses'),
             'queries_to_score': queries_to_score,
@@ -336,6 +344,7 @@ class Task3(Object):
     def add_arguments(myclass, parser):
         parser.add_argument('-l', '--log', default='log.txt', help='Specify a file to which log output should be redirected (default: %(default)s)')
         parser.add_argument('-v', '--version', action='version', version='%(prog)s ' + __version__, help='Print version number and exit')
+        parser.add_argument('-w', '--workers', type=int, default=1, help='Specify the number of processes used to run the metric scorers (default: %(default)s)')
         parser.add_argument('log_specifications', type=str, help='File containing error specifications')
         parser.add_argument('encodings', type=str, help='File containing list of encoding-to-modality mappings')
         parser.add_argument('core_documents', type=str, help='File containing list of core documents')
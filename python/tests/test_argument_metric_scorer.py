@@ -0,0 +1,86 @@
+"""
+Tests for the Argument Extraction metric scorer V1, whose TRFs V2 shares.
+"""
+
+from aida.argument_metric_v1_scorer import ArgumentMetricScorerV1
+from aida.container import Container
+from aida.logger import Logger
+from aida.object import Object
+import os
+import tempfile
+import unittest
+
+log_specifications = os.path.join(os.path.dirname(__file__), '..', 'input', 'aux_data', 'log_specifications.txt')
+
+def make_object(logger, **kwargs):
+    obj = Object(logger)
+    for key, value in kwargs.items():
+        obj.set(key, value)
+    return obj
+
+def make_container(logger, items):
+    container = Container(logger)
+    for key, value in items.items():
+        container.add(key=key, value=value)
+    return container
+
+class TestArgumentMetricScorer(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.logger = Logger(os.path.join(self.directory.name, 'log.txt'), log_specifications, ['test'])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def get_responses(self, role_fillers, core_documents=None):
+        logger = self.logger
+        frame = make_object(logger,
+                            metatype='Event',
+                            types={'Conflict.Attack'},
+                            role_filler_tuples=role_fillers)
+        document_mappings = make_object(logger,
+                                        core_documents=core_documents,
+                                        documents=make_container(logger, {'D1': make_object(logger, language='ENG')}))
+        return make_object(logger,
+                           document_mappings=document_mappings,
+                           document_frames=make_container(logger, {'D1': make_container(logger, {'E1': frame})}))
+
+    def score(self, scorer_class):
+        logger = self.logger
+        # the frame has two role fillers, one of which aligns with the system's
+        gold_responses = self.get_responses([('Attacker', 'G1', 'D1:0-10'),
+                                             ('Target', 'G2', 'D1:20-30'),
+                                             ('Target', 'G2', 'D1:40-50')],
+                                            core_documents=['D1'])
+        system_responses = self.get_responses([('Attacker', 'S1', 'D1:0-10'),
+                                               ('Target', 'S2', 'D1:20-30')])
+        gold_to_system = make_container(logger, {'D1': make_container(logger, {'G1': make_object(logger, aligned_to='S1'),
+                                                                              'G2': make_object(logger, aligned_to=None)})})
+        cluster_alignment = make_object(logger, gold_to_system=gold_to_system)
+        scorer = scorer_class(logger,
+                              run_id='run',
+                              gold_responses=gold_responses,
+                              system_responses=system_responses,
+                              cluster_alignment=cluster_alignment)
+        return {score.get('metatype'): score for score in scorer.get('scores').values()
+                if score.get('document_id') == 'D1'}
+
+    def test_v1_scores_document_with_several_role_fillers(self):
+        scores = self.score(ArgumentMetricScorerV1)
+        self.assertEqual(scores['ALL'].get('precision'), 0.5)
+        self.assertEqual(scores['ALL'].get('recall'), 0.5)
+        self.assertEqual(scores['Event'].get('f1'), 0.5)
+
+    def test_v1_groups_justifications_of_a_role_filler(self):
+        scorer = ArgumentMetricScorerV1.__new__(ArgumentMetricScorerV1)
+        scorer.logger = self.logger
+        scorer.gold_responses = self.get_responses([('Target', 'G2', 'D1:20-30'),
+                                                    ('Target', 'G2', 'D1:40-50')])
+        trfs = scorer.get('document_types_role_fillers', 'gold', 'D1')
+        self.assertEqual(len(trfs), 1)
+        trf = next(iter(trfs.values()))
+        self.assertEqual(len(trf.get('predicate_justifications')), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+Tests for the worksheets of an Excel workbook.
+"""
+
+from aida.excel_workbook import Worksheet
+from aida.logger import Logger
+import os
+import pandas as pd
+import tempfile
+import unittest
+
+log_specifications = os.path.join(os.path.dirname(__file__), '..', 'input', 'aux_data', 'log_specifications.txt')
+
+class TestWorksheet(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.logger = Logger(os.path.join(self.directory.name, 'log.txt'), log_specifications, ['test'])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assert_entries_match_iterrows(self, data_frame):
+        worksheet = Worksheet(self.logger, 'annotations.xlsx', 'sheet', data_frame)
+        entries = list(worksheet)
+        self.assertEqual(len(entries), len(data_frame))
+        for entry, (i, row) in zip(entries, data_frame.iterrows()):
+            self.assertEqual(entry.get('where'), {'filename': 'annotations.xlsx:sheet', 'lineno': i+1})
+            for column, value in row.items():
+                entry_value = entry.get(column.strip())
+                self.assertIs(type(entry_value), type(value))
+                if value == value:
+                    self.assertEqual(entry_value, value)
+
+    def test_mixed_columns(self):
+        self.assert_entries_match_iterrows(pd.DataFrame({'id ': ['A', 'B'], 'count': [1, 2], 'score': [0.5, None]}))
+
+    def test_numeric_columns(self):
+        self.assert_entries_match_iterrows(pd.DataFrame({'count': [1, 2], 'score': [0.5, 1.5]}))
+
+    def test_datetime_columns(self):
+        self.assert_entries_match_iterrows(pd.DataFrame({'start': pd.to_datetime(['2022-01-01', '2022-02-01'])}))
+
+    def test_empty_sheet(self):
+        self.assert_entries_match_iterrows(pd.DataFrame({'id': []}))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+Tests for the logger.
+"""
+
+from aida.logger import Logger
+import os
+import pickle
+import tempfile
+import unittest
+
+log_specifications = os.path.join(os.path.dirname(__file__), '..', 'input', 'aux_data', 'log_specifications.txt')
+
+class TestLogger(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.logger = Logger(os.path.join(self.directory.name, 'log.txt'), log_specifications, ['test'])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_pickle(self):
+        self.logger.record_event('DEFAULT_WARNING', 'before pickling')
+        logger = pickle.loads(pickle.dumps(self.logger))
+        self.assertEqual(logger.get_stats(), (1, 0))
+        self.assertEqual(logger.recorded, self.logger.recorded)
+        self.assertIsNot(logger.lock, self.logger.lock)
+        # the unpickled logger records events under its new lock
+        logger.record_event('DEFAULT_WARNING', 'after pickling')
+        logger.record_events([('DEFAULT_ERROR', ('in', 'a batch'), None)])
+        self.assertEqual(logger.get_stats(), (2, 1))
+
+    def test_collect_events(self):
+        logger = pickle.loads(pickle.dumps(self.logger))
+        events = logger.collect_events()
+        logger.record_event('DEFAULT_WARNING', 1.5, {'filename': 'f', 'lineno': 2}, classname='Scorer')
+        logger.record_events([('DEFAULT_ERROR', ('in', 'a batch'), None)])
+        self.assertEqual(logger.get_stats(), (0, 0))
+        self.assertEqual(events, [('DEFAULT_WARNING', ('1.5', {'filename': 'f', 'lineno': 2}), 'Scorer'),
+                                  ('DEFAULT_ERROR', ('in', 'a batch'), None)])
+        # the collected events are recorded by the logger they are returned to
+        self.logger.record_events(pickle.loads(pickle.dumps(events)))
+        self.assertEqual(self.logger.get_stats(), (1, 1))
+        self.assertIn('Scorer - DEFAULT_WARNING - Warning: 1.5', self.logger.recorded)
+
+if __name__ == '__main__':
+    unittest.main()
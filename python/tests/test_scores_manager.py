@@ -0,0 +1,69 @@
+"""
+Tests for the scores manager.
+"""
+
+from aida.container import Container
+from aida.logger import Logger
+from aida.scorer import Scorer
+from aida.scores_manager import ScoresManager
+from unittest import mock
+import os
+import tempfile
+import unittest
+
+log_specifications = os.path.join(os.path.dirname(__file__), '..', 'input', 'aux_data', 'log_specifications.txt')
+
+class CountingScorer(Scorer):
+    """
+    Scorer that records the number of items of its argument, and warns about it.
+    """
+
+    argument_name = None
+
+    def score_responses(self):
+        items = self.get(self.argument_name)
+        self.record_event('DEFAULT_WARNING', '{} {}'.format(len(items), self.argument_name))
+        self.scores = Container(self.get('logger'))
+        for item in items:
+            self.get('scores').add(key=item, value=self.get('run_id'))
+
+class QueriesScorer(CountingScorer):
+    argument_name = 'queries_to_score'
+
+class AssessmentsScorer(CountingScorer):
+    argument_name = 'assessments'
+
+class TestScoresManager(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.logger = Logger(os.path.join(self.directory.name, 'log.txt'), log_specifications, ['test'])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def score(self, num_workers):
+        metrics = {'task3': {'QueriesScorer': QueriesScorer, 'AssessmentsScorer': AssessmentsScorer}}
+        with mock.patch.dict(ScoresManager.task_metrics, metrics):
+            return ScoresManager(self.logger, 'task3', {'run_id': 'RUN1',
+                                                        'responses_dir': None,
+                                                        'assessments': ['A1', 'A2', 'A3'],
+                                                        'queries_to_score': ['Q1', 'Q2'],
+                                                        'num_workers': num_workers}).get('scores')
+
+    def test_score_responses_with_workers(self):
+        # the workers run first, so that the events counted are those they return
+        for num_workers in [2, None]:
+            scores = self.score(num_workers)
+            self.assertEqual(list(scores.get('QueriesScorer').keys()), ['Q1', 'Q2'])
+            self.assertEqual(list(scores.get('AssessmentsScorer').keys()), ['A1', 'A2', 'A3'])
+            for metric_scores in scores.values():
+                self.assertEqual(set(metric_scores.values()), {'RUN1'})
+                # the scores refer to the logger of this process rather than to a copy
+                self.assertIs(metric_scores.get('logger'), self.logger)
+            # the events recorded by the workers are counted by this process, and only once
+            self.assertEqual(self.logger.get_stats(), (2, 0))
+            self.assertIn('QueriesScorer - DEFAULT_WARNING - Warning: 2 queries_to_score', self.logger.recorded)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,10 +13,13 @@ from aida.encodings import Encodings
 from aida.core_documents import CoreDocuments
 from aida.document_mappings import DocumentMappings
 from aida.ta3_queryset import TA3QuerySet
+from aida.validator import get_validator_names
 from aida.text_boundaries import TextBoundaries
 from aida.image_boundaries import ImageBoundaries
 from aida.keyframe_boundaries import KeyFrameBoundaries
 from aida.video_boundaries import VideoBoundaries
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 import argparse
 import os
@@ -38,8 +41,25 @@ def check_path(args):
     check_for_paths_non_existance([args.output])
 
 def check_for_paths_existance(paths):
+    # list each parent directory once rather than stat every path; a path not found in the listing
+    # (e.g. differing in case on a case-insensitive filesystem, under an unreadable directory, or
+    # through a symbolic link followed by '..') is confirmed with os.path.exists before it is reported
+    names_by_dirname = defaultdict(set)
     for path in paths:
-        if not os.path.exists(path):
+        dirname, basename = os.path.split(os.path.normpath(path))
+        names_by_dirname[dirname].add(basename)
+    existing_paths = set()
+    for dirname, names in names_by_dirname.items():
+        try:
+            with os.scandir(dirname or os.curdir) as dir_entries:
+                for dir_entry in dir_entries:
+                    # a symbolic link exists only if its target does
+                    if dir_entry.name in names and (not dir_entry.is_symlink() or os.path.exists(dir_entry.path)):
+                        existing_paths.add(os.path.join(dirname, dir_entry.name))
+        except OSError:
+            pass
+    for path in paths:
+        if os.path.normpath(path) not in existing_paths and not os.path.exists(path):
             print('Error: Path {} does not exist'.format(path))
             exit(ERROR_EXIT_CODE)
 
@@ -53,23 +73,29 @@ def validate_responses(args):
     logger = Logger(args.log, args.log_specifications, sys.argv)
 
     logger.record_event('DEFAULT_INFO', 'validation started')
-    document_mappings = DocumentMappings(logger,
-                                         args.parent_children,
-                                         Encodings(logger, args.encodings),
-                                         CoreDocuments(logger, args.core_documents))
-    text_boundaries = TextBoundaries(logger, args.sentence_boundaries)
-    image_boundaries = ImageBoundaries(logger, args.image_boundaries)
-    video_boundaries = VideoBoundaries(logger, args.video_boundaries)
-    keyframe_boundaries = KeyFrameBoundaries(logger, args.keyframe_boundaries)
-    document_boundaries = {
-        'text': text_boundaries,
-        'image': image_boundaries,
-        'keyframe': keyframe_boundaries,
-        'video': video_boundaries
-        }
+    use_cache = args.cache
+    # the files are independent of each other, except that the document mappings need the encodings and core documents
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        encodings = executor.submit(Encodings, logger, args.encodings)
+        core_documents = executor.submit(CoreDocuments, logger, args.core_documents)
+        text_boundaries = executor.submit(TextBoundaries, logger, args.sentence_boundaries, use_cache=use_cache)
+        image_boundaries = executor.submit(ImageBoundaries, logger, args.image_boundaries, use_cache=use_cache)
+        video_boundaries = executor.submit(VideoBoundaries, logger, args.video_boundaries, use_cache=use_cache)
+        keyframe_boundaries = executor.submit(KeyFrameBoundaries, logger, args.keyframe_boundaries, use_cache=use_cache)
+        document_mappings = DocumentMappings(logger,
+                                             args.parent_children,
+                                             encodings.result(),
+                                             core_documents.result(),
+                                             use_cache=use_cache)
+        document_boundaries = {
+            'text': text_boundaries.result(),
+            'image': image_boundaries.result(),
+            'keyframe': keyframe_boundaries.result(),
+            'video': video_boundaries.result()
+            }
 
     queries = TA3QuerySet(logger, args.queries) if args.queries else None
-    responses = ResponseSet(logger, document_mappings, document_boundaries, args.input, args.runid, args.task, queries=queries)
+    responses = ResponseSet(logger, document_mappings, document_boundaries, args.input, args.runid, args.task, queries=queries, rules=args.rules)
     responses.write_valid_responses(args.output)
     num_warnings, num_errors = logger.get_stats()
     closing_message = 'validation finished (warnings:{}, errors:{})'.format(num_warnings, num_errors)
@@ -85,6 +111,8 @@ if __name__ == '__main__':
     parser.add_argument('-v', '--version', action='version', version='%(prog)s ' + __version__, help='Print version number and exit')
     parser.add_argument('-t', '--task', default='task1', choices=['task1', 'task2', 'task3'], help='Specify task1 or task2 or task3 (default: %(default)s)')
     parser.add_argument('-q', '--queries', help='Specify the directory containing task3 user queries')
+    parser.add_argument('-c', '--cache', action='store_true', help='Read and write caches of the parsed boundaries and parent-children mappings, kept in the user cache directory, to speed up later runs')
+    parser.add_argument('-r', '--rules', type=lambda rules: set(rules.split(',')), help='Specify a comma-separated list of validators (e.g. validate_provenance,validate_confidence) to apply, instead of all of them')
     parser.add_argument('log_specifications', type=str, help='File containing error specifications')
     parser.add_argument('encodings', type=str, help='File containing list of encoding to modality mappings')
     parser.add_argument('core_documents', type=str, help='File containing list of core documents to be included in the pool')
@@ -97,5 +125,9 @@ if __name__ == '__main__':
     parser.add_argument('input', type=str, help='Directory containing system responses.')
     parser.add_argument('output', type=str, help='Directory containing valid responses.')
     args = parser.parse_args()
+    if args.rules is not None:
+        unknown_rules = args.rules - get_validator_names()
+        if unknown_rules:
+            parser.error('unknown validators in --rules: {}'.format(', '.join(sorted(unknown_rules))))
     check_path(args)
     validate_responses(args)
\ No newline at end of file
@@ -9,13 +9,18 @@ __date__    = "7 December 2021"
 
 from aida.object import Object
 from aida.logger import Logger
-from generate_aif import TA1Annotations, TA3Annotations, LDCTimeRange, LDCTime
+from generate_aif import TA1Annotations, TA3Annotations, LDCTimeRange, LDCTime, TA1_INCLUDE_FILES, TA3_INCLUDE_FILES, TA3_INCLUDE_WORKSHEETS
 from aida.document_mappings import DocumentMappings
 from aida.encodings import Encodings
 from aida.file_handler import FileHandler
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import argparse
+import multiprocessing
 import os
 import re
+import stat
 import sys
 import textwrap
 import traceback
@@ -23,9 +28,88 @@ import traceback
 ALLOK_EXIT_CODE = 0
 ERROR_EXIT_CODE = 255
 
+# columns of the SPARQL output whose few distinct values repeat on most rows; they are interned
+# when loaded so that equal values share one string, and compare by identity
+interned_columns = frozenset(['?attributes', '?component_type', '?predicate', '?qnode_type', '?type'])
+
+# component values that Claim.__eq__ treats as not provided
+empty_na_values = frozenset(['EMPTY_NA'])
+empty_string_values = frozenset([''])
+
+# string representations of LDCTimeRange, keyed by the dates they were built from
+ldc_time_range_strings = {}
+
+# projections and annotation shared with the worker processes when the comparisons are run in parallel
+worker_projections = None
+worker_annotation = None
+
+def run_comparison(comparison):
+    """
+    Run the comparison in a worker process, and return the events it recorded.
+
+    The events are returned to the main process to be recorded there, in order.
+    """
+    events = worker_projections.get('logger').collect_events()
+    method_name, takes_annotation = comparison
+    method = getattr(worker_projections, method_name)
+    if takes_annotation:
+        method(worker_annotation)
+    else:
+        method()
+    return events
+
+def get_missing_items(projection_items, annotation_items):
+    """
+    Returns the items found on one side only, as a list of pairs of the items missing from a
+    side and the name of that side: first those missing from the projection, then those
+    missing from the annotation.
+
+    When a side is empty, the other side is returned as is rather than differenced.
+    """
+    if not projection_items:
+        return [(annotation_items, 'projection'), ((), 'annotation')]
+    if not annotation_items:
+        return [((), 'projection'), (projection_items, 'annotation')]
+    return [(annotation_items - projection_items, 'projection'),
+            (projection_items - annotation_items, 'annotation')]
+
 def dequotify(s):
     return None if s is None else s.replace('"', '')
 
+def descape(s):
+    return s.replace('\\', '').replace('"','')
+
+def get_ldc_time_range_string(logger, time):
+    """
+    Returns the string representation of the LDCTimeRange built from time; the same dates
+    recur across many mentions and claims, so each distinct range is built only once.
+    """
+    key = tuple(time.get(field_name) for field_name in ['start_date', 'start_date_type', 'end_date', 'end_date_type'])
+    if key not in ldc_time_range_strings:
+        ldc_time_range_strings[key] = LDCTimeRange(logger, time).__str__()
+    return ldc_time_range_strings[key]
+
+# the normalized strings are interned so that equal attributes, or types, share one string
+# and compare by identity, even when normalized from differently ordered raw values
+@lru_cache(maxsize=None)
+def normalize_attributes(value):
+    return sys.intern(','.join(sorted(v.strip().lower() for v in value.split(','))))
+
+@lru_cache(maxsize=None)
+def normalize_types(value):
+    return sys.intern(','.join(sorted(v.strip() for v in value.split(','))))
+
+def get_slot_type(entry):
+    # the few distinct slot types are interned to match the interned ?predicate of the SPARQL output
+    slot_type = entry.get('general_slot_type')
+    return slot_type if slot_type is None else sys.intern(slot_type)
+
+def get_claim_field_value(fields_to_compare, mapping, key, entry):
+    for field_name in fields_to_compare.get(key):
+        value = entry.get(field_name)
+        if value is not None:
+            return mapping.get(value) if value in mapping else descape(value)
+
 class Claims(Object):
     def __init__(self, logger, datatype, annotation_or_projection):
         self.logger = logger
@@ -41,40 +125,76 @@ class Claims(Object):
         return self.get('claims').get(claim_id)
 
     def load_annotation(self, annotation):
+        logger = self.get('logger')
+        claims = self.get('claims')
         for entry in annotation.get('worksheets').get('claims'):
-            claim = Claim(self.get('logger'), 'annotation', entry)
+            claim = Claim(logger, 'annotation', entry)
             claim.load_components()
             claim.load_date()
-            self.get('claims')[claim.get('claim_id')] = claim
+            claims[claim.get('claim_id')] = claim
 
     def load_projection(self, projection):
-        for entries in projection.get('projection').get('TA3_queryA.rq.tsv').values():
+        logger = self.get('logger')
+        claims = self.get('claims')
+        sparql_output = projection.get('projection')
+        for entries in sparql_output.get('TA3_queryA.rq.tsv').values():
             for entry in entries:
-                claim = Claim(self.get('logger'), 'projection', entry)
-                self.get('claims')[claim.get('claim_id')] = claim
-        for claim_components in projection.get('projection').get('TA3_queryB.rq.tsv').values():
+                claim = Claim(logger, 'projection', entry)
+                claims[claim.get('claim_id')] = claim
+        for claim_components in sparql_output.get('TA3_queryB.rq.tsv').values():
             for claim_component in claim_components:
-                claim_id = claim_component.get('?claim_id')
-                component_type = claim_component.get('?component_type')
-                name = dequotify(claim_component.get('?name'))
-                qnode_id = claim_component.get('?qnode_id')
-                qnode_type = claim_component.get('?qnode_type')
-                provenance = dequotify(claim_component.get('?provenance'))
-                ke = claim_component.get('?ke')
-                self.get('claim', claim_id).add_component(component_type,
-                                                          name,
-                                                          qnode_id,
-                                                          qnode_type,
-                                                          provenance,
-                                                          ke)
-        claims = projection.get('projection').get('TA3_queryC.rq.tsv')
-        for kb_id in claims:
+                get = claim_component.get
+                claims[get('?claim_id')].add_component(get('?component_type'),
+                                                       dequotify(get('?name')),
+                                                       get('?qnode_id'),
+                                                       get('?qnode_type'),
+                                                       dequotify(get('?provenance')),
+                                                       get('?ke'))
+        claim_dates_by_kb = sparql_output.get('TA3_queryC.rq.tsv')
+        for kb_id in claim_dates_by_kb:
             claim_id = kb_id.replace('.ttl', '')
-            claim_dates = claims.get(kb_id)
-            for claim_date in claim_dates:
-                self.get('claim', claim_id).add_date(claim_date)
+            for claim_date in claim_dates_by_kb.get(kb_id):
+                claims[claim_id].add_date(claim_date)
 
 class Claim(Object):
+    # values of the epistemic and sentiment statuses in the annotation, mapped to their values in the SPARQL output
+    status_mapping = {
+        'EpistemicTrueCertain': 'true-certain',
+        'EpistemicFalseCertain': 'false-certain',
+        'EpistemicTrueUncertain': 'true-uncertain',
+        'EpistemicFalseUncertain': 'false-uncertain',
+        'EpistemicUnknown': 'unknown',
+        'SentimentPositive': 'positive',
+        'SentimentNegative': 'negative',
+        'SentimentMixed': 'mixed',
+        'SentimentNeutralUnknown': 'neutral-unknown'
+        }
+    # fields compared by __eq__, mapped to the names of the field in the annotation and in the SPARQL output
+    fields_to_compare = {
+        'claim_template': ['claim_template', '?claim_template'],
+        'description': ['description', '?description'],
+        'epistemic_status': ['epistemic_status', '?epistemic_status'],
+        'root_uid': ['root_uid', '?root_uid'],
+        'sentiment_status': ['sentiment_status', '?sentiment_status'],
+        'subtopic': ['subtopic', '?subtopic'],
+        'topic': ['topic', '?topic']
+        }
+
+    # the component key, followed by the annotation fields holding the name, qnode id, qnode type,
+    # provenance and KE of the component, for each claim component read by load_components
+    component_fields = [(key,
+                         '{}{}'.format(component_type, postfix),
+                         'qnode_{}_identity{}'.format(component_type, postfix),
+                         'qnode_{}_type{}'.format(component_type, postfix),
+                         '{}_provenance{}'.format(component_type, postfix),
+                         '{}_ke{}'.format(component_type, postfix))
+                        for component_type, key, postfixes in [('claimer', 'claimer', ['']),
+                                                               ('claimer_affiliation', 'claimerAffiliation', ['', '_1', '_2']),
+                                                               ('claim_location', 'claimLocation', ['']),
+                                                               ('claim_medium', 'claimMedium', ['']),
+                                                               ('x_variable', 'xVariable', [''])]
+                        for postfix in postfixes]
+
     def __init__(self, logger, datatype, entry):
         self.logger = logger
         self.datatype = datatype
@@ -83,7 +203,8 @@ class Claim(Object):
         self.components = {}
 
     def get_claim_id(self):
-        claim_id = self.get('entry').get('claim_id') or self.get('entry').get('?claim_id')
+        entry = self.get('entry')
+        claim_id = entry.get('claim_id') or entry.get('?claim_id')
         if claim_id is not None:
             return claim_id
         self.record_event('CLAIM_ID_MISSING')
@@ -91,7 +212,10 @@ class Claim(Object):
     def add_component(self, component_type, name, qnode_id, qnode_type, provenance, ke):
         logger = self.get('logger')
         key = '{}:{}'.format(component_type, name)
-        component = self.get('components').setdefault(key, ClaimComponent(logger))
+        components = self.get('components')
+        component = components.get(key)
+        if component is None:
+            component = components[key] = ClaimComponent(logger)
         component.update(component_type=component_type,
                          name=name,
                          qnode_id=qnode_id,
@@ -106,77 +230,35 @@ class Claim(Object):
             self.record_event('MULTIPLE_CLAIM_DATES', self.get('claim_id'))
 
     def load_components(self):
-        def get_claim_component(entry, component_type, postfix):
-            return {
-                'componentName': dequotify(entry.get('{}{}'.format(component_type, postfix))),
-                'componentIdentity': entry.get('qnode_{}_identity{}'.format(component_type, postfix)),
-                'componentTypes': entry.get('qnode_{}_type{}'.format(component_type, postfix)),
-                'componentProvenance': dequotify(entry.get('{}_provenance{}'.format(component_type, postfix))),
-                'componentKE': entry.get('{}_ke{}'.format(component_type, postfix))
-                }
-        components = {
-            'claimer':               {'key':'claimer',               'component':{}, 'postfixes': ['']},
-            'claimer_affiliation':   {'key':'claimerAffiliation',    'component':{}, 'postfixes': ['', '_1', '_2']},
-            'claim_location':        {'key':'claimLocation',         'component':{}, 'postfixes': ['']},
-            'claim_medium':          {'key':'claimMedium',           'component':{}, 'postfixes': ['']},
-            'x_variable':            {'key':'xVariable',             'component':{}, 'postfixes': ['']},
-            }
-        for component_type in components:
-            key = components.get(component_type).get('key')
-            postfixes = components.get(component_type).get('postfixes')
-            for postfix in postfixes:
-                component = get_claim_component(self.get('entry'), component_type, postfix)
-                if component.get('componentName') == 'EMPTY_NA':
-                    continue
-                self.add_component(component_type=key,
-                                   name=component.get('componentName'),
-                                   qnode_id=component.get('componentIdentity'),
-                                   qnode_type=component.get('componentTypes'),
-                                   provenance=component.get('componentProvenance'),
-                                   ke=component.get('componentKE'))
+        entry = self.get('entry')
+        for key, name_field, qnode_id_field, qnode_type_field, provenance_field, ke_field in self.component_fields:
+            name = dequotify(entry.get(name_field))
+            if name == 'EMPTY_NA':
+                continue
+            self.add_component(component_type=key,
+                               name=name,
+                               qnode_id=entry.get(qnode_id_field),
+                               qnode_type=entry.get(qnode_type_field),
+                               provenance=dequotify(entry.get(provenance_field)),
+                               ke=entry.get(ke_field))
 
     def load_date(self):
         logger = self.get('logger')
         self.date = ClaimDateTime(logger, 'annotation', self.get('entry'))
 
     def __eq__(self, other):
-        def getvalue(fields_to_compare, mapping, key, claim):
-            def descape(s):
-                return s.replace('\\', '').replace('"','')
-            value = None
-            for field_name in fields_to_compare.get(key):
-                value = claim.get('entry').get(field_name)
-                if value is not None:
-                    return mapping.get(value) if value in mapping else descape(value)
-        mapping = {
-            'EpistemicTrueCertain': 'true-certain',
-            'EpistemicFalseCertain': 'false-certain',
-            'EpistemicTrueUncertain': 'true-uncertain',
-            'EpistemicFalseUncertain': 'false-uncertain',
-            'EpistemicUnknown': 'unknown',
-            'SentimentPositive': 'positive',
-            'SentimentNegative': 'negative',
-            'SentimentMixed': 'mixed',
-            'SentimentNeutralUnknown': 'neutral-unknown'
-            }
-        fields_to_compare = {
-            'claim_template': ['claim_template', '?claim_template'],
-            'description': ['description', '?description'],
-            'epistemic_status': ['epistemic_status', '?epistemic_status'],
-            'root_uid': ['root_uid', '?root_uid'],
-            'sentiment_status': ['sentiment_status', '?sentiment_status'],
-            'subtopic': ['subtopic', '?subtopic'],
-            'topic': ['topic', '?topic']
-            }
+        mapping = self.status_mapping
+        fields_to_compare = self.fields_to_compare
+        myentry, otherentry = self.entry, other.entry
         for key in fields_to_compare:
-            myvalue = getvalue(fields_to_compare, mapping, key, self)
-            othervalue = getvalue(fields_to_compare, mapping, key, other)
+            myvalue = get_claim_field_value(fields_to_compare, mapping, key, myentry)
+            othervalue = get_claim_field_value(fields_to_compare, mapping, key, otherentry)
             if myvalue != othervalue:
                 self.record_event('CLAIM_FIELD_MISMATCHED', self.get('claim_id'), key, myvalue, othervalue)
                 return False
-        mycomponents = self.get('components')
-        othercomponents = other.get('components')
-        keys = set(mycomponents.keys()).union(set(othercomponents.keys()))
+        mycomponents = self.components
+        othercomponents = other.components
+        keys = mycomponents.keys() | othercomponents.keys()
         for key in keys:
             mycomponent = mycomponents.get(key)
             othercomponent = othercomponents.get(key)
@@ -184,15 +266,18 @@ class Claim(Object):
                 if component is None:
                     self.record_event('CLAIM_FIELD_MISSING', self.get('claim_id'), key, annotation_or_projection)
                     return False
-            subkeys = set(mycomponent.get('values').keys()).union(othercomponent.get('values').keys())
+            myvalues_by_subkey, othervalues_by_subkey = mycomponent.values, othercomponent.values
+            mysignatures, othersignatures = mycomponent.signatures, othercomponent.signatures
+            subkeys = myvalues_by_subkey.keys() | othervalues_by_subkey.keys()
             for subkey in subkeys:
-                myvalues = mycomponent.get('values').get(subkey)
-                othervalues = othercomponent.get('values').get(subkey)
-                if subkey in ['provenance', 'ke'] and othervalues == set(['']):
+                myvalues = myvalues_by_subkey.get(subkey)
+                othervalues = othervalues_by_subkey.get(subkey)
+                if subkey in ['provenance', 'ke'] and othervalues == empty_string_values:
                     othervalues = None
-                if (myvalues is None or myvalues == set(['EMPTY_NA'])) and (othervalues is None or othervalues == set(['EMPTY_NA'])):
+                if (myvalues is None or myvalues == empty_na_values) and (othervalues is None or othervalues == empty_na_values):
                     continue
-                if myvalues is None or othervalues is None or myvalues != othervalues:
+                if myvalues is None or othervalues is None \
+                        or mysignatures[subkey] != othersignatures[subkey] or myvalues != othervalues:
                     field_name = '{}:{}'.format(key, subkey)
                     self.record_event('CLAIM_FIELD_MISMATCHED', self.get('claim_id'), field_name, myvalues, othervalues)
                     return False
@@ -204,7 +289,9 @@ class Claim(Object):
 class ClaimComponent(Object):
     def __init__(self, logger):
         self.logger = logger
-        self.values = {}
+        self.values = defaultdict(set)
+        # XOR of the hashes of the values of each field; sets with different signatures differ
+        self.signatures = {}
 
     def update(self, *args, **kwargs):
         for key, value in kwargs.items():
@@ -212,7 +299,10 @@ class ClaimComponent(Object):
 
     def update_field(self, key, value):
         if value is not None:
-            self.get('values').setdefault(key, set()).add(value)
+            values = self.get('values')[key]
+            if value not in values:
+                values.add(value)
+                self.signatures[key] = self.signatures.get(key, 0) ^ hash(value)
 
 class ClaimDateTime(Object):
     def __init__(self, logger, annotation_or_projection, entry):
@@ -260,94 +350,124 @@ class ClaimDateTime(Object):
         time.set('end_date', datestring)
         time.set('end_date_type', 'end{}'.format(attribute))
         time.set('where', self.get('where'))
-        self.datetime = LDCTimeRange(logger, time).__str__()
+        self.datetime = get_ldc_time_range_string(logger, time)
 
     def __eq__(self, other):
         return self.get('datetime') == other.get('datetime')
 
+    def __hash__(self):
+        return hash(self.get('datetime'))
+
     def __str__(self):
         return self.get('datetime').__str__()
 
 class Mention(Object):
+    # the span fields, mapped to the names of the fields of the entry they are read from;
+    # shared by all mentions as a mention is built for every mention entry compared
+    fields = {
+        'docid': ('?root_uid', 'root_uid'),
+        'doceid': ('?child_uid', 'child_uid'),
+        'start_x': ('start_x', '?textoffset_startchar', 'textoffset_startchar'),
+        'start_y': ('start_y',),
+        'end_x': ('end_x', '?textoffset_endchar', 'textoffset_endchar'),
+        'end_y': ('end_y',)
+        }
+    mention_id_fields = ('argmention_id', 'eventmention_id', 'relationmention_id')
+    mediamention_coordinates_fields = ('mediamention_coordinates', '?mediamention_coordinates')
+
     def __init__(self, logger, document_mappings, entry):
         super().__init__(logger)
         self.entry = entry
         self.document_mappings = document_mappings
         self.augment()
-        self.fields = {
-            'docid': ['?root_uid', 'root_uid'],
-            'doceid': ['?child_uid', 'child_uid'],
-            'start_x': ['start_x', '?textoffset_startchar', 'textoffset_startchar'],
-            'start_y': ['start_y'],
-            'end_x': ['end_x', '?textoffset_endchar', 'textoffset_endchar'],
-            'end_y': ['end_y']
-            }
         self.span = {'start_y': '0', 'end_y': '0'}
         self.where = entry.get('where')
         self.load()
-        if self.is_empty():
+        if self.empty:
             self.record_event('EMPTY_MENTION', self.get('mention_id'), self.get('where'))
 
     def get_mention_id(self):
-        field_names = ['argmention_id', 'eventmention_id', 'relationmention_id']
-        for fn in field_names:
-            value = self.get('entry').get(fn)
+        entry = self.get('entry')
+        for fn in self.mention_id_fields:
+            value = entry.get(fn)
             if value:
                 return value
 
     def augment(self):
         mediamention_coordinates = None
-        fields = ['mediamention_coordinates', '?mediamention_coordinates']
-        for field_name in fields:
-            value = self.get('entry').get(field_name)
+        entry = self.get('entry')
+        for field_name in self.mediamention_coordinates_fields:
+            value = entry.get(field_name)
             if value and value != 'EMPTY_NA':
                 mediamention_coordinates = value
                 ulx, uly, lrx, lry = mediamention_coordinates.split(',')
-                self.get('entry').set('start_x', ulx)
-                self.get('entry').set('start_y', uly)
-                self.get('entry').set('end_x', lrx)
-                self.get('entry').set('end_y', lry)
+                entry.set('start_x', ulx)
+                entry.set('start_y', uly)
+                entry.set('end_x', lrx)
+                entry.set('end_y', lry)
                 return
 
     def load(self):
         def trim(s):
-            return s.replace('"', '')
-        for key in self.get('fields'):
-            for field_name in self.get('fields').get(key):
-                value = self.get('entry').get(field_name)
+            return sys.intern(s.replace('"', ''))
+        entry = self.entry
+        span = self.span
+        for key, field_names in self.fields.items():
+            for field_name in field_names:
+                value = entry.get(field_name)
                 if value and value != 'EMPTY_NA':
-                    self.get('span')[key] = trim(value)
+                    span[key] = trim(value)
         if self.is_empty():
-            self.get('entry').set('child_uid', self.get('document_mappings').get('text_document', self.get('entry').get('root_uid')).get('ID'))
-            self.get('entry').set('textoffset_startchar', '0')
-            self.get('entry').set('textoffset_endchar', '0')
-            self.load()
+            # default to the whole text document; the defaults are the last fields
+            # looked up for doceid, start_x and end_x, so they are applied directly
+            child_uid = self.get('document_mappings').get('text_document', entry.get('root_uid')).get('ID')
+            entry.set('child_uid', child_uid)
+            entry.set('textoffset_startchar', '0')
+            entry.set('textoffset_endchar', '0')
+            if child_uid and child_uid != 'EMPTY_NA':
+                span['doceid'] = trim(child_uid)
+            span['start_x'] = '0'
+            span['end_x'] = '0'
+        # the emptiness and the string form are fixed once the span is loaded
+        self.empty = self.is_empty()
+        self.mention_string = self.get('formatted_mention')
 
     def is_empty(self):
-        for field_name in self.get('fields'):
-            value = self.get('span').get(field_name)
+        span = self.span
+        for field_name in self.fields:
+            value = span.get(field_name)
             if value is None or value == 'EMPTY_NA':
                 return True
+        return False
 
-    def __str__(self):
-        if self.is_empty():
+    def get_formatted_mention(self):
+        if self.empty:
             return
         predicate_justification = self.get('entry').get('?predicate_justification')
         if predicate_justification:
             return predicate_justification
         return '{docid}:{doceid}:({start_x},{start_y})-({end_x},{end_y})'.format(**self.get('span'))
 
+    def __str__(self):
+        return self.get('mention_string')
+
 class Attributes(Object):
     def __init__(self, logger, entry):
         super().__init__(logger)
         self.entry = entry
+        # normalized once, and used for comparing, hashing and reporting
+        self.attributes = self.get('normalized_attributes')
 
     def __eq__(self, other):
-        if self.__str__() == other.__str__():
-            return True
-        return False
+        return self.attributes == other.attributes
+
+    def __hash__(self):
+        return hash(self.attributes)
 
     def __str__(self):
+        return self.attributes
+
+    def get_normalized_attributes(self):
         entry = self.get('entry')
         field_names = ['?attributes', 'attribute']
         for field_name in field_names:
@@ -356,21 +476,25 @@ class Attributes(Object):
                 break
         if value is None:
             return ''
-        values = [v.strip().lower() for v in value.split(',')]
-        attributes = ','.join(sorted(values))
-        return attributes
+        return normalize_attributes(value)
 
 class Types(Object):
     def __init__(self, logger, entry):
         super().__init__(logger)
         self.entry = entry
+        # normalized once, and used for comparing, hashing and reporting
+        self.types = self.get('normalized_types')
 
     def __eq__(self, other):
-        if self.__str__() == other.__str__():
-            return True
-        return False
+        return self.types == other.types
+
+    def __hash__(self):
+        return hash(self.types)
 
     def __str__(self):
+        return self.types
+
+    def get_normalized_types(self):
         entry = self.get('entry')
         field_names = ['?type', 'qnode_type_id']
         for field_name in field_names:
@@ -379,9 +503,7 @@ class Types(Object):
                 break
         if value is None:
             return ''
-        values = [v.strip() for v in value.split(',')]
-        attributes = ','.join(sorted(values))
-        return attributes
+        return normalize_types(value)
 
 class LDCTimeRangeWrapper(Object):
     def __init__(self, logger, projection_or_annotation, entry):
@@ -396,7 +518,7 @@ class LDCTimeRangeWrapper(Object):
         projection_or_annotation = self.get('projection_or_annotation')
         entry = self.get('entry')
         if projection_or_annotation == 'annotation':
-            return LDCTimeRange(logger, entry).__str__()
+            return get_ldc_time_range_string(logger, entry)
         elif projection_or_annotation == 'projection':
             return "(AFTER-{},BEFORE-{})-(AFTER-{},BEFORE-{})".format(
                 trim(entry.get('?start_after')),
@@ -416,37 +538,111 @@ class AIFProjections(Object):
         self.document_mappings = document_mappings
         self.projection = {}
         self.load_projection()
+        # member to prototype mappings, built once rather than searched for every mention
+        self.projection_prototypes = self.get('projection_prototypes_index')
+        # projection side of the argument assertion attribute comparisons
+        self.projection_mention_argument_assertion_attributes = self.get('projection_argument_assertion_attributes_index', 'mention_argument_assertions_attributes.rq.tsv')
+        self.projection_prototype_argument_assertion_attributes = self.get('projection_argument_assertion_attributes_index', 'prototype_argument_assertions_attributes.rq.tsv')
+        self.annotation_prototypes = {}
+        self.annotation_worksheet_mentions = {}
+
+    def get_projection_prototypes_index(self):
+        prototypes = {}
+        projection = self.get('projection').get('cluster_prototype_member_attribute.rq.tsv', {})
+        for kb in projection:
+            for entry in projection.get(kb):
+                prototypes.setdefault(entry.get('?member'), entry.get('?prototype'))
+        return prototypes
+
+    def get_projection_argument_assertion_attributes_index(self, query_name):
+        argument_assertions = set()
+        store = self.get('projection').get(query_name, {})
+        for kb in store:
+            for entry in store.get(kb):
+                attributes = entry.get('?attributes')
+                if attributes == 'none':
+                    continue
+                argument_assertions.add((entry.get('?subject_mention_id'),
+                                         entry.get('?predicate'),
+                                         entry.get('?object_mention_id'),
+                                         attributes.lower()))
+        return frozenset(argument_assertions)
+
+    def get_annotation_prototypes_index(self, annotation):
+        prototypes = self.get('annotation_prototypes').get(id(annotation))
+        if prototypes is None:
+            prototypes = {}
+            for entry in annotation.get('worksheets').get('kb_links'):
+                prototypes.setdefault(entry.get('mention_id'), 'cluster-{}-prototype'.format(entry.get('qnode_kb_id_identity')))
+            self.get('annotation_prototypes')[id(annotation)] = prototypes
+        return prototypes
+
+    def get_annotation_mentions(self, annotation, store_name):
+        """
+        Returns the list of mentions built from the entries of the annotation worksheet,
+        built on first use and shared by the comparisons that need them.
+        """
+        mentions = self.get('annotation_worksheet_mentions').setdefault(id(annotation), {})
+        if store_name not in mentions:
+            logger = self.get('logger')
+            document_mappings = self.get('document_mappings')
+            mentions[store_name] = [Mention(logger, document_mappings, entry) for entry in annotation.get('worksheets').get(store_name)]
+        return mentions.get(store_name)
 
     def get_prototype(self, projection_or_annotation, mention_id, annotation=None):
         if projection_or_annotation == 'projection':
-            projection = self.get('projection').get('cluster_prototype_member_attribute.rq.tsv')
-            for kb in projection:
-                for entry in projection.get(kb):
-                    if entry.get('?member') == mention_id:
-                        return entry.get('?prototype')
-        else:
-            kb_links = annotation.get('worksheets').get('kb_links')
-            for entry in kb_links:
-                if entry.get('mention_id') == mention_id:
-                    return 'cluster-{}-prototype'.format(entry.get('qnode_kb_id_identity'))
-        return
-
-    def verify(self, annotation):
-        self.compare_claims(annotation)
-        self.compare_event_relation_dates(annotation)
-        self.compare_mention_argument_assertions(annotation)
-        self.compare_prototype_argument_assertions(annotation)
-        self.compare_mention_argument_assetion_attributes(annotation)
-        self.check_num_arguments(annotation)
-        self.compare_prototype_argument_assertion_attributes(annotation)
-        self.compare_cluster_generic_status(annotation)
-        self.verify_cluster_and_prototype()
-        self.compare_cluster_members(annotation)
-        self.compare_mention_spans(annotation)
-        self.compare_mention_attributes(annotation)
-        self.compare_mention_types(annotation)
+            return self.get('projection_prototypes').get(mention_id)
+        return self.get('annotation_prototypes_index', annotation).get(mention_id)
+
+    def get_comparisons(self):
+        """
+        Returns the list of names of the comparisons run by verify, each paired with
+        whether it takes the annotation as argument.
+        """
+        comparisons = [
+            ('compare_claims', True),
+            ('compare_event_relation_dates', True),
+            ('compare_mention_argument_assertions', True),
+            ('compare_prototype_argument_assertions', True),
+            ('compare_mention_argument_assetion_attributes', True),
+            ('check_num_arguments', True),
+            ('compare_prototype_argument_assertion_attributes', True),
+            ('compare_cluster_generic_status', True),
+            ('verify_cluster_and_prototype', False),
+            ('compare_cluster_members', True),
+            ('compare_mention_spans', True),
+            ('compare_mention_attributes', True),
+            ('compare_mention_types', True),
+            ]
         if self.get('task') == 'task1':
-            self.compare_subject_justification(annotation)
+            comparisons.append(('compare_subject_justification', True))
+        return comparisons
+
+    def verify(self, annotation, num_workers=None):
+        comparisons = self.get('comparisons')
+        if num_workers is not None and num_workers > 1:
+            # the indexes and mentions shared by several comparisons are built before the
+            # workers are forked so that each worker inherits them instead of rebuilding them
+            self.get('annotation_prototypes_index', annotation)
+            for store_name in ['argument_KEs', 'event_KEs', 'relation_KEs']:
+                self.get('annotation_mentions', annotation, store_name)
+            global worker_projections, worker_annotation
+            worker_projections, worker_annotation = self, annotation
+            with ProcessPoolExecutor(max_workers=min(num_workers, len(comparisons)),
+                                     mp_context=multiprocessing.get_context('fork')) as executor:
+                all_events = list(executor.map(run_comparison, comparisons))
+            worker_projections, worker_annotation = None, None
+            # the events are recorded in the order in which the comparisons would have run
+            logger = self.get('logger')
+            for events in all_events:
+                logger.record_events(events)
+        else:
+            for method_name, takes_annotation in comparisons:
+                method = getattr(self, method_name)
+                if takes_annotation:
+                    method(annotation)
+                else:
+                    method()
 
     def compare_claims(self, annotation):
         # Nothing to do for task1 and task2
@@ -455,9 +651,8 @@ class AIFProjections(Object):
 
     def compare_event_relation_dates(self, annotation):
         logger = self.get('logger')
-        dates = {'projection': {}, 'annotation': {}}
+        projection_dates, annotation_dates = {}, {}
         store = self.get('projection').get('event_relation_dates.rq.tsv')
-        projection_dates = dates.get('projection')
         for kb in store:
             for entry in store.get(kb):
                 mention_id = entry.get('?mention_id')
@@ -466,321 +661,245 @@ class AIFProjections(Object):
                     projection_dates[mention_id] = date
                 elif projection_dates[mention_id] != date:
                     self.record_event('MULTIPLE_MENTION_DATE', projection_dates[mention_id], date)
-        annotation_dates = dates.get('annotation')
         for store_name in ['event_KEs', 'relation_KEs']:
-            for entry in annotation.get('worksheets').get(store_name):
-                mention = Mention(logger, self.get('document_mappings'), entry)
-                missing = False
-                for field_name in ['{}_date'.format(start_or_end) for start_or_end in ['start', 'end']]:
-                    if entry.get(field_name) == 'EMPTY_MIS':
-                        missing = True
-                if missing:
+            for mention in self.get('annotation_mentions', annotation, store_name):
+                entry = mention.entry
+                if entry.get('start_date') == 'EMPTY_MIS' or entry.get('end_date') == 'EMPTY_MIS':
                     continue
                 annotation_dates[mention.get('mention_id')] = LDCTimeRangeWrapper(logger, 'annotation', entry)
+        # mentions dated on both sides are compared once
         count = 0
-        ts = [('projection', 'annotation'), ('annotation', 'projection')]
-        for (t1, t2) in ts:
-            for mention_id, t1_dates in dates.get(t1).items():
-                if mention_id in dates.get(t2):
-                    t2_dates = dates.get(t2).get(mention_id)
-                    if t1_dates != t2_dates:
-                        count += 1
-                        self.record_event('UNEXPECTED_DATE', mention_id, t1_dates, t2_dates)
+        for mention_id in projection_dates.keys() & annotation_dates.keys():
+            projection_date = projection_dates[mention_id]
+            annotation_date = annotation_dates[mention_id]
+            if projection_date != annotation_date:
+                count += 1
+                self.record_event('UNEXPECTED_DATE', mention_id, projection_date, annotation_date)
         self.record_event('UNEXPECTED_DATE_COUNT', count if count else 'No')
 
     def check_num_arguments(self, annotation):
-        events_or_relations = {
-            'event': {
-                'mentions': {},
-                'num_arguments': 2,
-                },
-            'relation': {
-                'mentions': {},
-                'num_arguments': 2,
-                }
-            }
-        for events_or_relation in events_or_relations:
-            KEs = '{}_KEs'.format(events_or_relation)
-            for entry in annotation.get('worksheets').get(KEs):
-                mention_id = entry.get('{}mention_id'.format(events_or_relation))
-                events_or_relations.get(events_or_relation).get('mentions')[mention_id] = set()
-            slots = '{}_slots'.format(events_or_relation)
-            for entry in annotation.get('worksheets').get(slots):
-                mention_id = entry.get('{}mention_id'.format(events_or_relation))
+        worksheets = annotation.get('worksheets')
+        event_KEs = worksheets.get('event_KEs')
+        event_slots = worksheets.get('event_slots')
+        relation_KEs = worksheets.get('relation_KEs')
+        relation_slots = worksheets.get('relation_slots')
+        event_mentions, event_num_arguments = {}, 2
+        relation_mentions, relation_num_arguments = {}, 2
+        for KEs, slots, mention_id_field_name, mentions in [
+                (event_KEs, event_slots, 'eventmention_id', event_mentions),
+                (relation_KEs, relation_slots, 'relationmention_id', relation_mentions)]:
+            for entry in KEs:
+                mentions[entry.get(mention_id_field_name)] = set()
+            for entry in slots:
                 slot_type = entry.get('general_slot_type')
                 if slot_type == 'EMPTY_TBD':
                     continue
-                events_or_relations.get(events_or_relation).get('mentions').get(mention_id).add(slot_type)
-        for events_or_relation in events_or_relations:
-            num_arguments = events_or_relations.get(events_or_relation).get('num_arguments')
-            events_or_relations_mentions = events_or_relations.get(events_or_relation).get('mentions')
-            for mention_id in events_or_relations_mentions:
-                mention_slot_types = events_or_relations_mentions.get(mention_id)
+                mentions[entry.get(mention_id_field_name)].add(slot_type)
+        for mentions, num_arguments, error_code in [
+                (event_mentions, event_num_arguments, 'UNEXPECTED_NUM_ARGUMENTS_WARNING'),
+                (relation_mentions, relation_num_arguments, 'UNEXPECTED_NUM_ARGUMENTS_ERROR')]:
+            for mention_id, mention_slot_types in mentions.items():
                 if len(mention_slot_types) < num_arguments:
-                    error_code = 'UNEXPECTED_NUM_ARGUMENTS_WARNING' if events_or_relation == 'event' else 'UNEXPECTED_NUM_ARGUMENTS_ERROR'
                     self.record_event(error_code, mention_id, len(mention_slot_types), num_arguments)
 
     def compare_prototype_argument_assertion_attributes(self, annotation):
-        argument_assertions = {'projection': set(), 'annotation': set()}
-        store = self.get('projection').get('prototype_argument_assertions_attributes.rq.tsv')
-        for kb in store:
-            for entry in store.get(kb):
-                aa_subject = entry.get('?subject_mention_id')
-                predicate = entry.get('?predicate')
-                aa_object = entry.get('?object_mention_id')
-                attributes = entry.get('?attributes')
-                if attributes == 'none':
-                    continue
-                argument_assertion = '{subject}::{predicate}::{object}::{attributes}'.format(
-                    subject = aa_subject,
-                    predicate = predicate,
-                    object = aa_object,
-                    attributes = attributes.lower()
-                    )
-                argument_assertions.get('projection').add(argument_assertion)
-
+        annotation_prototypes = self.get('annotation_prototypes_index', annotation)
+        annotation_argument_assertions = set()
         for store_name in ['event_slots', 'relation_slots']:
             for entry in annotation.get('worksheets').get(store_name):
-                aa_subject = self.get('prototype', 'annotation', entry.get('eventmention_id') or entry.get('relationmention_id'), annotation=annotation)
-                predicate = entry.get('general_slot_type')
-                aa_object = self.get('prototype', 'annotation', entry.get('argmention_id'), annotation=annotation)
+                aa_subject = annotation_prototypes.get(entry.get('eventmention_id') or entry.get('relationmention_id'))
+                predicate = get_slot_type(entry)
+                aa_object = annotation_prototypes.get(entry.get('argmention_id'))
                 attributes = entry.get('attribute')
                 if attributes is None or attributes == 'none':
                     continue
-                argument_assertion = '{subject}::{predicate}::{object}::{attributes}'.format(
-                    subject = aa_subject,
-                    predicate = predicate,
-                    object = aa_object,
-                    attributes = attributes.lower()
-                    )
-                argument_assertions.get('annotation').add(argument_assertion)
-
-        union = argument_assertions.get('projection').union(argument_assertions.get('annotation'))
-        intersection = argument_assertions.get('projection').intersection(argument_assertions.get('annotation'))
-        missings = union - intersection
+                argument_assertion = (aa_subject, predicate, aa_object, attributes.lower())
+                annotation_argument_assertions.add(argument_assertion)
+
+        projection_argument_assertions = self.get('projection_prototype_argument_assertion_attributes')
+        # each assertion is reported as missing from the store it is not in
+        missings = get_missing_items(projection_argument_assertions, annotation_argument_assertions)
         count = 0
-        for missing in missings:
-            count += 1
-            stores = ['projection', 'annotation']
-            for store in stores:
-                if missing not in argument_assertions.get(store):
-                    self.record_event('MISSING_ARGUMENT_ASSERTION_ATTRIBUTE', missing, store)
+        events = []
+        for missing_argument_assertions, store in missings:
+            count += len(missing_argument_assertions)
+            for missing in missing_argument_assertions:
+                events.append(('MISSING_ARGUMENT_ASSERTION_ATTRIBUTE', '::'.join(map(str, missing)), store))
+        self.record_events(events)
         self.record_event('MISSING_PROTOTYPE_ARGUMENT_ASSERTION_ATTRIBUTE_COUNT', count if count else 'No')
 
     def compare_mention_argument_assetion_attributes(self, annotation):
-        argument_assertions = {'projection': set(), 'annotation': set()}
-        store = self.get('projection').get('mention_argument_assertions_attributes.rq.tsv')
-        for kb in store:
-            for entry in store.get(kb):
-                aa_subject = entry.get('?subject_mention_id')
-                predicate = entry.get('?predicate')
-                aa_object = entry.get('?object_mention_id')
-                attributes = entry.get('?attributes')
-                if attributes == 'none':
-                    continue
-                argument_assertion = '{subject}::{predicate}::{object}::{attributes}'.format(
-                    subject = aa_subject,
-                    predicate = predicate,
-                    object = aa_object,
-                    attributes = attributes.lower()
-                    )
-                argument_assertions.get('projection').add(argument_assertion)
-
+        annotation_argument_assertions = set()
         for store_name in ['event_slots', 'relation_slots']:
             for entry in annotation.get('worksheets').get(store_name):
                 aa_subject = entry.get('eventmention_id') or entry.get('relationmention_id')
-                predicate = entry.get('general_slot_type')
+                predicate = get_slot_type(entry)
                 aa_object = entry.get('argmention_id')
                 attributes = entry.get('attribute')
                 if attributes is None or attributes == 'none':
                     continue
-                argument_assertion = '{subject}::{predicate}::{object}::{attributes}'.format(
-                    subject = aa_subject,
-                    predicate = predicate,
-                    object = aa_object,
-                    attributes = attributes.lower()
-                    )
-                argument_assertions.get('annotation').add(argument_assertion)
-
-        union = argument_assertions.get('projection').union(argument_assertions.get('annotation'))
-        intersection = argument_assertions.get('projection').intersection(argument_assertions.get('annotation'))
-        missings = union - intersection
+                argument_assertion = (aa_subject, predicate, aa_object, attributes.lower())
+                annotation_argument_assertions.add(argument_assertion)
+
+        projection_argument_assertions = self.get('projection_mention_argument_assertion_attributes')
+        # each assertion is reported as missing from the store it is not in
+        missings = get_missing_items(projection_argument_assertions, annotation_argument_assertions)
         count = 0
-        for missing in missings:
-            count += 1
-            stores = ['projection', 'annotation']
-            for store in stores:
-                if missing not in argument_assertions.get(store):
-                    self.record_event('MISSING_ARGUMENT_ASSERTION_ATTRIBUTE', missing, store)
+        events = []
+        for missing_argument_assertions, store in missings:
+            count += len(missing_argument_assertions)
+            for missing in missing_argument_assertions:
+                events.append(('MISSING_ARGUMENT_ASSERTION_ATTRIBUTE', '::'.join(map(str, missing)), store))
+        self.record_events(events)
         self.record_event('MISSING_ARGUMENT_ASSERTION_ATTRIBUTE_COUNT', count if count else 'No')
 
     def compare_subject_justification(self, annotation):
-        logger = self.get('logger')
-        justifications = {'projection': set(), 'annotation': set()}
+        projection_justifications = set()
+        annotation_justifications = set()
         store = self.get('projection').get('mention_argument_assertions_justifications.rq.tsv')
         for kb in store:
             for entry in store.get(kb):
                 subject = entry.get('?subject_mention_id')
                 justification = entry.get('?predicate_justification')
                 subject_and_justification = '{}::{}'.format(subject, justification.__str__())
-                justifications.get('projection').add(subject_and_justification)
+                projection_justifications.add(subject_and_justification)
         mentions = set()
         for store_name in ['event_slots', 'relation_slots']:
             for entry in annotation.get('worksheets').get(store_name):
                 mention_id = entry.get('eventmention_id') or entry.get('relationmention_id')
                 mentions.add(mention_id)
         for store_name in ['event_KEs', 'relation_KEs']:
-            for entry in annotation.get('worksheets').get(store_name):
-                mention = Mention(logger, self.get('document_mappings'), entry)
+            for mention in self.get('annotation_mentions', annotation, store_name):
                 subject = mention.get('mention_id')
                 if subject in mentions:
                     subject_and_justification = '{}::{}'.format(subject, mention.__str__())
-                    justifications.get('annotation').add(subject_and_justification)
-        union = justifications.get('projection').union(justifications.get('annotation'))
-        intersection = justifications.get('projection').intersection(justifications.get('annotation'))
-        missings = union - intersection
+                    annotation_justifications.add(subject_and_justification)
+        # each justification is reported as missing from the store it is not in
+        missings = get_missing_items(projection_justifications, annotation_justifications)
         count = 0
-        for missing in missings:
-            count += 1
-            stores = ['projection', 'annotation']
-            for store in stores:
-                if missing not in justifications.get(store):
-                    self.record_event('MISSING_SUBJECT_JUSTIFICATION', missing, store)
+        events = []
+        for missing_justifications, store in missings:
+            count += len(missing_justifications)
+            for missing in missing_justifications:
+                events.append(('MISSING_SUBJECT_JUSTIFICATION', missing, store))
+        self.record_events(events)
         self.record_event('MISSING_SUBJECT_JUSTIFICATION_COUNT', count if count else 'No')
 
     def compare_prototype_argument_assertions(self, annotation):
-        clusters = {'projection': set(), 'annotation': set()}
+        projection_clusters = set()
+        annotation_clusters = set()
+        # the prototype indexes are bound once for all the entries
+        projection_prototypes = self.get('projection_prototypes')
+        annotation_prototypes = self.get('annotation_prototypes_index', annotation)
         store = self.get('projection').get('mention_argument_assertions_justifications.rq.tsv')
         for kb in store:
             for entry in store.get(kb):
-                aa_subject = self.get('prototype', 'projection', entry.get('?subject_mention_id'))
+                aa_subject = projection_prototypes.get(entry.get('?subject_mention_id'))
                 predicate = entry.get('?predicate')
-                aa_object = self.get('prototype', 'projection', entry.get('?object_mention_id'))
-                argument_assertion = '{subject}::{predicate}::{object}'.format(
-                    subject = aa_subject,
-                    predicate = predicate,
-                    object = aa_object
-                    )
-                clusters.get('projection').add(argument_assertion)
+                aa_object = projection_prototypes.get(entry.get('?object_mention_id'))
+                argument_assertion = (aa_subject, predicate, aa_object)
+                projection_clusters.add(argument_assertion)
 
         for store_name in ['event_slots', 'relation_slots']:
             for entry in annotation.get('worksheets').get(store_name):
-                aa_subject = self.get('prototype', 'annotation', entry.get('eventmention_id') or entry.get('relationmention_id'), annotation=annotation)
-                predicate = entry.get('general_slot_type')
-                aa_object = self.get('prototype', 'annotation', entry.get('argmention_id'), annotation=annotation)
-                argument_assertion = '{subject}::{predicate}::{object}'.format(
-                    subject = aa_subject,
-                    predicate = predicate,
-                    object = aa_object,
-                    )
-                clusters.get('annotation').add(argument_assertion)
-
-        union = clusters.get('projection').union(clusters.get('annotation'))
-        intersection = clusters.get('projection').intersection(clusters.get('annotation'))
-        missings = union - intersection
+                aa_subject = annotation_prototypes.get(entry.get('eventmention_id') or entry.get('relationmention_id'))
+                predicate = get_slot_type(entry)
+                aa_object = annotation_prototypes.get(entry.get('argmention_id'))
+                argument_assertion = (aa_subject, predicate, aa_object)
+                annotation_clusters.add(argument_assertion)
+
+        # each assertion is reported as missing from the store it is not in
+        missings = get_missing_items(projection_clusters, annotation_clusters)
         count = 0
-        for missing in missings:
-            count += 1
-            stores = ['projection', 'annotation']
-            for store in stores:
-                if missing not in clusters.get(store):
-                    error_code = 'MISSING_ARGUMENT_ASSERTION_WARNING' if '::EMPTY_TBD::' in missing else 'MISSING_ARGUMENT_ASSERTION_ERROR'
-                    self.record_event(error_code, missing, store)
+        events = []
+        for missing_argument_assertions, store in missings:
+            count += len(missing_argument_assertions)
+            for missing in missing_argument_assertions:
+                error_code = 'MISSING_ARGUMENT_ASSERTION_WARNING' if missing[1] == 'EMPTY_TBD' else 'MISSING_ARGUMENT_ASSERTION_ERROR'
+                events.append((error_code, '::'.join(map(str, missing)), store))
+        self.record_events(events)
         self.record_event('MISSING_PROTOTYPE_ARGUMENT_ASSERTION_COUNT', count if count else 'No')
 
     def compare_mention_argument_assertions(self, annotation):
-        clusters = {'projection': set(), 'annotation': set()}
+        projection_clusters = set()
+        annotation_clusters = set()
         store = self.get('projection').get('mention_argument_assertions_justifications.rq.tsv')
         for kb in store:
             for entry in store.get(kb):
                 aa_subject = entry.get('?subject_mention_id')
                 predicate = entry.get('?predicate')
                 aa_object = entry.get('?object_mention_id')
-                argument_assertion = '{subject}::{predicate}::{object}'.format(
-                    subject = aa_subject,
-                    predicate = predicate,
-                    object = aa_object
-                    )
-                clusters.get('projection').add(argument_assertion)
+                argument_assertion = (aa_subject, predicate, aa_object)
+                projection_clusters.add(argument_assertion)
 
         for store_name in ['event_slots', 'relation_slots']:
             for entry in annotation.get('worksheets').get(store_name):
                 aa_subject = entry.get('eventmention_id') or entry.get('relationmention_id')
-                predicate = entry.get('general_slot_type')
+                predicate = get_slot_type(entry)
                 aa_object = entry.get('argmention_id')
-                argument_assertion = '{subject}::{predicate}::{object}'.format(
-                    subject = aa_subject,
-                    predicate = predicate,
-                    object = aa_object,
-                    )
-                clusters.get('annotation').add(argument_assertion)
-
-        union = clusters.get('projection').union(clusters.get('annotation'))
-        intersection = clusters.get('projection').intersection(clusters.get('annotation'))
-        missings = union - intersection
+                argument_assertion = (aa_subject, predicate, aa_object)
+                annotation_clusters.add(argument_assertion)
+
+        # each assertion is reported as missing from the store it is not in
+        missings = get_missing_items(projection_clusters, annotation_clusters)
         count = 0
-        for missing in missings:
-            count += 1
-            stores = ['projection', 'annotation']
-            for store in stores:
-                if missing not in clusters.get(store):
-                    error_code = 'MISSING_ARGUMENT_ASSERTION_WARNING' if '::EMPTY_TBD::' in missing else 'MISSING_ARGUMENT_ASSERTION_ERROR'
-                    self.record_event(error_code, missing, store)
+        events = []
+        for missing_argument_assertions, store in missings:
+            count += len(missing_argument_assertions)
+            for missing in missing_argument_assertions:
+                error_code = 'MISSING_ARGUMENT_ASSERTION_WARNING' if missing[1] == 'EMPTY_TBD' else 'MISSING_ARGUMENT_ASSERTION_ERROR'
+                events.append((error_code, '::'.join(map(str, missing)), store))
+        self.record_events(events)
         self.record_event('MISSING_ARGUMENT_ASSERTION_COUNT', count if count else 'No')
 
     def compare_cluster_generic_status(self, annotation):
-        clusters = {}
+        projection_clusters = defaultdict(set)
+        annotation_clusters = defaultdict(set)
         store = self.get('projection').get('cluster_prototype_member_attribute.rq.tsv')
         for kb in store:
             for entry in store.get(kb):
                 cluster_id = entry.get('?cluster')
                 attributes = entry.get('?attributes')
                 generic_status = 'Generic' if 'Generic' in attributes else 'NotGeneric'
-                if cluster_id not in clusters:
-                    clusters[cluster_id] = {'projection': set()}
-                clusters.get(cluster_id).get('projection').add(generic_status)
+                projection_clusters[cluster_id].add(generic_status)
 
         for entry in annotation.get('worksheets').get('kb_links'):
             cluster_id = 'cluster-{}'.format(entry.get('qnode_kb_id_identity'))
             generic_status = entry.get('generic_status')
             generic_status = 'Generic' if generic_status == 'generic' else 'NotGeneric'
-            if cluster_id not in clusters:
-                clusters[cluster_id] = {'annotation': set()}
-            if 'annotation' not in clusters.get(cluster_id):
-                clusters.get(cluster_id)['annotation'] = set()
-            clusters.get(cluster_id).get('annotation').add(generic_status)
-
-        for cluster_id in clusters:
-            projection_generic_status = list().append(clusters.get(cluster_id).get('projection'))
-            annotation_generic_status = list().append(clusters.get(cluster_id).get('annotation'))
-            if projection_generic_status != annotation_generic_status:
-                self.record_event('UNEXPECTED_CLUSTER_GENERIC_STATUS', cluster_id, ','.join(projection_generic_status), ','.join(annotation_generic_status))
+            annotation_clusters[cluster_id].add(generic_status)
+
+        # the clusters are probed with get so that a cluster found on one side only is not inserted into the other
+        empty = frozenset()
+        cluster_ids = list(projection_clusters) + [cluster_id for cluster_id in annotation_clusters if cluster_id not in projection_clusters]
+        for cluster_id in cluster_ids:
+            projection_generic_status = projection_clusters.get(cluster_id, empty)
+            annotation_generic_status = annotation_clusters.get(cluster_id, empty)
+            if projection_generic_status ^ annotation_generic_status:
+                self.record_event('UNEXPECTED_CLUSTER_GENERIC_STATUS', cluster_id, ','.join(sorted(projection_generic_status)), ','.join(sorted(annotation_generic_status)))
 
     def compare_cluster_members(self, annotation):
-        clusters = {}
+        projection_clusters = defaultdict(set)
+        annotation_clusters = defaultdict(set)
         store = self.get('projection').get('cluster_prototype_member_attribute.rq.tsv')
         for kb in store:
             for entry in store.get(kb):
                 cluster_id = entry.get('?cluster')
                 member_id = entry.get('?member')
-                if cluster_id not in clusters:
-                    clusters[cluster_id] = {'projection': set()}
-                clusters.get(cluster_id).get('projection').add(member_id)
+                projection_clusters[cluster_id].add(member_id)
 
         for entry in annotation.get('worksheets').get('kb_links'):
             cluster_id = 'cluster-{}'.format(entry.get('qnode_kb_id_identity'))
             member_id = entry.get('mention_id')
-            if cluster_id not in clusters:
-                clusters[cluster_id] = {'annotation': set()}
-            if 'annotation' not in clusters.get(cluster_id):
-                clusters.get(cluster_id)['annotation'] = set()
-            clusters.get(cluster_id).get('annotation').add(member_id)
-
-        for cluster_id in clusters:
-            projection_members = list().append(clusters.get(cluster_id).get('projection'))
-            annotation_members = list().append(clusters.get(cluster_id).get('annotation'))
-            if projection_members != annotation_members:
-                self.record_event('UNEXPECTED_CLUSTER_MEMBERS', cluster_id, ','.join(projection_members), ','.join(annotation_members))
+            annotation_clusters[cluster_id].add(member_id)
+
+        empty = frozenset()
+        cluster_ids = list(projection_clusters) + [cluster_id for cluster_id in annotation_clusters if cluster_id not in projection_clusters]
+        for cluster_id in cluster_ids:
+            projection_members = projection_clusters.get(cluster_id, empty)
+            annotation_members = annotation_clusters.get(cluster_id, empty)
+            if projection_members ^ annotation_members:
+                self.record_event('UNEXPECTED_CLUSTER_MEMBERS', cluster_id, ','.join(sorted(map(str, projection_members))), ','.join(sorted(map(str, annotation_members))))
 
     def verify_cluster_and_prototype(self):
         store = self.get('projection').get('cluster_prototype_member_attribute.rq.tsv')
@@ -799,31 +918,30 @@ class AIFProjections(Object):
             'event_KEs': 'eventmention_id',
             'relation_KEs': 'relationmention_id'
             }
-        mentions = {'projection': {}, 'annotation': {}}
+        projection_mentions = {}
+        annotation_mentions = {}
+        projection = self.get('projection')
+        worksheets = annotation.get('worksheets')
 
         for store_name in ['text_mentions.rq.tsv', 'image_mentions.rq.tsv']:
-            store = self.get('projection').get(store_name)
+            store = projection.get(store_name)
             for kb in store:
                 for entry in store.get(kb):
-                    mention_id = entry.get('?mention_id')
-                    types = Types(logger, entry)
-                    mentions['projection'][mention_id] = types
+                    projection_mentions[entry.get('?mention_id')] = Types(logger, entry)
 
         for store_name in ['argument_KEs', 'event_KEs', 'relation_KEs']:
-            for entry in annotation.get('worksheets').get(store_name):
-                mention_id = entry.get(field_names.get(store_name))
-                types = Types(logger, entry)
-                mentions['annotation'][mention_id] = types
+            mention_id_field_name = field_names[store_name]
+            for entry in worksheets.get(store_name):
+                annotation_mentions[entry.get(mention_id_field_name)] = Types(logger, entry)
 
+        # each mention on both sides is compared, and reported, once
         num_problems = 0
-        ts = [('projection', 'annotation'), ('annotation', 'projection')]
-        for (t1, t2) in ts:
-            for mention_id, t1_types in mentions.get(t1).items():
-                if mention_id in mentions.get(t2):
-                    t2_types = mentions.get(t2).get(mention_id)
-                    if t1_types != t2_types:
-                        num_problems += 1
-                        self.record_event('UNEXPECTED_TYPES', mention_id, t1, t1_types, t2, t2_types)
+        for mention_id in projection_mentions.keys() & annotation_mentions.keys():
+            projection_types = projection_mentions[mention_id]
+            annotation_types = annotation_mentions[mention_id]
+            if projection_types != annotation_types:
+                num_problems += 1
+                self.record_event('UNEXPECTED_TYPES', mention_id, 'projection', projection_types, 'annotation', annotation_types)
         self.record_event('UNEXPECTED_MENTION_TYPES_COUNT', num_problems if num_problems else 'No')
 
     def compare_mention_attributes(self, annotation):
@@ -833,74 +951,81 @@ class AIFProjections(Object):
             'event_KEs': 'eventmention_id',
             'relation_KEs': 'relationmention_id'
             }
-        mentions = {'projection': {}, 'annotation': {}}
+        projection_mentions = {}
+        annotation_mentions = {}
+        projection = self.get('projection')
+        worksheets = annotation.get('worksheets')
 
         for store_name in ['mention_attributes.rq.tsv']:
-            store = self.get('projection').get(store_name)
+            store = projection.get(store_name)
             for kb in store:
                 for entry in store.get(kb):
-                    mention_id = entry.get('?member')
-                    attributes = Attributes(logger, entry)
-                    mentions['projection'][mention_id] = attributes
+                    projection_mentions[entry.get('?member')] = Attributes(logger, entry)
 
         for store_name in ['event_KEs', 'relation_KEs']:
-            for entry in annotation.get('worksheets').get(store_name):
-                mention_id = entry.get(field_names.get(store_name))
-                attributes = Attributes(logger, entry)
-                mentions['annotation'][mention_id] = attributes
+            mention_id_field_name = field_names[store_name]
+            for entry in worksheets.get(store_name):
+                annotation_mentions[entry.get(mention_id_field_name)] = Attributes(logger, entry)
 
         num_problems = 0
-        for mention_id, projection_attributes in mentions.get('projection').items():
-            if mention_id in mentions.get('annotation'):
-                annotation_attributes = mentions.get('annotation').get(mention_id)
-                if projection_attributes != annotation_attributes:
-                    num_problems += 1
-                    self.record_event('UNEXPECTED_ATTRIBUTES', mention_id, projection_attributes, annotation_attributes)
+        for mention_id in projection_mentions.keys() & annotation_mentions.keys():
+            projection_attributes = projection_mentions[mention_id]
+            annotation_attributes = annotation_mentions[mention_id]
+            if projection_attributes != annotation_attributes:
+                num_problems += 1
+                self.record_event('UNEXPECTED_ATTRIBUTES', mention_id, projection_attributes, annotation_attributes)
 
         self.record_event('UNEXPECTED_MENTION_ATTRIBUTES_COUNT', num_problems if num_problems else 'No')
 
     def compare_mention_spans(self, annotation):
         logger = self.get('logger')
-        mentions = {'projection': {}, 'annotation': {}}
+        projection_mentions = {}
+        annotation_mentions = {}
+        projection = self.get('projection')
+        document_mappings = self.get('document_mappings')
 
         for store_name in ['text_mentions.rq.tsv', 'image_mentions.rq.tsv']:
-            store = self.get('projection').get(store_name)
+            store = projection.get(store_name)
             for kb in store:
                 for entry in store.get(kb):
-                    mention = Mention(logger, self.get('document_mappings'), entry)
-                    mentions['projection'][mention.__str__()] = mention
+                    mention = Mention(logger, document_mappings, entry)
+                    projection_mentions[mention.__str__()] = mention
 
         for store_name in ['argument_KEs', 'event_KEs', 'relation_KEs']:
-            for entry in annotation.get('worksheets').get(store_name):
-                mention = Mention(logger, self.get('document_mappings'), entry)
-                mentions['annotation'][mention.__str__()] = mention
+            for mention in self.get('annotation_mentions', annotation, store_name):
+                annotation_mentions[mention.__str__()] = mention
 
-        c1 = self.report_missing_mention_spans(mentions, present_in='projection', missing_from='annotation')
-        c2 = self.report_missing_mention_spans(mentions, present_in='annotation', missing_from='projection')
+        projection_mention_spans = projection_mentions.keys()
+        annotation_mention_spans = annotation_mentions.keys()
+        c1 = self.report_missing_mention_spans(projection_mentions, projection_mention_spans - annotation_mention_spans, present_in='projection', missing_from='annotation')
+        c2 = self.report_missing_mention_spans(annotation_mentions, annotation_mention_spans - projection_mention_spans, present_in='annotation', missing_from='projection')
         self.record_event('MISSING_MENTION_COUNT', c1+c2 if c1+c2 else 'No')
 
     def load_projection(self):
         logger = self.get('logger')
         path = self.get('path')
         projection = self.get('projection')
-        for kb in os.listdir(path):
-            for sparql_output_filename in os.listdir(os.path.join(path, kb)):
-                filename = os.path.join(path, kb, sparql_output_filename)
-                if sparql_output_filename not in projection:
-                    projection[sparql_output_filename] = {}
-                if kb not in projection.get(sparql_output_filename):
-                    projection[sparql_output_filename][kb] = []
-                for entry in FileHandler(logger, filename):
-                    projection.get(sparql_output_filename).get(kb).append(entry)
-
-    def report_missing_mention_spans(self, mentions, present_in, missing_from):
-        missing_mention_spans = set(mentions.get(present_in).keys()) - set(mentions.get(missing_from).keys())
-        count = 0
-        for mention_span in missing_mention_spans:
-            count += 1
-            mention = mentions.get(present_in).get(mention_span)
-            self.record_event('MISSING_MENTION', mention_span, present_in, missing_from, mention.get('where'))
-        return count
+        # the stores are read more than once by the compares, so the entries are kept in lists
+        with os.scandir(path) as kb_dir_entries:
+            for kb_dir_entry in kb_dir_entries:
+                kb = kb_dir_entry.name
+                with os.scandir(kb_dir_entry.path) as sparql_output_dir_entries:
+                    for sparql_output_dir_entry in sparql_output_dir_entries:
+                        sparql_output_filename = sparql_output_dir_entry.name
+                        append = projection.setdefault(sparql_output_filename, {}).setdefault(kb, []).append
+                        fh = FileHandler(logger, sparql_output_dir_entry.path)
+                        columns = interned_columns.intersection(fh.get('header').get('columns')) if fh.get('header') else ()
+                        for entry in fh:
+                            for column in columns:
+                                value = entry.get(column)
+                                if value is not None:
+                                    entry.set(column, sys.intern(value))
+                            append(entry)
+
+    def report_missing_mention_spans(self, present_mentions, missing_mention_spans, present_in, missing_from):
+        self.record_events([('MISSING_MENTION', mention_span, present_in, missing_from, present_mentions[mention_span].where)
+                            for mention_span in missing_mention_spans])
+        return len(missing_mention_spans)
 
 class TA1AIFProjections(AIFProjections):
     def __init__(self, logger, projections, document_mappings):
@@ -916,128 +1041,98 @@ class TA3AIFProjections(AIFProjections):
     def __init__(self, logger, projections, document_mappings):
         super().__init__(logger, projections, document_mappings)
         self.task = 'task3'
+        # the argument assertions of each subject mention, shared by the claim argument assertion comparisons
+        self.projection_argument_assertions_by_mention = self.get('projection_argument_assertions_by_mention_index')
+        self.annotation_argument_assertions_by_mention = {}
+        self.annotation_claim_associated_mentions = {}
+
+    def get_projection_argument_assertions_by_mention_index(self):
+        argument_assertions = defaultdict(set)
+        store = self.get('projection').get('mention_argument_assertions_justifications.rq.tsv', {})
+        for kb in store:
+            for entry in store.get(kb):
+                aa_subject_mention_id = entry.get('?subject_mention_id')
+                argument_assertion = (aa_subject_mention_id, entry.get('?predicate'), entry.get('?object_mention_id'))
+                argument_assertions[aa_subject_mention_id].add(argument_assertion)
+        return argument_assertions
+
+    def get_annotation_argument_assertions_by_mention_index(self, annotation):
+        argument_assertions = self.get('annotation_argument_assertions_by_mention').get(id(annotation))
+        if argument_assertions is None:
+            argument_assertions = defaultdict(set)
+            for store_name in ['event_slots', 'relation_slots']:
+                for entry in annotation.get('worksheets').get(store_name):
+                    aa_subject_mention_id = entry.get('eventmention_id') or entry.get('relationmention_id')
+                    argument_assertion = (aa_subject_mention_id, get_slot_type(entry), entry.get('argmention_id'))
+                    argument_assertions[aa_subject_mention_id].add(argument_assertion)
+            self.get('annotation_argument_assertions_by_mention')[id(annotation)] = argument_assertions
+        return argument_assertions
+
+    def get_claim_associated_mentions(self, annotation):
+        """
+        Returns the list of claim IDs, each paired with the set of mentions associated with
+        the claim, parsed once per annotation and shared by the argument assertion comparisons.
+        """
+        associated_mentions = self.get('annotation_claim_associated_mentions').get(id(annotation))
+        if associated_mentions is None:
+            associated_mentions = [(entry.get('claim_id'), frozenset(mention_id.strip() for mention_id in entry.get('associated_kes').split(',')))
+                                   for entry in annotation.get('worksheets').get('claims')]
+            self.get('annotation_claim_associated_mentions')[id(annotation)] = associated_mentions
+        return associated_mentions
 
     def compare_claims(self, annotation):
-        annotation_claims = Claims(self.get('logger'), 'annotation', annotation)
-        projection_claims = Claims(self.get('logger'), 'projection', self)
+        logger = self.get('logger')
+        annotation_claims = Claims(logger, 'annotation', annotation).get('claims')
+        projection_claims = Claims(logger, 'projection', self).get('claims')
 
-        mismatched = set()
-        for claim_id, annotation_claim in annotation_claims.get('claims').items():
-            projection_claim = projection_claims.get('claims').get(claim_id)
-            if annotation_claim != projection_claim:
-                mismatched.add(claim_id)
-        for claim_id, projection_claim in projection_claims.get('claims').items():
-            annotation_claim = annotation_claims.get('claims').get(claim_id)
-            if annotation_claim != projection_claim:
+        # claims found on one side only are mismatched; those on both sides are compared once
+        mismatched = annotation_claims.keys() ^ projection_claims.keys()
+        for claim_id in annotation_claims.keys() & projection_claims.keys():
+            if annotation_claims[claim_id] != projection_claims[claim_id]:
                 mismatched.add(claim_id)
         for claim_id in mismatched:
             self.record_event('CLAIM_MISMATCHED', claim_id)
 
     def compare_prototype_argument_assertions(self, annotation):
-        clusters = {'projection': {}, 'annotation': {}}
-        store = self.get('projection').get('mention_argument_assertions_justifications.rq.tsv')
-        for kb in store:
-            for entry in store.get(kb):
-                aa_subject_mention_id = entry.get('?subject_mention_id')
-                aa_subject = self.get('prototype', 'projection', aa_subject_mention_id)
-                predicate = entry.get('?predicate')
-                aa_object_mention_id = entry.get('?object_mention_id')
-                aa_object = self.get('prototype', 'projection', aa_object_mention_id)
-                argument_assertion = '{subject}::{predicate}::{object}'.format(
-                    subject = aa_subject,
-                    predicate = predicate,
-                    object = aa_object
-                    )
-                clusters.get('projection').setdefault(aa_subject_mention_id, set()).add(argument_assertion)
-
-        for store_name in ['event_slots', 'relation_slots']:
-            for entry in annotation.get('worksheets').get(store_name):
-                aa_subject_mention_id = entry.get('eventmention_id') or entry.get('relationmention_id')
-                aa_subject = self.get('prototype', 'annotation', aa_subject_mention_id, annotation=annotation)
-                predicate = entry.get('general_slot_type')
-                aa_object_mention_id = entry.get('argmention_id')
-                aa_object = self.get('prototype', 'annotation', aa_object_mention_id, annotation=annotation)
-                argument_assertion = '{subject}::{predicate}::{object}'.format(
-                    subject = aa_subject,
-                    predicate = predicate,
-                    object = aa_object,
-                    )
-                clusters.get('annotation').setdefault(aa_subject_mention_id, set()).add(argument_assertion)
-
-        count = 0
-        for entry in annotation.get('worksheets').get('claims'):
-            claim_id = entry.get('claim_id')
-            associated_mentions = set()
-            for mention_id in entry.get('associated_kes').split(','):
-                associated_mentions.add(mention_id.strip())
-            argument_assertions = {'projection': set(), 'annotation': set()}
-            for mention_id in associated_mentions:
-                for key in argument_assertions:
-                    if clusters.get(key).get(mention_id):
-                        argument_assertions.get(key).update(clusters.get(key).get(mention_id))
-
-            union = argument_assertions.get('projection').union(argument_assertions.get('annotation'))
-            intersection = argument_assertions.get('projection').intersection(argument_assertions.get('annotation'))
-            missings = union - intersection
-            for missing in missings:
-                count += 1
-                stores = ['projection', 'annotation']
-                for store in stores:
-                    if missing not in clusters.get(store):
-                        error_code = 'MISSING_CLAIM_ARGUMENT_ASSERTION_WARNING' if '::EMPTY_TBD::' in missing else 'MISSING_CLAIM_ARGUMENT_ASSERTION_ERROR'
-                        self.record_event(error_code, missing, claim_id, store)
+        projection_prototypes = self.get('projection_prototypes')
+        annotation_prototypes = self.get('annotation_prototypes_index', annotation)
+        # the mention-keyed indexes are probed with the subject and object mapped to their prototypes
+        projection_clusters = {mention_id: {(projection_prototypes.get(aa_subject), predicate, projection_prototypes.get(aa_object))
+                                            for aa_subject, predicate, aa_object in argument_assertions}
+                               for mention_id, argument_assertions in self.get('projection_argument_assertions_by_mention').items()}
+        annotation_clusters = {mention_id: {(annotation_prototypes.get(aa_subject), predicate, annotation_prototypes.get(aa_object))
+                                            for aa_subject, predicate, aa_object in argument_assertions}
+                               for mention_id, argument_assertions in self.get('annotation_argument_assertions_by_mention_index', annotation).items()}
+        count = self.report_missing_claim_argument_assertions(annotation, projection_clusters, annotation_clusters)
         self.record_event('MISSING_PROTOTYPE_ARGUMENT_ASSERTION_COUNT', count if count else 'No')
 
     def compare_mention_argument_assertions(self, annotation):
-        clusters = {'projection': {}, 'annotation': {}}
-        store = self.get('projection').get('mention_argument_assertions_justifications.rq.tsv')
-        for kb in store:
-            for entry in store.get(kb):
-                aa_subject_mention_id = entry.get('?subject_mention_id')
-                predicate = entry.get('?predicate')
-                aa_object_mention_id = entry.get('?object_mention_id')
-                argument_assertion = '{subject}::{predicate}::{object}'.format(
-                    subject = aa_subject_mention_id,
-                    predicate = predicate,
-                    object = aa_object_mention_id
-                    )
-                clusters.get('projection').setdefault(aa_subject_mention_id, set()).add(argument_assertion)
-
-        for store_name in ['event_slots', 'relation_slots']:
-            for entry in annotation.get('worksheets').get(store_name):
-                aa_subject_mention_id = entry.get('eventmention_id') or entry.get('relationmention_id')
-                predicate = entry.get('general_slot_type')
-                aa_object_mention_id = entry.get('argmention_id')
-                argument_assertion = '{subject}::{predicate}::{object}'.format(
-                    subject = aa_subject_mention_id,
-                    predicate = predicate,
-                    object = aa_object_mention_id,
-                    )
-                clusters.get('annotation').setdefault(aa_subject_mention_id, set()).add(argument_assertion)
+        projection_clusters = self.get('projection_argument_assertions_by_mention')
+        annotation_clusters = self.get('annotation_argument_assertions_by_mention_index', annotation)
+        count = self.report_missing_claim_argument_assertions(annotation, projection_clusters, annotation_clusters)
+        self.record_event('MISSING_PROTOTYPE_ARGUMENT_ASSERTION_COUNT', count if count else 'No')
 
+    def report_missing_claim_argument_assertions(self, annotation, projection_clusters, annotation_clusters):
+        """
+        Report the argument assertions of the mentions associated with each claim that are
+        found on one side only, and return their number.
+        """
         count = 0
-        for entry in annotation.get('worksheets').get('claims'):
-            claim_id = entry.get('claim_id')
-            associated_mentions = set()
-            for mention_id in entry.get('associated_kes').split(','):
-                associated_mentions.add(mention_id.strip())
-            argument_assertions = {'projection': set(), 'annotation': set()}
-            for mention_id in associated_mentions:
-                for key in argument_assertions:
-                    if clusters.get(key).get(mention_id):
-                        argument_assertions.get(key).update(clusters.get(key).get(mention_id))
-
-            union = argument_assertions.get('projection').union(argument_assertions.get('annotation'))
-            intersection = argument_assertions.get('projection').intersection(argument_assertions.get('annotation'))
-            missings = union - intersection
-            for missing in missings:
-                count += 1
-                stores = ['projection', 'annotation']
-                for store in stores:
-                    if missing not in clusters.get(store):
-                        error_code = 'MISSING_CLAIM_ARGUMENT_ASSERTION_WARNING' if '::EMPTY_TBD::' in missing else 'MISSING_CLAIM_ARGUMENT_ASSERTION_ERROR'
-                        self.record_event(error_code, missing, claim_id, store)
-        self.record_event('MISSING_PROTOTYPE_ARGUMENT_ASSERTION_COUNT', count if count else 'No')
+        if not projection_clusters and not annotation_clusters:
+            return count
+        events = []
+        for claim_id, associated_mentions in self.get('claim_associated_mentions', annotation):
+            projection_argument_assertions = set().union(*(projection_clusters.get(mention_id, ()) for mention_id in associated_mentions))
+            annotation_argument_assertions = set().union(*(annotation_clusters.get(mention_id, ()) for mention_id in associated_mentions))
+            # each assertion is reported as missing from the store it is not in
+            missings = get_missing_items(projection_argument_assertions, annotation_argument_assertions)
+            for missing_argument_assertions, store in missings:
+                count += len(missing_argument_assertions)
+                for missing in missing_argument_assertions:
+                    error_code = 'MISSING_CLAIM_ARGUMENT_ASSERTION_WARNING' if missing[1] == 'EMPTY_TBD' else 'MISSING_CLAIM_ARGUMENT_ASSERTION_ERROR'
+                    events.append((error_code, '::'.join(map(str, missing)), claim_id, store))
+        self.record_events(events)
+        return count
 
 def check_paths(args):
     check_for_paths_existance([
@@ -1068,11 +1163,14 @@ def check_for_paths_non_existance(paths):
             print('Error: Path {} exists'.format(path))
             exit(ERROR_EXIT_CODE)
 
-class Task1(Object):
+class Task(Object):
     """
-    Generate Task1 AIF.
+    Base class of the commands verifying the AIF generated for a task.
     """
-    def __init__(self, log, errors, encodings_filename, parent_children, annotations, projections):
+    # the annotation files loaded by default, mapped to the names under which they are stored
+    include_files = TA1_INCLUDE_FILES
+
+    def __init__(self, log, workers, errors, encodings_filename, parent_children, annotations, projections):
         check_for_paths_existance([
                  errors,
                  encodings_filename,
@@ -1082,6 +1180,7 @@ class Task1(Object):
                  ])
         check_for_paths_non_existance([])
         self.log_filename = log
+        self.workers = workers
         self.log_specifications = errors
         self.encodings_filename = encodings_filename
         self.parent_children = parent_children
@@ -1093,26 +1192,22 @@ class Task1(Object):
 
     def __call__(self):
         logger = self.get('logger')
-        include_files = {
-            'arg_mentions.tab':            'argument_KEs',
-            'evt_mentions.tab':            'event_KEs',
-            'rel_mentions.tab':            'relation_KEs',
-            'evt_slots.tab':               'event_slots',
-            'rel_slots.tab':               'relation_slots',
-            'kb_linking.tab':              'kb_links',
-            }
         encodings = Encodings(logger, self.get('encodings_filename'))
         document_mappings = DocumentMappings(logger, self.get('parent_children'), encodings)
-        annotations =  TA1Annotations(logger, self.get('annotations'), include_items=include_files)
-        projections = TA1AIFProjections(logger, self.get('projections'), document_mappings)
-        projections.verify(annotations)
+        annotations = self.load_annotations(self.get('annotations'))
+        projections = self.get('projections_class')(logger, self.get('projections'), document_mappings)
+        projections.verify(annotations, num_workers=self.get('workers'))
         print('--done.')
         exit(ALLOK_EXIT_CODE)
 
+    def load_annotations(self, path):
+        return TA1Annotations(self.get('logger'), path, include_items=self.get('include_files'))
+
     @classmethod
     def add_arguments(myclass, parser):
         parser.add_argument('-l', '--log', default='log.txt', help='Specify a file to which log output should be redirected (default: %(default)s)')
         parser.add_argument('-v', '--version', action='version', version='%(prog)s ' + __version__, help='Print version number and exit')
+        parser.add_argument('-w', '--workers', type=int, default=1, help='Specify the number of processes used to run the comparisons (default: %(default)s)')
         parser.add_argument('errors', type=str, help='File containing error specifications')
         parser.add_argument('encodings_filename', type=str, help='File containing list of encoding to modality mappings')
         parser.add_argument('parent_children', type=str, help='parent_children.tab file as received from LDC')
@@ -1121,129 +1216,38 @@ class Task1(Object):
         parser.set_defaults(myclass=myclass)
         return parser
 
-class Task2(Object):
+class Task1(Task):
     """
-    Generate Task2 AIF.
+    Generate Task1 AIF.
     """
-    def __init__(self, log, errors, encodings_filename, parent_children, annotations, projections):
-        check_for_paths_existance([
-                 errors,
-                 encodings_filename,
-                 parent_children,
-                 annotations,
-                 projections,
-                 ])
-        check_for_paths_non_existance([])
-        self.log_filename = log
-        self.log_specifications = errors
-        self.encodings_filename = encodings_filename
-        self.parent_children = parent_children
-        self.annotations = annotations
-        self.projections = projections
-        self.logger = Logger(self.get('log_filename'),
-                        self.get('log_specifications'),
-                        sys.argv)
-
-    def __call__(self):
-        logger = self.get('logger')
-        include_files = {
-            'arg_mentions.tab':            'argument_KEs',
-            'evt_mentions.tab':            'event_KEs',
-            'rel_mentions.tab':            'relation_KEs',
-            'evt_slots.tab':               'event_slots',
-            'rel_slots.tab':               'relation_slots',
-            'kb_linking.tab':              'kb_links',
-            }
-        encodings = Encodings(logger, self.get('encodings_filename'))
-        document_mappings = DocumentMappings(logger, self.get('parent_children'), encodings)
-        annotations =  TA1Annotations(logger, self.get('annotations'), include_items=include_files)
-        projections = TA2AIFProjections(logger, self.get('projections'), document_mappings)
-        projections.verify(annotations)
-        print('--done.')
-        exit(ALLOK_EXIT_CODE)
+    projections_class = TA1AIFProjections
 
-    @classmethod
-    def add_arguments(myclass, parser):
-        parser.add_argument('-l', '--log', default='log.txt', help='Specify a file to which log output should be redirected (default: %(default)s)')
-        parser.add_argument('-v', '--version', action='version', version='%(prog)s ' + __version__, help='Print version number and exit')
-        parser.add_argument('errors', type=str, help='File containing error specifications')
-        parser.add_argument('encodings_filename', type=str, help='File containing list of encoding to modality mappings')
-        parser.add_argument('parent_children', type=str, help='parent_children.tab file as received from LDC')
-        parser.add_argument('annotations', type=str, help='Task3 annotations as received from LDC')
-        parser.add_argument('projections', type=str, help='Projections from AIF generated from annotations as received from LDC')
-        parser.set_defaults(myclass=myclass)
-        return parser
+class Task2(Task):
+    """
+    Generate Task2 AIF.
+    """
+    projections_class = TA2AIFProjections
 
-class Task3(Object):
+class Task3(Task):
     """
     Generate Task3 AIF.
     """
-    def __init__(self, log, errors, encodings_filename, parent_children, annotations, projections):
-        check_for_paths_existance([
-                 errors,
-                 encodings_filename,
-                 parent_children,
-                 annotations,
-                 projections,
-                 ])
-        check_for_paths_non_existance([])
-        self.log_filename = log
-        self.log_specifications = errors
-        self.encodings_filename = encodings_filename
-        self.parent_children = parent_children
-        self.annotations = annotations
-        self.projections = projections
-        self.logger = Logger(self.get('log_filename'),
-                        self.get('log_specifications'),
-                        sys.argv)
-
-    def __call__(self):
-        logger = self.get('logger')
-        encodings = Encodings(logger, self.get('encodings_filename'))
-        document_mappings = DocumentMappings(logger, self.get('parent_children'), encodings)
-        annotations = self.load_annotations(self.get('annotations'))
-        projections = TA3AIFProjections(logger, self.get('projections'), document_mappings)
-        projections.verify(annotations)
-        print('--done.')
-        exit(ALLOK_EXIT_CODE)
-
-    @classmethod
-    def add_arguments(myclass, parser):
-        parser.add_argument('-l', '--log', default='log.txt', help='Specify a file to which log output should be redirected (default: %(default)s)')
-        parser.add_argument('-v', '--version', action='version', version='%(prog)s ' + __version__, help='Print version number and exit')
-        parser.add_argument('errors', type=str, help='File containing error specifications')
-        parser.add_argument('encodings_filename', type=str, help='File containing list of encoding to modality mappings')
-        parser.add_argument('parent_children', type=str, help='parent_children.tab file as received from LDC')
-        parser.add_argument('annotations', type=str, help='Task3 annotations as received from LDC')
-        parser.add_argument('projections', type=str, help='Projections from AIF generated from annotations as received from LDC')
-        parser.set_defaults(myclass=myclass)
-        return parser
+    projections_class = TA3AIFProjections
+    # the annotation files loaded when the annotations are a directory
+    include_files = TA3_INCLUDE_FILES
+    # the worksheets loaded when the annotations are an Excel workbook
+    include_worksheets = TA3_INCLUDE_WORKSHEETS
 
     def load_annotations(self, path):
-        if os.path.isfile(path) and path.endswith('xlsx'):
-            include_worksheets = {
-                'TA3_arg_KEs':                 'argument_KEs',
-                'TA3_evt_KEs':                 'event_KEs',
-                'TA3_rel_KEs':                 'relation_KEs',
-                'TA3_evt_slots':               'event_slots',
-                'TA3_rel_slots':               'relation_slots',
-                'TA3_kb_linking':              'kb_links',
-                'ClaimFrameTemplate Examples': 'claims',
-                'TA3_cross_claim_relations.tab E': 'cross_claim_relations'
-                }
-            return TA3Annotations(self.get('logger'), self.get('annotations'), include_items=include_worksheets)
-        elif os.path.isdir(path):
-            include_files = {
-                'claim_frames.tab':            'claims',
-                'arg_kes.tab':                 'argument_KEs',
-                'evt_kes.tab':                 'event_KEs',
-                'rel_kes.tab':                 'relation_KEs',
-                'evt_slots.tab':               'event_slots',
-                'rel_slots.tab':               'relation_slots',
-                'kb_linking.tab':              'kb_links',
-                'cross_claim_relations.tab':   'cross_claim_relations'
-                }
-            return TA1Annotations(self.get('logger'), self.get('annotations'), include_items=include_files)
+        # the path is stat'ed once, and its mode tells a workbook from a directory
+        try:
+            mode = os.stat(path).st_mode
+        except OSError:
+            mode = 0
+        if stat.S_ISREG(mode) and path.endswith('xlsx'):
+            return TA3Annotations(self.get('logger'), path, include_items=self.get('include_worksheets'))
+        elif stat.S_ISDIR(mode):
+            return super().load_annotations(path)
         else:
             self.record_event('UNEXPECTED_PATH', path)
 
@@ -1253,16 +1257,19 @@ myclasses = [
     Task3
     ]
 
+# the command name, help text and description of the subparser of each class, derived once at import
+subparser_specs = [(myclass,
+                    re.sub('([A-Z])', r'-\1', myclass.__name__).lstrip('-').lower(),
+                    myclass.__doc__.split('\n')[0],
+                    textwrap.dedent(myclass.__doc__.rstrip()))
+                   for myclass in myclasses]
+
 def main(args=sys.argv[1:]):
     parser = argparse.ArgumentParser(prog='verify_aif',
                                 description='Verify AIF generated from LDC annotations')
     subparser = parser.add_subparsers()
     subparsers = {}
-    for myclass in myclasses:
-        hyphened_name = re.sub('([A-Z])', r'-\1', myclass.__name__).lstrip('-').lower()
-        help_text = myclass.__doc__.split('\n')[0]
-        desc = textwrap.dedent(myclass.__doc__.rstrip())
-
+    for myclass, hyphened_name, help_text, desc in subparser_specs:
         class_subparser = subparser.add_parser(hyphened_name,
                             help=help_text,
                             description=desc,
@@ -14,7 +14,9 @@ from multiprocessing import Pool
 import argparse
 import json
 import os
+import socket
 import sys
+import time
 
 ALLOK_EXIT_CODE = 0
 ERROR_EXIT_CODE = 255
@@ -24,6 +26,22 @@ def call_system(cmd):
     print("running system command: '{}'".format(cmd))
     os.system(cmd)
 
+def wait_for_graphdb(host='localhost', port=7200, timeout=10):
+    """
+    Wait until GraphDB accepts connections on its port, or until timeout seconds have
+    passed, polling with a growing delay. Returns True if GraphDB was reached.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=delay):
+                return True
+        except OSError:
+            time.sleep(delay)
+            delay = min(2 * delay, 1)
+    return False
+
 def get_problems(logs_directory):
     num_errors = 0
     stats = {}
@@ -379,9 +397,8 @@ def generate_results_file_and_exit(logger, logs_directory):
     exit(exit_code)
 
 def record_and_display_message(logger, message):
-    print("-------------------------------------------------------")
-    print(message)
-    print("-------------------------------------------------------")
+    # the message and the lines around it are printed in one write
+    print("-------------------------------------------------------\n{}\n-------------------------------------------------------".format(message))
     logger.record_event('DEFAULT_INFO', message)
 
 def main(args):
@@ -409,8 +426,10 @@ def main(args):
             print('ERROR: Path {} does not exist'.format(path))
             exit(ERROR_EXIT_CODE)
     print("Checking if output directory is empty.")
-    files = [f for f in os.listdir(args.output)]
-    if len(files) > 0:
+    # the listing stops at the first entry
+    with os.scandir(args.output) as entries:
+        output_is_empty = next(entries, None) is None
+    if not output_is_empty:
         print('ERROR: Output directory {} is not empty'.format(args.output))
         exit(ERROR_EXIT_CODE)
 
@@ -420,7 +439,7 @@ def main(args):
 
     logs_directory = '{output}/{logs}'.format(output=args.output, logs=args.logs)
     run_log_file = '{logs_directory}/run.log'.format(logs_directory=logs_directory)
-    call_system('mkdir {logs_directory}'.format(logs_directory=logs_directory))
+    os.makedirs(logs_directory, exist_ok=True)
     logger = Logger(run_log_file, args.spec, sys.argv)
 
     #############################################################################################
@@ -465,10 +484,12 @@ def main(args):
     gold_valid_responses = '/data/gold/SPARQL-VALID-output'
 
     #############################################################################################
-    # pull latest copy of code from git
+    # pull latest copy of code from git; the code in the image is used as is by
+    # all but the develop runs
     #############################################################################################
 
-    call_system('cd {python_scripts} && git pull'.format(python_scripts=python_scripts))
+    if args.runtype == 'develop':
+        call_system('cd {python_scripts} && git pull'.format(python_scripts=python_scripts))
 
     #############################################################################################
     # inspect the input directory
@@ -549,7 +570,7 @@ def main(args):
     if performer == 'OPEN':
         destination = sparql_clean_output
         record_and_display_message(logger, 'Copying input corresponding to core documents for scoring.')
-    call_system('mkdir {destination}'.format(destination=destination))
+    os.makedirs(destination, exist_ok=True)
     for document_id in documents_in_submission:
         if documents_in_submission[document_id] and document_id in coredocs:
             logger.record_event('DEFAULT_INFO', 'Copying {}.ttl'.format(document_id))
@@ -574,7 +595,7 @@ def main(args):
 
         # copy queries to be applied
         record_and_display_message(logger, 'Copying SPARQL queries to be applied.')
-        call_system('mkdir {queries}'.format(queries=queries))
+        os.makedirs(queries, exist_ok=True)
         call_system('cp /data/queries/AIDA_P3_TA1_*.rq {queries}'.format(task=args.task, queries=queries))
 
         num_total = len([d for d in documents_in_submission if documents_in_submission[d] == 1])
@@ -588,7 +609,7 @@ def main(args):
                                                                                                           document_id=document_id))
             # create the intermediate directory
             logger.record_event('DEFAULT_INFO', 'Creating {}.'.format(intermediate))
-            call_system('mkdir -p {}'.format(intermediate))
+            os.makedirs(intermediate, exist_ok=True)
             # load KB into GraphDB
             logger.record_event('DEFAULT_INFO', 'Loading {}.ttl into GraphDB.'.format(document_id))
             input_kb = '{sparql_kb_input}/{document_id}.ttl'.format(sparql_kb_input=sparql_kb_input, document_id=document_id)
@@ -597,16 +618,16 @@ def main(args):
             logger.record_event('DEFAULT_INFO', 'Starting GraphDB')
             call_system('{graphdb} -d'.format(graphdb=graphdb))
             # wait for GraphDB
-            call_system('sleep 5')
+            wait_for_graphdb()
             # apply queries
             logger.record_event('DEFAULT_INFO', 'Applying queries')
-            call_system('java -Xmx4096M -jar {jar} -c {properties} -q {queries} -o {intermediate}/'.format(jar=jar,
+            call_system('java -Xms1024M -Xmx4096M -XX:+UseG1GC -XX:+AlwaysPreTouch -XX:+UseStringDeduplication -jar {jar} -p -c {properties} -q {queries} -o {intermediate}/'.format(jar=jar,
                                                                                           properties=properties,
                                                                                           queries=queries,
                                                                                           intermediate=intermediate))
             # generate the SPARQL output directory corresponding to the KB
             logger.record_event('DEFAULT_INFO', 'Creating SPARQL output directory corresponding to the KB')
-            call_system('mkdir {sparql_output}/{document_id}.ttl'.format(sparql_output=sparql_output, document_id=document_id))
+            os.makedirs('{sparql_output}/{document_id}.ttl'.format(sparql_output=sparql_output, document_id=document_id), exist_ok=True)
             # move output out of intermediate into the output corresponding to the KB
             logger.record_event('DEFAULT_INFO', 'Moving output out of the intermediate directory')
             call_system('mv {intermediate}/*/* {output}/{document_id}.ttl'.format(intermediate=intermediate,
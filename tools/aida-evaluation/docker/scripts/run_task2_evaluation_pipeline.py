@@ -17,21 +17,108 @@ __date__    = "24 Jan 2022"
 
 from logger import Logger
 import argparse
+import glob
 import os
+import shlex
+import shutil
+import socket
+import subprocess
 import sys
+import tarfile
+import time
+import zipfile
 
 ALLOK_EXIT_CODE = 0
 ERROR_EXIT_CODE = 255
 
-def call_system(cmd):
-    cmd = ' '.join(cmd.split())
-    print("running system command: '{}'".format(cmd))
-    os.system(cmd)
+def call_system(cmd, cwd=None):
+    """
+    Run the command, given as a list of arguments, without a shell and in the directory cwd
+    if one is given. As before, a failing command does not stop the pipeline.
+    """
+    print("running system command: '{}'".format(shlex.join(cmd)))
+    try:
+        subprocess.run(cmd, cwd=cwd)
+    except OSError as e:
+        print("failed to run system command: {}".format(e))
+
+def is_safe_member(member):
+    """
+    Returns True if the tar member is a regular file or directory whose name does not
+    lead outside of the directory it is extracted into.
+    """
+    name = member.name
+    return (member.isfile() or member.isdir()) and not os.path.isabs(name) and '..' not in name.split('/')
+
+def extract_archive(archive, destination, keep):
+    """
+    Extract into destination the members of the zip or tgz archive whose names
+    satisfy keep, skipping the rest without writing them to disk.
+
+    zipfile sanitizes the names of members, but tarfile does not (before the 'data'
+    extraction filter), so unsafe tar members are skipped as tar itself would.
+    """
+    if archive.endswith('.zip'):
+        with zipfile.ZipFile(archive) as zip_file:
+            zip_file.extractall(destination, [name for name in zip_file.namelist() if keep(name)])
+    elif archive.endswith('.tgz'):
+        extract_options = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+        with tarfile.open(archive, 'r:gz') as tar_file:
+            for member in tar_file:
+                if not keep(member.name):
+                    continue
+                if not is_safe_member(member):
+                    print("skipping unsafe archive member: '{}'".format(member.name))
+                    continue
+                tar_file.extract(member, destination, **extract_options)
+
+def wait_for_graphdb(host='localhost', port=7200, timeout=10):
+    """
+    Wait until GraphDB accepts connections on its port, or until timeout seconds have
+    passed, polling with a growing delay. Returns True if GraphDB was reached.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=delay):
+                return True
+        except OSError:
+            time.sleep(delay)
+            delay = min(2 * delay, 1)
+    return False
+
+def get_files(root, keep, limit=None):
+    """
+    Generate the DirEntry of each file under root for which keep returns True,
+    stopping after limit files if a limit is given.
+
+    Unlike os.walk, the file type is taken from the directory listing, so no
+    entry is stat'ed.
+    """
+    num_files = 0
+    directories = [root]
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                elif keep(entry):
+                    yield entry
+                    num_files += 1
+                    if num_files == limit:
+                        return
+
+def is_nist_kb(entry):
+    """
+    Returns True if entry is a KB inside the NIST directory of an extracted S3 archive.
+    """
+    dirpath = os.path.dirname(entry.path)
+    return entry.name.endswith('.ttl') and len(dirpath.split('/')) == 6 and os.path.basename(dirpath) == 'NIST'
 
 def record_and_display_message(logger, message):
-    print("-------------------------------------------------------")
-    print(message)
-    print("-------------------------------------------------------")
+    # the message and the lines around it are printed in one write
+    print("-------------------------------------------------------\n{}\n-------------------------------------------------------".format(message))
     logger.record_event('DEFAULT_INFO', message)
 
 def main(args):
@@ -46,8 +133,10 @@ def main(args):
             print('ERROR: Path {} does not exist'.format(path))
             exit(ERROR_EXIT_CODE)
     print("Checking if output directory is empty.")
-    files = [f for f in os.listdir(args.output)]
-    if len(files) > 0:
+    # the listing stops at the first entry
+    with os.scandir(args.output) as entries:
+        output_is_empty = next(entries, None) is None
+    if not output_is_empty:
         print('ERROR: Output directory {} is not empty'.format(args.output))
         exit(ERROR_EXIT_CODE)
 
@@ -57,7 +146,7 @@ def main(args):
 
     logs_directory = '{output}/{logs}'.format(output=args.output, logs=args.logs)
     run_log_file = '{logs_directory}/run.log'.format(logs_directory=logs_directory)
-    call_system('mkdir {logs_directory}'.format(logs_directory=logs_directory))
+    os.makedirs(logs_directory, exist_ok=True)
     logger = Logger(run_log_file, args.spec, sys.argv)
 
     #############################################################################################
@@ -95,10 +184,12 @@ def main(args):
     sparql_valid_output     = '{output}/SPARQL-VALID-output'.format(output=args.output)
 
     #############################################################################################
-    # pull latest copy of code from git
+    # pull latest copy of code from git; the code in the image is used as is by
+    # all but the develop runs
     #############################################################################################
 
-    call_system('cd {python_scripts} && git pull'.format(python_scripts=python_scripts))
+    if args.runtype == 'develop':
+        call_system(['git', 'pull'], cwd=python_scripts)
 
     #############################################################################################
     # inspect the input directory
@@ -106,7 +197,7 @@ def main(args):
 
     s3_tarball_extensions = ['.zip', '.tgz']
     record_and_display_message(logger, 'Inspecting the input directory.')
-    call_system('mkdir {destination}'.format(destination=sparql_kb_source))
+    os.makedirs(sparql_kb_source, exist_ok=True)
     items = [f for f in os.listdir(args.input)]
     if len(items) != 1:
         logger.record_event('UNEXPECTED_NUM_FILES_IN_INPUT', 1, len(items))
@@ -117,17 +208,22 @@ def main(args):
         if filename not in expected_filenames:
             logger.record_event('UNEXPECTED_FILENAME', ','.join(expected_filenames), filename)
             exit(ERROR_EXIT_CODE)
-        call_system('mkdir {destination}'.format(destination=sparql_kb_input))
+        os.makedirs(sparql_kb_input, exist_ok=True)
         if filename == 's3_location.txt':
             if args.aws_access_key_id is None or args.aws_secret_access_key is None:
                 logger.record_event('MISSING_AWS_CREDENTIALS')
                 exit(ERROR_EXIT_CODE)
-            call_system('mkdir /root/.aws')
-            with open('/root/.aws/credentials', 'w') as credentials:
-                credentials.write('[default]\n')
-                credentials.write('aws_access_key_id = {}\n'.format(args.aws_access_key_id))
-                credentials.write('aws_secret_access_key = {}\n'.format(args.aws_secret_access_key))
-            call_system('cp {path}/{filename} {destination}/source.txt'.format(path=args.input, filename=filename, destination=sparql_kb_source))
+            os.makedirs('/root/.aws', mode=0o700, exist_ok=True)
+            # the credentials are readable by the owner only, and written in one go
+            credentials = '[default]\naws_access_key_id = {}\naws_secret_access_key = {}\n'.format(args.aws_access_key_id,
+                                                                                                    args.aws_secret_access_key)
+            fd = os.open('/root/.aws/credentials', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.fchmod(fd, 0o600)
+                os.write(fd, credentials.encode())
+            finally:
+                os.close(fd)
+            shutil.copy('{path}/{filename}'.format(path=args.input, filename=filename), '{destination}/source.txt'.format(destination=sparql_kb_source))
             with open('{path}/{filename}'.format(path=args.input, filename=filename)) as fh:
                 lines = fh.readlines()
                 if len(lines) != 1:
@@ -145,49 +241,40 @@ def main(args):
                     logger.record_event('UNEXPECTED_S3_LOCATION', 's3://aida-*/*.[tgz|zip]', s3_location)
                     exit(ERROR_EXIT_CODE)
                 s3_filename = s3_location.split('/')[-1]
-                call_system('mkdir /tmp/s3_run/')
+                os.makedirs('/tmp/s3_run/', exist_ok=True)
                 record_and_display_message(logger, 'Downloading {s3_location}.'.format(s3_location=s3_location))
-                call_system('aws s3 cp {s3_location} /tmp/s3_run/'.format(s3_location=s3_location))
-                uncompress_command = None
-                if s3_filename.endswith('.zip'):
-                    uncompress_command = 'unzip'
-                if s3_filename.endswith('.tgz'):
-                    uncompress_command = 'tar -zxf'
-                call_system('cd /tmp/s3_run && {uncompress_command} {s3_filename}'.format(s3_filename=s3_filename,
-                                                                                          uncompress_command=uncompress_command))
-
-                valid_kbs = {}
-                for dirpath, dirnames, filenames in os.walk('/tmp/s3_run/'):
-                    for kb_filename in [f for f in filenames if f.endswith('.ttl')]:
-                        if len(dirpath.split('/')) == 6 and os.path.basename(dirpath) == 'NIST':
-                            kb_filename_including_path = os.path.join(dirpath, kb_filename)
-                            # consider all kbs valid
-                            valid_kbs[kb_filename_including_path] = 1
-                            # include only valid KBs
-#                             validation_report_file_with_path = kb_filename_including_path.replace('.ttl', '-report.txt')
-#                             if not os.path.exists(validation_report_file_with_path):
-#                                 valid_kbs[kb_filename_including_path] = 1
-
-                if len(valid_kbs) == 0:
+                call_system(['aws', 's3', 'cp', s3_location, '/tmp/s3_run/'])
+                # only the KBs inside a NIST directory are considered, so nothing else is extracted
+                try:
+                    extract_archive('/tmp/s3_run/{}'.format(s3_filename), '/tmp/s3_run',
+                                    lambda name: name.endswith('.ttl') and '/NIST/' in name)
+                except (OSError, EOFError, tarfile.TarError, zipfile.BadZipFile) as e:
+                    record_and_display_message(logger, 'Failed to extract {}: {}'.format(s3_filename, e))
+                    exit(ERROR_EXIT_CODE)
+
+                # consider all kbs valid; a second KB is enough to reject the archive, so the walk stops there
+                kb_entries = list(get_files('/tmp/s3_run/', is_nist_kb, limit=2))
+
+                if len(kb_entries) == 0:
                     record_and_display_message(logger, 'Nothing to score.')
                     exit(ERROR_EXIT_CODE)
 
-                if len(valid_kbs) > 1:
+                if len(kb_entries) > 1:
                     record_and_display_message(logger, 'More than one task2 KBs found (not sure what to do).')
                     exit(ERROR_EXIT_CODE)
 
-                valid_kb_filename_including_path = list(valid_kbs.keys())[0]
-                record_and_display_message(logger, 'Using KB: \'{}\''.format(kb_filename_including_path.replace('/tmp/s3_run/', '')))
-                call_system('cp {valid_kb_filename_including_path} {destination}/task2_kb.ttl'.format(valid_kb_filename_including_path=valid_kb_filename_including_path,
-                                                                                                      destination=sparql_kb_input))
+                valid_kb_filename_including_path = kb_entries[0].path
+
+                record_and_display_message(logger, 'Using KB: \'{}\''.format(valid_kb_filename_including_path.replace('/tmp/s3_run/', '')))
+                shutil.copy(valid_kb_filename_including_path, '{destination}/task2_kb.ttl'.format(destination=sparql_kb_input))
 
-                call_system('rm -rf /tmp/s3_run')
+                shutil.rmtree('/tmp/s3_run', ignore_errors=True)
                 # get the file from s3
                 # place it in the SPARQL-KB-input directory
         else:
             with open('{destination}/source.txt'.format(destination=sparql_kb_source), 'w') as fh:
                 fh.write('Direct mount.')
-            call_system('cp {input}/task2_kb.ttl {destination}'.format(input=args.input, destination=sparql_kb_input))
+            shutil.copy('{input}/task2_kb.ttl'.format(input=args.input), sparql_kb_input)
             # place the task2_kb.ttl in the SPARQL-KB-input directory
 
     #############################################################################################
@@ -207,40 +294,44 @@ def main(args):
 
     # copy queries to be applied
     record_and_display_message(logger, 'Copying SPARQL queries to be applied.')
-    call_system('mkdir {queries}'.format(queries=queries))
-    call_system('cp /data/queries/AIDA_P3_TA2_*.rq {queries}'.format(task=args.task, queries=queries))
+    os.makedirs(queries, exist_ok=True)
+    for query in glob.glob('/data/queries/AIDA_P3_TA2_*.rq'):
+        shutil.copy(query, queries)
 
     record_and_display_message(logger, 'Applying queries to task2_kb.ttl ... ')
     # create the intermediate directory
     logger.record_event('DEFAULT_INFO', 'Creating {}.'.format(intermediate))
-    call_system('mkdir -p {}'.format(intermediate))
+    os.makedirs(intermediate, exist_ok=True)
     # load KB into GraphDB
     logger.record_event('DEFAULT_INFO', 'Loading task2_kb.ttl into GraphDB.')
     input_kb = '{sparql_kb_input}/task2_kb.ttl'.format(sparql_kb_input=sparql_kb_input)
-    call_system('{loadrdf} -c {config} -f -m parallel {input}'.format(loadrdf=loadrdf, config=config, input=input_kb))
+    call_system([loadrdf, '-c', config, '-f', '-m', 'parallel', input_kb])
     # start GraphDB
     logger.record_event('DEFAULT_INFO', 'Starting GraphDB')
-    call_system('{graphdb} -d'.format(graphdb=graphdb))
+    call_system([graphdb, '-d'])
     # wait for GraphDB
-    call_system('sleep 5')
+    wait_for_graphdb()
     # apply queries
     logger.record_event('DEFAULT_INFO', 'Applying queries')
-    call_system('java -Xmx4096M -jar {jar} -c {properties} -q {queries} -o {intermediate}/'.format(jar=jar,
-                                                                                  properties=properties,
-                                                                                  queries=queries,
-                                                                                  intermediate=intermediate))
+    call_system(['java', '-Xms1024M', '-Xmx4096M', '-XX:+UseG1GC', '-XX:+AlwaysPreTouch', '-XX:+UseStringDeduplication',
+                 '-jar', jar,
+                 '-p',
+                 '-c', properties,
+                 '-q', queries,
+                 '-o', '{}/'.format(intermediate)])
     # generate the SPARQL output directory corresponding to the KB
     logger.record_event('DEFAULT_INFO', 'Creating SPARQL output directory corresponding to the KB')
     # move output out of intermediate into the output corresponding to the KB
     logger.record_event('DEFAULT_INFO', 'Moving output out of the intermediate directory')
-    call_system('mv {intermediate}/*/* {output}'.format(intermediate=intermediate,
-                                                        output=sparql_output))
+    for intermediate_subdir in glob.glob('{}/*/'.format(intermediate)):
+        for sparql_output_file in glob.glob('{}*'.format(intermediate_subdir)):
+            os.replace(sparql_output_file, os.path.join(sparql_output, os.path.basename(sparql_output_file)))
     # remove intermediate directory
     logger.record_event('DEFAULT_INFO', 'Removing the intermediate directory.')
-    call_system('rm -rf {}'.format(intermediate))
+    shutil.rmtree(intermediate, ignore_errors=True)
     # stop GraphDB
     logger.record_event('DEFAULT_INFO', 'Stopping GraphDB.')
-    call_system('pkill -9 -f graphdb')
+    call_system(['pkill', '-9', '-f', 'graphdb'])
 
     #############################################################################################
     # Clean SPARQL output
@@ -248,15 +339,11 @@ def main(args):
 
     record_and_display_message(logger, 'Cleaning SPARQL output.')
 
-    cmd = 'cd {python_scripts} && \
-            python3.9 clean_sparql_output.py \
-            {log_specifications} \
-            {sparql_output} \
-            {sparql_clean_output}'.format(python_scripts=python_scripts,
-                                          log_specifications=log_specifications,
-                                          sparql_output = sparql_output,
-                                          sparql_clean_output = sparql_clean_output)
-    call_system(cmd)
+    cmd = ['python3.9', 'clean_sparql_output.py',
+           log_specifications,
+           sparql_output,
+           sparql_clean_output]
+    call_system(cmd, cwd=python_scripts)
 
     #############################################################################################
     # Validate SPARQL output
@@ -265,45 +352,28 @@ def main(args):
     record_and_display_message(logger, 'Validating SPARQL output.')
 
     log_file = '{logs_directory}/validate-responses.log'.format(logs_directory=logs_directory)
-    cmd = 'cd {python_scripts} && \
-            python3.9 validate_responses.py \
-            --log {log_file} \
-            --task task2 \
-            {log_specifications} \
-            {encoding_modality} \
-            {coredocs} \
-            {parent_children} \
-            {sentence_boundaries} \
-            {image_boundaries} \
-            {keyframe_boundaries} \
-            {video_boundaries} \
-            {run_id} \
-            {sparql_clean_output} \
-            {sparql_valid_output}'.format(python_scripts=python_scripts,
-                                          log_file=log_file,
-                                          log_specifications=log_specifications,
-                                          encoding_modality=encoding_modality,
-                                          coredocs=coredocs,
-                                          parent_children=parent_children,
-                                          sentence_boundaries=sentence_boundaries,
-                                          image_boundaries=image_boundaries,
-                                          keyframe_boundaries=keyframe_boundaries,
-                                          video_boundaries=video_boundaries,
-                                          run_id=args.run,
-                                          sparql_clean_output=sparql_clean_output,
-                                          sparql_valid_output=sparql_valid_output)
-    call_system(cmd)
-
-    num_errors = 0
-    with open(log_file) as f:
-        for line in f.readlines():
-            if 'ERROR' in line:
-                num_errors += 1
-
-    num_validated_files_written = 0
-    for dirpath, dirnames, filenames in os.walk('{sparql_valid_output}'.format(sparql_valid_output=sparql_valid_output)):
-        for filename in [f for f in filenames if f.endswith('.rq.tsv')]:
-            num_validated_files_written += 1
+    cmd = ['python3.9', 'validate_responses.py',
+           '--log', log_file,
+           '--task', 'task2',
+           log_specifications,
+           encoding_modality,
+           coredocs,
+           parent_children,
+           sentence_boundaries,
+           image_boundaries,
+           keyframe_boundaries,
+           video_boundaries,
+           args.run,
+           sparql_clean_output,
+           sparql_valid_output]
+    call_system(cmd, cwd=python_scripts)
+
+    # count the lines reporting an error; error codes may themselves contain 'ERROR', so
+    # occurrences are not counted. the log is streamed as bytes, without decoding it
+    with open(log_file, 'rb') as f:
+        num_errors = sum(1 for line in f if b'ERROR' in line)
+
+    num_validated_files_written = sum(1 for entry in get_files(sparql_valid_output, lambda entry: entry.name.endswith('.rq.tsv')))
 
     message = 'SPARQL output had no errors.'
     if num_validated_files_written == 0:
@@ -20,7 +20,11 @@ from object import Object
 import argparse
 import os
 import re
+import socket
 import sys
+import tarfile
+import time
+import zipfile
 
 ALLOK_EXIT_CODE = 0
 ERROR_EXIT_CODE = 255
@@ -30,6 +34,73 @@ def call_system(cmd):
     print("running system command: '{}'".format(cmd))
     os.system(cmd)
 
+def get_files(root, keep, limit=None):
+    """
+    Generate the DirEntry of each file under root for which keep returns True,
+    stopping after limit files if a limit is given.
+
+    Unlike os.walk, the file type is taken from the directory listing, so no
+    entry is stat'ed.
+    """
+    num_files = 0
+    directories = [root]
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                elif keep(entry):
+                    yield entry
+                    num_files += 1
+                    if num_files == limit:
+                        return
+
+def is_safe_member(member):
+    """
+    Returns True if the tar member is a regular file or directory whose name does not
+    lead outside of the directory it is extracted into.
+    """
+    name = member.name
+    return (member.isfile() or member.isdir()) and not os.path.isabs(name) and '..' not in name.split('/')
+
+def extract_archive(archive, destination, keep):
+    """
+    Extract into destination the members of the zip or tgz archive whose names
+    satisfy keep, skipping the rest without writing them to disk.
+
+    zipfile sanitizes the names of members, but tarfile does not (before the 'data'
+    extraction filter), so unsafe tar members are skipped as tar itself would.
+    """
+    if archive.endswith('.zip'):
+        with zipfile.ZipFile(archive) as zip_file:
+            zip_file.extractall(destination, [name for name in zip_file.namelist() if keep(name)])
+    elif archive.endswith('.tgz'):
+        extract_options = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+        with tarfile.open(archive, 'r:gz') as tar_file:
+            for member in tar_file:
+                if not keep(member.name):
+                    continue
+                if not is_safe_member(member):
+                    print("skipping unsafe archive member: '{}'".format(member.name))
+                    continue
+                tar_file.extract(member, destination, **extract_options)
+
+def wait_for_graphdb(host='localhost', port=7200, timeout=10):
+    """
+    Wait until GraphDB accepts connections on its port, or until timeout seconds have
+    passed, polling with a growing delay. Returns True if GraphDB was reached.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=delay):
+                return True
+        except OSError:
+            time.sleep(delay)
+            delay = min(2 * delay, 1)
+    return False
+
 def get_problems(logs_directory):
     num_errors = 0
     stats = {}
@@ -45,9 +116,8 @@ def get_problems(logs_directory):
     return num_errors, stats
 
 def record_and_display_message(logger, message):
-    print("-------------------------------------------------------------------------------")
-    print(message)
-    print("-------------------------------------------------------------------------------")
+    # the message and the lines around it are printed in one write
+    print("-------------------------------------------------------------------------------\n{}\n-------------------------------------------------------------------------------".format(message))
     logger.record_event('DEFAULT_INFO', message)
 
 def trim(s):
@@ -152,8 +222,10 @@ def main(args):
             print('ERROR: Path {} does not exist'.format(path))
             exit(ERROR_EXIT_CODE)
     print("Checking if output directory is empty.")
-    files = [f for f in os.listdir(args.output)]
-    if len(files) > 0:
+    # the listing stops at the first entry
+    with os.scandir(args.output) as entries:
+        output_is_empty = next(entries, None) is None
+    if not output_is_empty:
         print('ERROR: Output directory {} is not empty'.format(args.output))
         exit(ERROR_EXIT_CODE)
 
@@ -163,7 +235,7 @@ def main(args):
 
     logs_directory = '{output}/{logs}'.format(output=args.output, logs=args.logs)
     run_log_file = '{logs_directory}/run.log'.format(logs_directory=logs_directory)
-    call_system('mkdir {logs_directory}'.format(logs_directory=logs_directory))
+    os.makedirs(logs_directory, exist_ok=True)
     logger = Logger(run_log_file, args.spec, sys.argv)
 
     #############################################################################################
@@ -210,10 +282,12 @@ def main(args):
     arf_output              = '{output}/ARF-output'.format(output=args.output)
 
     #############################################################################################
-    # pull latest copy of code from git
+    # pull latest copy of code from git; the code in the image is used as is by
+    # all but the develop runs
     #############################################################################################
 
-    call_system('cd {python_scripts} && git pull'.format(python_scripts=python_scripts))
+    if args.runtype == 'develop':
+        call_system('cd {python_scripts} && git pull'.format(python_scripts=python_scripts))
 
     #############################################################################################
     # inspect the input directory
@@ -222,7 +296,7 @@ def main(args):
     record_and_display_message(logger, 'Inspecting the input directory.')
 
     for destination in [sparql_kb_source, sparql_kb_input]:
-        call_system('mkdir {destination}'.format(destination=destination))
+        os.makedirs(destination, exist_ok=True)
     items = [f for f in os.listdir(args.input)]
 
     num_items = len(items)
@@ -237,11 +311,16 @@ def main(args):
         if args.aws_access_key_id is None or args.aws_secret_access_key is None:
             logger.record_event('MISSING_AWS_CREDENTIALS')
             exit(ERROR_EXIT_CODE)
-        call_system('mkdir /root/.aws')
-        with open('/root/.aws/credentials', 'w') as credentials:
-            credentials.write('[default]\n')
-            credentials.write('aws_access_key_id = {}\n'.format(args.aws_access_key_id))
-            credentials.write('aws_secret_access_key = {}\n'.format(args.aws_secret_access_key))
+        os.makedirs('/root/.aws', mode=0o700, exist_ok=True)
+        # the credentials are readable by the owner only, and written in one go
+        credentials = '[default]\naws_access_key_id = {}\naws_secret_access_key = {}\n'.format(args.aws_access_key_id,
+                                                                                                args.aws_secret_access_key)
+        fd = os.open('/root/.aws/credentials', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.fchmod(fd, 0o600)
+            os.write(fd, credentials.encode())
+        finally:
+            os.close(fd)
         call_system('cp {path}/{filename} {destination}/source.txt'.format(path=args.input, filename=filename, destination=sparql_kb_source))
         with open('{path}/{filename}'.format(path=args.input, filename=filename)) as fh:
             lines = fh.readlines()
@@ -253,31 +332,35 @@ def main(args):
                 logger.record_event('UNEXPECTED_S3_LOCATION', 's3://aida-*/*.tgz', s3_location)
                 exit(ERROR_EXIT_CODE)
             s3_filename = s3_location.split('/')[-1]
-            call_system('mkdir /tmp/s3_run/')
+            os.makedirs('/tmp/s3_run/', exist_ok=True)
             record_and_display_message(logger, 'Downloading {s3_location}.'.format(s3_location=s3_location))
             call_system('aws s3 cp {s3_location} /tmp/s3_run/'.format(s3_location=s3_location))
-            uncompress_command = None
-            if s3_filename.endswith('.zip'):
-                uncompress_command = 'unzip'
-            if s3_filename.endswith('.tgz'):
-                uncompress_command = 'tar -zxf'
-            call_system('cd /tmp/s3_run && {uncompress_command} {s3_filename}'.format(s3_filename=s3_filename,
-                                                                                      uncompress_command=uncompress_command))
+            # only the NIST directory is used, so nothing else is extracted
+            try:
+                extract_archive('/tmp/s3_run/{}'.format(s3_filename), '/tmp/s3_run', lambda name: '/NIST/' in name)
+            except (OSError, EOFError, tarfile.TarError, zipfile.BadZipFile) as e:
+                record_and_display_message(logger, 'Failed to extract {}: {}'.format(s3_filename, e))
+                exit(ERROR_EXIT_CODE)
             call_system('mv /tmp/s3_run/output/*/NIST /tmp/s3_run/NIST')
 
     input_path = '/tmp/s3_run/NIST' if s3_location_provided else args.input
+    # os.scandir raises where os.walk yielded nothing, e.g. when the archive has no NIST directory
+    if not os.path.isdir(input_path):
+        record_and_display_message(logger, 'Nothing to score.')
+        exit(ERROR_EXIT_CODE)
     claim_rankings = ClaimRankings(logger, input_path, args.depth)
-    for dirpath, dirnames, filenames in os.walk(input_path):
-        for filename in filenames:
-            filename_including_path = os.path.join(dirpath, filename)
-            if filename.endswith('-report.txt'):
-                filename_including_path = '{}.ttl'.format(filename_including_path.replace('-report.txt', ''))
-                input_filenames_including_path[filename_including_path] = 0
-            elif filename.endswith('.ttl'):
-                if filename_including_path not in input_filenames_including_path:
-                    input_filenames_including_path[filename_including_path] = 1
-            elif filename.endswith('.ranking.tsv'):
-                claim_rankings.load_file(filename_including_path)
+    # a KB is invalid if it has a report, whether the report is listed before or after it
+    for entry in get_files(input_path, lambda entry: entry.name.endswith(('-report.txt', '.ttl', '.ranking.tsv'))):
+        filename = entry.name
+        filename_including_path = entry.path
+        if filename.endswith('-report.txt'):
+            filename_including_path = '{}.ttl'.format(filename_including_path.replace('-report.txt', ''))
+            input_filenames_including_path[filename_including_path] = 0
+        elif filename.endswith('.ttl'):
+            if filename_including_path not in input_filenames_including_path:
+                input_filenames_including_path[filename_including_path] = 1
+        elif filename.endswith('.ranking.tsv'):
+            claim_rankings.load_file(filename_including_path)
     claim_rankings.generate_pool()
     for filename_including_path in input_filenames_including_path:
         if input_filenames_including_path[filename_including_path] == 0:
@@ -328,7 +411,7 @@ def main(args):
     # copy TA3 SPARQL queries
     queries = '{}/queries'.format(args.output)
     record_and_display_message(logger, 'Copying SPARQL queries to be applied.')
-    call_system('mkdir {queries}'.format(queries=queries))
+    os.makedirs(queries, exist_ok=True)
     call_system('cp /data/queries/AIDA_P3_TA3_*.rq {queries}'.format(task=args.task, queries=queries))
 
     c_cnt = 0
@@ -388,7 +471,7 @@ def main(args):
                                                                                                                                                                            k_tot=len(kb_filenames)))
                 # create the intermediate directory
                 logger.record_event('DEFAULT_INFO', 'Creating {}.'.format(intermediate))
-                call_system('mkdir -p {}'.format(intermediate))
+                os.makedirs(intermediate, exist_ok=True)
                 # load KB into GraphDB
                 logger.record_event('DEFAULT_INFO', 'Loading {kb_filename} into GraphDB.'.format(kb_filename=kb_filename))
                 input_kb = '{kb_filename_including_path}'.format(kb_filename_including_path=kb_filename_including_path)
@@ -397,16 +480,16 @@ def main(args):
                 logger.record_event('DEFAULT_INFO', 'Starting GraphDB')
                 call_system('{graphdb} -d'.format(graphdb=graphdb))
                 # wait for GraphDB
-                call_system('sleep 5')
+                wait_for_graphdb()
                 # apply queries
                 logger.record_event('DEFAULT_INFO', 'Applying queries')
-                call_system('java -Xmx4096M -jar {jar} -c {properties} -q {queries} -o {intermediate}/'.format(jar=jar,
+                call_system('java -Xms1024M -Xmx4096M -XX:+UseG1GC -XX:+AlwaysPreTouch -XX:+UseStringDeduplication -jar {jar} -p -c {properties} -q {queries} -o {intermediate}/'.format(jar=jar,
                                                                                           properties=properties,
                                                                                           queries=queries,
                                                                                           intermediate=intermediate))
                 # generate the SPARQL output directory corresponding to the KB
                 logger.record_event('DEFAULT_INFO', 'Creating SPARQL output directory corresponding to the KB')
-                call_system('mkdir {output}/{kb_filename}'.format(output=sparql_output_subdir, kb_filename=kb_filename))
+                os.makedirs('{output}/{kb_filename}'.format(output=sparql_output_subdir, kb_filename=kb_filename), exist_ok=True)
                 # move output out of intermediate into the output corresponding to the KB
                 logger.record_event('DEFAULT_INFO', 'Moving output out of the intermediate directory')
                 call_system('mv {intermediate}/*/* {output}/{kb_filename}'.format(intermediate=intermediate,